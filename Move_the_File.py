@@ -1,262 +1,422 @@
-from PyQt5.QtWidgets import QDesktopWidget, QApplication, QWidget, QVBoxLayout, QPushButton, QFileDialog, QTextEdit, QLabel, QComboBox, QSizePolicy, QLineEdit, QMessageBox, QPlainTextEdit
-from collections import deque
-from PyQt5.QtGui import QIcon, QFont
-import sys
-import os
-import shutil
-import pickle
-import subprocess
-
-class MovetheFile(QWidget):
-
-    def resource_path(self, relative_path):
-        try:
-            base_path = sys._MEIPASS
-        except Exception:
-            base_path = os.path.abspath(".")
-        return os.path.join(base_path, relative_path)
-    
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-
-    def initUI(self):
-
-        font = QFont()
-        font.setPointSize(12)
-        QApplication.setFont(font)
-        # 소스 및 타겟 폴더를 위한 변수 초기화
-        self.source_folder = ''
-        self.target_folder = ''
-
-        # 최근 사용된 폴더 목록
-        self.recent_folders = self.load_recent_folders()
-
-        # 아이콘 세팅
-        self.setWindowIcon(QIcon(self.resource_path("move_the_file_icon.png")))  
-
-        # 사용자 인터페이스 설정
-        vbox = QVBoxLayout()
-        self.setLayout(vbox)
-
-        # 소스 폴더 선택 버튼
-        self.source_button = QPushButton('Select Source Folder', self)
-        self.source_button.clicked.connect(self.select_source)
-        self.source_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        vbox.addWidget(self.source_button)
-
-        # 소스 폴더 경로를 표시하는 텍스트 필드
-        self.source_folder_label = QLineEdit(self)
-        self.source_folder_label.setReadOnly(True)
-        vbox.addWidget(self.source_folder_label)
-
-        # 최근 사용된 소스 폴더를 위한 콤보 박스
-        self.source_recent = QComboBox(self)
-        self.source_recent.addItem('Recent Folders')
-        self.source_recent.addItems(self.recent_folders)
-        self.source_recent.currentIndexChanged.connect(self.select_source_recent)
-        self.source_recent.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        vbox.addWidget(self.source_recent)
-
-        # 타겟 폴더 선택 버튼
-        self.target_button = QPushButton('Select Target Folder', self)
-        self.target_button.clicked.connect(self.select_target)
-        self.target_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        vbox.addWidget(self.target_button)
-
-        # 타겟 폴더 경로를 표시하는 텍스트 필드
-        self.target_folder_label = QLineEdit(self)
-        self.target_folder_label.setReadOnly(True)
-        vbox.addWidget(self.target_folder_label)
-
-        # 최근 사용된 타겟 폴더를 위한 콤보 박스
-        self.target_recent = QComboBox(self)
-        self.target_recent.addItem('Recent Folders')
-        self.target_recent.addItems(self.recent_folders)
-        self.target_recent.currentIndexChanged.connect(self.select_target_recent)
-        self.target_recent.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        vbox.addWidget(self.target_recent)
-
-        # 키워드 입력을 위한 텍스트 필드
-        self.keyword_label = QLabel('Keywords (separated by newline):', self)
-        vbox.addWidget(self.keyword_label)
-
-        self.keyword_entry = QTextEdit(self)
-        self.keyword_entry.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        vbox.addWidget(self.keyword_entry)
-
-        # 파일 이동 또는 복사를 선택하기 위한 콤보 박스
-        self.operation = QComboBox(self)
-        self.operation.addItem('Move Files')
-        self.operation.addItem('Copy Files')
-        self.operation.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        vbox.addWidget(self.operation)
-
-        # 파일 처리 시작 버튼
-        self.process_button = QPushButton('Process Files', self)
-        self.process_button.clicked.connect(self.process_files)
-        self.process_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        vbox.addWidget(self.process_button)
-
-        # 처리된 파일 목록을 표시하는 텍스트 필드
-        self.log_label = QLabel('Processed Files:', self)
-        vbox.addWidget(self.log_label)
-
-        self.log = QPlainTextEdit(self)
-        self.log.setReadOnly(True)
-        vbox.addWidget(self.log)
-
-        # 타겟 폴더 오픈 버튼
-        self.open_target_button = QPushButton('Open Target Folder', self)
-        self.open_target_button.clicked.connect(self.open_target_folder)
-        self.open_target_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
-        vbox.addWidget(self.open_target_button)
-
-        self.styleProcessButton(self.process_button)
-        self.styleProcessButton(self.open_target_button)  # 스타일 적용  # 스타일 적용
-        
-        # 윈도우 타이틀 및 크기 설정, 윈도우 표시
-        self.setWindowTitle('File Moving Program')
-        self.setGeometry(300, 300, 800, 600)
-        self.centerWindow()
-
-        self.show()
-
-    def centerWindow(self):
-        # 창을 화면의 중앙에 배치하는 메소드
-        qr = self.frameGeometry()
-        cp = QDesktopWidget().availableGeometry().center()
-        qr.moveCenter(cp)
-        self.move(qr.topLeft())
-
-    def load_recent_folders(self):
-        # 최근 사용된 폴더 목록을 불러옴
-        try:
-            with open('recent_folders.pickle', 'rb') as f:
-                return pickle.load(f)
-        except (FileNotFoundError, EOFError):  # EOFError 처리 추가
-            return deque(maxlen=5)
-
-    def save_recent_folders(self):
-        # 최근 사용된 폴더 목록을 저장
-        with open('recent_folders.pickle', 'wb') as f:
-            pickle.dump(self.recent_folders, f)
-
-    def add_recent_folder(self, folder):
-        # 폴더를 최근 사용된 폴더 목록에 추가
-        if folder in self.recent_folders:
-            self.recent_folders.remove(folder)
-        self.recent_folders.appendleft(folder)
-        self.save_recent_folders()
-
-    def select_source(self):
-        # 소스 폴더 선택
-        self.source_folder = QFileDialog.getExistingDirectory(self, 'Select Source Folder')
-        if self.source_folder:
-            self.source_folder_label.setText(self.source_folder)
-            self.add_recent_folder(self.source_folder)
-            self.source_recent.clear()
-            self.source_recent.addItem('Recent Folders')
-            self.source_recent.addItems(self.recent_folders)
-
-    def select_source_recent(self, index):
-        # 최근 사용된 소스 폴더 선택
-        if index > 0:
-            self.source_folder = self.recent_folders[index-1]
-            self.source_folder_label.setText(self.source_folder)
-
-    def select_target(self):
-        # 타겟 폴더 선택
-        self.target_folder = QFileDialog.getExistingDirectory(self, 'Select Target Folder')
-        if self.target_folder:
-            self.target_folder_label.setText(self.target_folder)
-            self.add_recent_folder(self.target_folder)
-            self.target_recent.clear()
-            self.target_recent.addItem('Recent Folders')
-            self.target_recent.addItems(self.recent_folders)
-
-    def select_target_recent(self, index):
-        # 최근 사용된 타겟 폴더 선택
-        if index > 0:
-            self.target_folder = self.recent_folders[index-1]
-            self.target_folder_label.setText(self.target_folder)
-
-    def process_files(self):
-        # 파일 처리
-        try:
-            keywords = self.keyword_entry.toPlainText().split('\n')
-            # 키워드가 입력되지 않은 경우 함수 종료
-            if not any(keywords):
-                QMessageBox.information(self, "Notice", "Please enter the keywords")
-                return
-            processed_files = []
-            for root, dirs, files in os.walk(self.source_folder):
-                for file_name in files:
-                    if any(keyword in file_name for keyword in keywords if keyword):
-                        source_file = os.path.join(root, file_name)
-
-                        # 원본 폴더 구조에서의 상대 경로 계산
-                        relative_path = os.path.relpath(root, self.source_folder)
-                        target_dir = os.path.join(self.target_folder, relative_path)
-
-                        # 소스 폴더의 직접적인 하위가 아닌 경우만 중복 검사 수행
-                        if relative_path != '.':
-                            # 타겟 파일 경로 설정
-                            target_file = os.path.join(self.target_folder, file_name)
-
-                            # 파일명 중복 시 처리
-                            base, extension = os.path.splitext(file_name)
-                            counter = 1
-                            while os.path.exists(target_file):
-                                target_file = os.path.join(self.target_folder, f"{base}_{counter}{extension}")
-                                counter += 1
-
-                            # 파일 이동 또는 복사
-                            if self.operation.currentText() == 'Move Files':
-                                os.makedirs(target_dir, exist_ok=True)
-                                shutil.move(source_file, target_file)
-                            elif self.operation.currentText() == 'Copy Files':
-                                os.makedirs(target_dir, exist_ok=True)
-                                shutil.copy2(source_file, target_file)
-
-                            processed_files.append(os.path.basename(target_file))
-                        else:
-                            # 소스 폴더에 직접 위치한 파일은 아무런 조치 없이 목록에 추가만 함
-                            processed_files.append(file_name)
-
-            if processed_files:
-                # 프로세스 파일 표시
-                self.log.appendPlainText(f"\n{len(processed_files)} files have been {self.operation.currentText()}:\n" + "\n".join(processed_files))
-                QMessageBox.information(self, "Success", f"{len(processed_files)} file processing is complete.")
-            else:
-                QMessageBox.information(self, "Notification", "There are no files matching the keyword.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", str(e))
-
-    def open_target_folder(self):
-        if self.target_folder:
-            if sys.platform == 'win32':
-                os.startfile(self.target_folder)
-            elif sys.platform == 'darwin':  # macOS
-                subprocess.Popen(['open', self.target_folder])
-            else:  # linux variants
-                subprocess.Popen(['xdg-open', self.target_folder])
-        else:
-            QMessageBox.information(self, "Notice", "No target folder selected")
-
-    def styleProcessButton(self, button):
-        # 프로세스 버튼 스타일링
-        button.setStyleSheet("""
-            QPushButton {
-                background-color: #007AFF; color: white;
-                border-radius: 5px; padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-        """)
-
-if __name__ == '__main__':
-    app = QApplication(sys.argv)
-    ex = MovetheFile()
-    sys.exit(app.exec_())
+from PyQt5.QtWidgets import QDesktopWidget, QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QFileDialog, QTextEdit, QLabel, QComboBox, QSizePolicy, QLineEdit, QMessageBox, QPlainTextEdit, QCheckBox, QSpinBox
+from collections import deque
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon, QFont
+import sys
+import os
+import pickle
+import subprocess
+
+from file_utilities_core.encode import format_bytes
+from file_utilities_core.matcher import GLOB, REGEX, SUBSTRING, TOKEN
+from file_utilities_core.mover import COPY, MOVE, ProcessControl, ProcessStats, parse_keywords, process_files
+from file_utilities_core.transfer import TRANSFER_WORKERS, has_pending_moves, recover_moves
+
+# 키워드 매칭 방식 (콤보 박스 표시 이름, matcher 모드)
+MATCH_MODES = [
+    ('Contains', SUBSTRING),
+    ('Whole word', TOKEN),
+    ('Wildcard (*, ?)', GLOB),
+    ('Regular expression', REGEX),
+]
+
+
+class ProcessWorker(QThread):
+    """파일 탐색과 이동/복사를 백그라운드 스레드에서 실행.
+
+    진행 상황과 처리된 파일 이름은 REPORT_INTERVAL 마다 모아서 시그널로 보낸다.
+    """
+    REPORT_INTERVAL = 200  # ms
+
+    progressChanged = pyqtSignal(dict)   # ProcessStats.snapshot()
+    filesProcessed = pyqtSignal(list)    # 마지막 보고 이후 처리된 파일 이름들
+    completed = pyqtSignal(int, bool)    # 처리한 파일 수, 취소 여부
+    failed = pyqtSignal(str)
+
+    def __init__(self, source_folder, target_folder, keywords, operation, match_mode, ignore_case,
+                 transfer_workers=TRANSFER_WORKERS, parent=None):
+        super().__init__(parent)
+        self.args = (source_folder, target_folder, keywords, operation)
+        self.options = {'match_mode': match_mode, 'ignore_case': ignore_case, 'transfer_workers': transfer_workers}
+        self.stats = ProcessStats()
+        self.control = ProcessControl()
+        self.pending_log = deque()  # 작업 스레드에서 추가, GUI 스레드에서 꺼냄
+        self.processed_count = 0
+        self.error = None
+
+        # QThread 객체 자체는 GUI 스레드에 있으므로 타이머도 GUI 스레드에서 동작
+        self.report_timer = QTimer(self)
+        self.report_timer.setInterval(self.REPORT_INTERVAL)
+        self.report_timer.timeout.connect(self.report)
+        self.started.connect(self.report_timer.start)
+        self.finished.connect(self.on_finished)
+
+    def run(self):
+        try:
+            processed_files = process_files(*self.args, stats=self.stats, control=self.control,
+                                            progress=self.on_progress, **self.options)
+            self.processed_count = len(processed_files)
+        except Exception as e:
+            self.error = str(e)
+
+    def on_progress(self, stats, file_name):
+        self.pending_log.append(file_name)
+
+    def report(self):
+        lines = []
+        while self.pending_log:
+            lines.append(self.pending_log.popleft())
+        if lines:
+            self.filesProcessed.emit(lines)
+        self.progressChanged.emit(self.stats.snapshot())
+
+    def on_finished(self):
+        self.report_timer.stop()
+        self.report()
+        if self.error is not None:
+            self.failed.emit(self.error)
+        else:
+            self.completed.emit(self.processed_count, self.control.cancelled)
+
+
+class MovetheFile(QWidget):
+
+    def resource_path(self, relative_path):
+        try:
+            base_path = sys._MEIPASS
+        except Exception:
+            base_path = os.path.abspath(".")
+        return os.path.join(base_path, relative_path)
+    
+    def __init__(self):
+        super().__init__()
+        self.worker = None
+        self.initUI()
+
+    def initUI(self):
+
+        font = QFont()
+        font.setPointSize(12)
+        QApplication.setFont(font)
+        # 소스 및 타겟 폴더를 위한 변수 초기화
+        self.source_folder = ''
+        self.target_folder = ''
+
+        # 최근 사용된 폴더 목록
+        self.recent_folders = self.load_recent_folders()
+
+        # 아이콘 세팅
+        self.setWindowIcon(QIcon(self.resource_path("move_the_file_icon.png")))  
+
+        # 사용자 인터페이스 설정
+        vbox = QVBoxLayout()
+        self.setLayout(vbox)
+
+        # 소스 폴더 선택 버튼
+        self.source_button = QPushButton('Select Source Folder', self)
+        self.source_button.clicked.connect(self.select_source)
+        self.source_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        vbox.addWidget(self.source_button)
+
+        # 소스 폴더 경로를 표시하는 텍스트 필드
+        self.source_folder_label = QLineEdit(self)
+        self.source_folder_label.setReadOnly(True)
+        vbox.addWidget(self.source_folder_label)
+
+        # 최근 사용된 소스 폴더를 위한 콤보 박스
+        self.source_recent = QComboBox(self)
+        self.source_recent.addItem('Recent Folders')
+        self.source_recent.addItems(self.recent_folders)
+        self.source_recent.currentIndexChanged.connect(self.select_source_recent)
+        self.source_recent.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        vbox.addWidget(self.source_recent)
+
+        # 타겟 폴더 선택 버튼
+        self.target_button = QPushButton('Select Target Folder', self)
+        self.target_button.clicked.connect(self.select_target)
+        self.target_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        vbox.addWidget(self.target_button)
+
+        # 타겟 폴더 경로를 표시하는 텍스트 필드
+        self.target_folder_label = QLineEdit(self)
+        self.target_folder_label.setReadOnly(True)
+        vbox.addWidget(self.target_folder_label)
+
+        # 최근 사용된 타겟 폴더를 위한 콤보 박스
+        self.target_recent = QComboBox(self)
+        self.target_recent.addItem('Recent Folders')
+        self.target_recent.addItems(self.recent_folders)
+        self.target_recent.currentIndexChanged.connect(self.select_target_recent)
+        self.target_recent.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        vbox.addWidget(self.target_recent)
+
+        # 키워드 입력을 위한 텍스트 필드
+        self.keyword_label = QLabel('Keywords (separated by newline):', self)
+        vbox.addWidget(self.keyword_label)
+
+        self.keyword_entry = QTextEdit(self)
+        self.keyword_entry.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        vbox.addWidget(self.keyword_entry)
+
+        # 키워드 매칭 방식과 대소문자 구분 여부
+        match_box = QHBoxLayout()
+        match_box.addWidget(QLabel('Match:', self))
+        self.match_mode = QComboBox(self)
+        for label, mode in MATCH_MODES:
+            self.match_mode.addItem(label, mode)
+        match_box.addWidget(self.match_mode, 1)
+        self.ignore_case = QCheckBox('Ignore case', self)
+        match_box.addWidget(self.ignore_case)
+        vbox.addLayout(match_box)
+
+        # 파일 이동 또는 복사를 선택하기 위한 콤보 박스
+        self.operation = QComboBox(self)
+        self.operation.addItem('Move Files')
+        self.operation.addItem('Copy Files')
+        self.operation.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        vbox.addWidget(self.operation)
+
+        # 동시에 실행할 전송 수 (HDD는 장치별로 자동으로 하나씩만 실행)
+        transfer_box = QHBoxLayout()
+        transfer_box.addWidget(QLabel('Parallel transfers:', self))
+        self.transfer_workers = QSpinBox(self)
+        self.transfer_workers.setRange(1, 32)
+        self.transfer_workers.setValue(TRANSFER_WORKERS)
+        transfer_box.addWidget(self.transfer_workers)
+        transfer_box.addStretch(1)
+        vbox.addLayout(transfer_box)
+
+        # 파일 처리 시작 버튼
+        self.process_button = QPushButton('Process Files', self)
+        self.process_button.clicked.connect(self.process_files)
+        self.process_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        vbox.addWidget(self.process_button)
+
+        # 실행 중인 작업 일시정지/취소 및 진행 상황
+        control_box = QHBoxLayout()
+        self.pause_button = QPushButton('Pause', self)
+        self.pause_button.clicked.connect(self.toggle_pause)
+        self.pause_button.setEnabled(False)
+        control_box.addWidget(self.pause_button)
+        self.cancel_button = QPushButton('Cancel', self)
+        self.cancel_button.clicked.connect(self.cancel_processing)
+        self.cancel_button.setEnabled(False)
+        control_box.addWidget(self.cancel_button)
+        self.status_label = QLabel('', self)
+        control_box.addWidget(self.status_label, 1)
+        vbox.addLayout(control_box)
+
+        # 처리된 파일 목록을 표시하는 텍스트 필드
+        self.log_label = QLabel('Processed Files:', self)
+        vbox.addWidget(self.log_label)
+
+        self.log = QPlainTextEdit(self)
+        self.log.setReadOnly(True)
+        vbox.addWidget(self.log)
+
+        # 타겟 폴더 오픈 버튼
+        self.open_target_button = QPushButton('Open Target Folder', self)
+        self.open_target_button.clicked.connect(self.open_target_folder)
+        self.open_target_button.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Expanding)
+        vbox.addWidget(self.open_target_button)
+
+        self.styleProcessButton(self.process_button)
+        self.styleProcessButton(self.open_target_button)  # 스타일 적용  # 스타일 적용
+        
+        # 윈도우 타이틀 및 크기 설정, 윈도우 표시
+        self.setWindowTitle('File Moving Program')
+        self.setGeometry(300, 300, 800, 600)
+        self.centerWindow()
+
+        self.show()
+
+    def centerWindow(self):
+        # 창을 화면의 중앙에 배치하는 메소드
+        qr = self.frameGeometry()
+        cp = QDesktopWidget().availableGeometry().center()
+        qr.moveCenter(cp)
+        self.move(qr.topLeft())
+
+    def load_recent_folders(self):
+        # 최근 사용된 폴더 목록을 불러옴
+        try:
+            with open('recent_folders.pickle', 'rb') as f:
+                return pickle.load(f)
+        except (FileNotFoundError, EOFError):  # EOFError 처리 추가
+            return deque(maxlen=5)
+
+    def save_recent_folders(self):
+        # 최근 사용된 폴더 목록을 저장
+        with open('recent_folders.pickle', 'wb') as f:
+            pickle.dump(self.recent_folders, f)
+
+    def add_recent_folder(self, folder):
+        # 폴더를 최근 사용된 폴더 목록에 추가
+        if folder in self.recent_folders:
+            self.recent_folders.remove(folder)
+        self.recent_folders.appendleft(folder)
+        self.save_recent_folders()
+
+    def select_source(self):
+        # 소스 폴더 선택
+        self.source_folder = QFileDialog.getExistingDirectory(self, 'Select Source Folder')
+        if self.source_folder:
+            self.source_folder_label.setText(self.source_folder)
+            self.add_recent_folder(self.source_folder)
+            self.source_recent.clear()
+            self.source_recent.addItem('Recent Folders')
+            self.source_recent.addItems(self.recent_folders)
+
+    def select_source_recent(self, index):
+        # 최근 사용된 소스 폴더 선택
+        if index > 0:
+            self.source_folder = self.recent_folders[index-1]
+            self.source_folder_label.setText(self.source_folder)
+
+    def select_target(self):
+        # 타겟 폴더 선택
+        self.target_folder = QFileDialog.getExistingDirectory(self, 'Select Target Folder')
+        if self.target_folder:
+            self.target_folder_label.setText(self.target_folder)
+            self.add_recent_folder(self.target_folder)
+            self.target_recent.clear()
+            self.target_recent.addItem('Recent Folders')
+            self.target_recent.addItems(self.recent_folders)
+
+    def select_target_recent(self, index):
+        # 최근 사용된 타겟 폴더 선택
+        if index > 0:
+            self.target_folder = self.recent_folders[index-1]
+            self.target_folder_label.setText(self.target_folder)
+
+    def process_files(self):
+        # 파일 처리는 백그라운드 스레드에서 진행
+        if self.worker and self.worker.isRunning():
+            return
+        keywords = parse_keywords(self.keyword_entry.toPlainText())
+        # 키워드가 입력되지 않은 경우 함수 종료
+        if not keywords:
+            QMessageBox.information(self, "Notice", "Please enter the keywords")
+            return
+        operation = MOVE if self.operation.currentText() == 'Move Files' else COPY
+        if operation == MOVE and has_pending_moves(self.target_folder):
+            self.recover_interrupted_move()
+            return
+        self.log.appendPlainText(f"\n{self.operation.currentText()}:")
+
+        self.worker = ProcessWorker(self.source_folder, self.target_folder, keywords, operation,
+                                    self.match_mode.currentData(), self.ignore_case.isChecked(),
+                                    self.transfer_workers.value(), self)
+        self.worker.progressChanged.connect(self.update_status)
+        self.worker.filesProcessed.connect(self.append_log)
+        self.worker.completed.connect(self.processing_completed)
+        self.worker.failed.connect(self.processing_failed)
+        self.worker.finished.connect(self.processing_finished)
+        self.set_running(True)
+        self.worker.start()
+
+    def recover_interrupted_move(self):
+        # 이전 이동이 중간에 멈춘 경우: 이어서 하거나 되돌린 뒤에만 새로 시작할 수 있음
+        box = QMessageBox(self)
+        box.setWindowTitle("Interrupted move")
+        box.setText("A previous move into this folder did not finish.\n"
+                    "Resume it, or roll back the files it already moved?")
+        resume_button = box.addButton("Resume", QMessageBox.AcceptRole)
+        rollback_button = box.addButton("Roll back", QMessageBox.DestructiveRole)
+        box.addButton(QMessageBox.Cancel)
+        box.exec_()
+        if box.clickedButton() not in (resume_button, rollback_button):
+            return
+        rollback = box.clickedButton() is rollback_button
+        try:
+            count = recover_moves(self.target_folder, rollback=rollback)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+        message = f"{'Rolled back' if rollback else 'Resumed'} {count} files."
+        self.log.appendPlainText(f"\n{message}")
+        QMessageBox.information(self, "Recovered", message)
+
+    def set_running(self, running):
+        self.process_button.setEnabled(not running)
+        self.pause_button.setEnabled(running)
+        self.cancel_button.setEnabled(running)
+        self.pause_button.setText('Pause')
+
+    def toggle_pause(self):
+        if not self.worker:
+            return
+        if self.worker.control.paused:
+            self.worker.control.resume()
+            self.pause_button.setText('Pause')
+        else:
+            self.worker.control.pause()
+            self.pause_button.setText('Resume')
+
+    def cancel_processing(self):
+        if self.worker:
+            self.worker.control.cancel()
+
+    def append_log(self, file_names):
+        # 한 번에 모아서 추가해야 파일이 많아도 로그 창이 느려지지 않음
+        self.log.appendPlainText("\n".join(file_names))
+
+    def update_status(self, stats):
+        status = (f"Scanned {stats['scanned']:,} · matched {stats['matched']:,} · "
+                  f"processed {stats['processed']:,} · {format_bytes(stats['bytes_done'])} "
+                  f"({format_bytes(stats['throughput'])}/s)")
+        if stats['eta'] is not None and stats['bytes_done'] < stats['bytes_matched']:
+            prefix = '' if stats['scan_done'] else '≥'
+            status += f" · ETA {prefix}{int(stats['eta'])}s"
+        if self.worker and self.worker.control.paused:
+            status += " · paused"
+        self.status_label.setText(status)
+
+    def processing_completed(self, processed_count, cancelled):
+        if cancelled:
+            QMessageBox.information(self, "Cancelled", f"Cancelled after {processed_count} files.")
+        elif processed_count:
+            QMessageBox.information(self, "Success", f"{processed_count} file processing is complete.")
+        else:
+            QMessageBox.information(self, "Notification", "There are no files matching the keyword.")
+
+    def processing_failed(self, message):
+        QMessageBox.critical(self, "Error", message)
+
+    def processing_finished(self):
+        self.set_running(False)
+
+    def closeEvent(self, event):
+        # 창을 닫을 때 진행 중인 작업을 멈추고 스레드가 끝날 때까지 기다림
+        if self.worker and self.worker.isRunning():
+            self.worker.control.cancel()
+            self.worker.wait()
+        super().closeEvent(event)
+
+    def open_target_folder(self):
+        if self.target_folder:
+            if sys.platform == 'win32':
+                os.startfile(self.target_folder)
+            elif sys.platform == 'darwin':  # macOS
+                subprocess.Popen(['open', self.target_folder])
+            else:  # linux variants
+                subprocess.Popen(['xdg-open', self.target_folder])
+        else:
+            QMessageBox.information(self, "Notice", "No target folder selected")
+
+    def styleProcessButton(self, button):
+        # 프로세스 버튼 스타일링
+        button.setStyleSheet("""
+            QPushButton {
+                background-color: #007AFF; color: white;
+                border-radius: 5px; padding: 10px;
+            }
+            QPushButton:hover {
+                background-color: #0056b3;
+            }
+        """)
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    ex = MovetheFile()
+    sys.exit(app.exec_())
@@ -0,0 +1,84 @@
+"""긴 GIF 리사이즈의 최대 메모리 비교: 모든 프레임을 모아 save_all vs 프레임마다 스트리밍.
+
+    python benchmarks/bench_animated.py [--frames 300 --width 1280 --height 720]
+
+각 방식은 새 프로세스에서 실행해 최대 RSS를 잰다 (resource 모듈이 없는 Windows에서는 시간만).
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw, ImageOps, ImageSequence
+
+from file_utilities_core.resize import calculate_new_size, resize_image
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+def make_gif(path, frames, width, height):
+    def generate():
+        for i in range(frames):
+            frame = Image.new('RGB', (width, height), (i % 256, 90, 160))
+            draw = ImageDraw.Draw(frame)
+            draw.ellipse(((i * 13) % width, height // 4, (i * 13) % width + width // 5, height // 2), fill=(250, 220, 0))
+            yield frame.convert('P', palette=Image.Palette.ADAPTIVE)
+    # 만드는 쪽도 메모리를 아끼기 위해 스트리밍 저장을 쓴다
+    from file_utilities_core.animated import save_gif_frames
+    save_gif_frames(path, ((frame, 40) for frame in generate()), (width, height))
+
+
+def old_resize(file_path, ratio):
+    """이전 버전: 모든 프레임을 RGBA로 바꿔 목록에 모은 뒤 한 번에 저장."""
+    base, ext = os.path.splitext(file_path)
+    with Image.open(file_path) as img:
+        frames = []
+        durations = []
+        for frame in ImageSequence.Iterator(img):
+            new_size = calculate_new_size(frame.width, frame.height, ratio)
+            frames.append(ImageOps.fit(frame.convert("RGBA"), new_size, Image.Resampling.LANCZOS))
+            durations.append(frame.info.get('duration', 0))
+        frames[0].save(f"{base}_resized.gif", save_all=True, append_images=frames[1:],
+                       duration=durations, loop=0, optimize=False)
+
+
+def measure(name, file_path):
+    start = time.perf_counter()
+    if name == 'old':
+        old_resize(file_path, (1, 1))
+    else:
+        resize_image(file_path, (1, 1))
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None
+    if peak is not None and sys.platform != 'darwin':
+        peak *= 1024  # 리눅스는 KB 단위
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=300)
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=720)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, 'long.gif')
+        make_gif(file_path, args.frames, args.width, args.height)
+        print(f"{args.frames} frames, {args.width}x{args.height} GIF, ratio 1:1")
+        for name in ('old', 'streaming'):
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                elapsed, peak = executor.submit(measure, name, file_path).result()
+            memory = f"{peak / 2 ** 20:8.0f} MB" if peak else "     n/a"
+            print(f"  {name:<12} {elapsed:7.2f} s  peak {memory}")
+
+
+if __name__ == '__main__':
+    main()
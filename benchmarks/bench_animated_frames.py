@@ -0,0 +1,91 @@
+"""긴 애니메이션 리사이즈 시간 비교: 프레임마다 ImageOps.fit vs 한 번 계산한 크롭 영역 + 안 바뀐 프레임 재사용.
+
+    python benchmarks/bench_animated_frames.py [--frames 600 --width 640 --height 360]
+
+두 가지 GIF로 잰다. corner는 가운데는 10프레임마다만 바뀌고 크롭 밖의 구석 시계만
+매 프레임 바뀌는 애니메이션, moving은 매 프레임 크롭 안이 바뀌는 애니메이션이다.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw, ImageOps, ImageSequence
+
+from file_utilities_core.animated import save_gif_frames
+from file_utilities_core.resize import calculate_new_size, calculate_output_size, resize_image
+
+
+def make_gif(path, frames, width, height, moving):
+    images = []
+    for i in range(frames):
+        frame = Image.new('RGB', (width, height), (30, 90, 160))
+        draw = ImageDraw.Draw(frame)
+        step = i if moving else i // 10
+        x = width // 4 + (step * 7) % (width // 2)
+        draw.ellipse((x, height // 3, x + height // 4, height // 3 + height // 4), fill=(250, 220, 0))
+        # 크롭 영역 밖(왼쪽 위 구석)의 시계
+        draw.rectangle((4, 4, width // 10, height // 10), fill=(255, 255, 255))
+        draw.text((8, 8), f"{i:04d}", fill=(0, 0, 0))
+        images.append(frame.convert('P', palette=Image.Palette.ADAPTIVE))
+    # 일반적인 GIF처럼 바뀐 영역만 담긴 프레임으로 저장한다
+    images[0].save(path, save_all=True, append_images=images[1:], duration=40, loop=0)
+
+
+def per_frame_fit(file_path, ratio, max_size):
+    """이전 버전: 프레임마다 ImageOps.fit으로 크롭 영역을 다시 계산하고 모든 프레임을 다시 인코딩."""
+    base, ext = os.path.splitext(file_path)
+    with Image.open(file_path) as img:
+        size = calculate_output_size(img.width, img.height, ratio, max_size)
+        crop_size = calculate_new_size(img.width, img.height, ratio)
+
+        def frames():
+            for frame in ImageSequence.Iterator(img):
+                if frame.mode == 'P' and size == crop_size:
+                    fitted = ImageOps.fit(frame, size)
+                else:
+                    if frame.mode not in ('RGB', 'RGBA'):
+                        frame = frame.convert('RGBA' if frame.has_transparency_data else 'RGB')
+                    fitted = ImageOps.fit(frame, size, Image.Resampling.LANCZOS)
+                yield fitted, frame.info.get('duration', 0)
+
+        save_gif_frames(f"{base}_resized.gif", frames(), size, img.info.get('loop', 0))
+
+
+def frame_count(path):
+    with Image.open(path) as img:
+        return img.n_frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--frames', type=int, default=600)
+    parser.add_argument('--width', type=int, default=640)
+    parser.add_argument('--height', type=int, default=360)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{args.frames} frames, {args.width}x{args.height} GIF, ratio 1:1")
+        print(f"{'animation':<10} {'max size':>8} {'per frame':>10} {'planned':>10} {'speedup':>8} {'frames written':>15}")
+        for name in ('corner', 'moving'):
+            file_path = os.path.join(tmp, f'{name}.gif')
+            make_gif(file_path, args.frames, args.width, args.height, moving=name == 'moving')
+            resized_path = os.path.join(tmp, f'{name}_resized.gif')
+            for max_size in (None, 160):
+                start = time.perf_counter()
+                per_frame_fit(file_path, (1, 1), max_size)
+                old = time.perf_counter() - start
+                old_frames = frame_count(resized_path)
+                start = time.perf_counter()
+                resize_image(file_path, (1, 1), max_size=max_size)
+                new = time.perf_counter() - start
+                label = max_size or 'crop'
+                print(f"{name:<10} {label:>8} {old:>9.2f}s {new:>9.2f}s {old / new:>7.1f}x "
+                      f"{old_frames:>7} -> {frame_count(resized_path)}")
+
+
+if __name__ == '__main__':
+    main()
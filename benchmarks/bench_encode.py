@@ -0,0 +1,67 @@
+"""저장 형식과 인코더 설정별 인코딩 시간과 결과 크기 비교.
+
+    python benchmarks/bench_encode.py [--width 6000 --height 4000 --max-size 1920 --repeat 3]
+
+리사이즈까지 같은 조건으로 하고 resize_image()가 돌려주는 EncodedFile의 시간과 크기만 비교한다.
+"""
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw
+
+from file_utilities_core.encode import OutputOptions, available_formats, format_bytes
+from file_utilities_core.resize import resize_image
+
+SETTINGS = [
+    ('JPEG q85', dict(format='JPEG', quality=85)),
+    ('JPEG q85 progressive+optimize', dict(format='JPEG', quality=85, progressive=True, optimize=True)),
+    ('JPEG q85 4:4:4', dict(format='JPEG', quality=85, subsampling='4:4:4')),
+    ('JPEG q70', dict(format='JPEG', quality=70)),
+    ('WebP q80', dict(format='WEBP', quality=80)),
+    ('WebP q80 optimize', dict(format='WEBP', quality=80, optimize=True)),
+    ('PNG', dict(format='PNG')),
+    ('PNG optimize', dict(format='PNG', optimize=True)),
+    ('AVIF q60', dict(format='AVIF', quality=60)),
+]
+
+
+def make_photo(path, width, height):
+    # 단색 이미지는 너무 빨리 디코딩되므로 그라데이션과 도형으로 채운다
+    img = Image.linear_gradient('L').resize((width, height)).convert('RGB')
+    draw = ImageDraw.Draw(img)
+    for i in range(0, width, 97):
+        draw.ellipse((i, (i * 7) % height, i + 300, (i * 7) % height + 200), fill=(i % 255, 80, 160))
+    img.save(path, quality=92)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--width', type=int, default=6000)
+    parser.add_argument('--height', type=int, default=4000)
+    parser.add_argument('--max-size', type=int, default=1920)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    formats = available_formats()
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, 'photo.jpg')
+        make_photo(file_path, args.width, args.height)
+        print(f"{args.width}x{args.height} JPEG -> max {args.max_size} px, ratio 4:3, best of {args.repeat}")
+        print(f"{'settings':<32} {'encode':>8} {'bytes':>10}")
+        for name, settings in SETTINGS:
+            if settings['format'] not in formats:
+                print(f"{name:<32} {'not available':>19}")
+                continue
+            output = OutputOptions(**settings)
+            results = [resize_image(file_path, (4, 3), max_size=args.max_size, output=output)
+                       for _ in range(args.repeat)]
+            seconds = min(result.seconds for result in results)
+            print(f"{name:<32} {seconds * 1000:>6.0f}ms {format_bytes(results[0].size):>10}")
+
+
+if __name__ == '__main__':
+    main()
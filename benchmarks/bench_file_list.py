@@ -0,0 +1,87 @@
+"""파일 목록 비교: QStringListModel/QListWidget vs FileListModel.
+
+화면 없이(offscreen) 뷰에 목록을 붙인 채로 경로를 넣는 데 걸리는 시간을 잰다.
+File Renamer처럼 여러 번 나눠 추가하는 경우와 Image Resizer처럼 한 번에 놓는 경우.
+
+    python benchmarks/bench_file_list.py [--files 200000 --batches 20]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtCore import QStringListModel
+from PyQt5.QtWidgets import QApplication, QListView, QListWidget
+
+from file_list_model import FileListModel
+from file_utilities_core.natsort import natural_sort_key
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    QApplication.processEvents()
+    print(f"  {label:<34} {time.perf_counter() - start:7.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=200000)
+    parser.add_argument('--batches', type=int, default=20)
+    args = parser.parse_args()
+
+    app = QApplication(sys.argv)
+    rng = random.Random(0)
+    paths = [f"C:/Photos/day {rng.randrange(365)}/IMG_{i:06d}.jpg" for i in range(args.files)]
+    rng.shuffle(paths)
+    size = -(-len(paths) // args.batches)
+    batches = [paths[i:i + size] for i in range(0, len(paths), size)]
+    print(f"{args.files} paths in {len(batches)} batches")
+
+    # File Renamer: 추가할 때마다 전체를 다시 정렬하던 방식
+    string_model = QStringListModel()
+    string_view = QListView()
+    string_view.setModel(string_model)
+    string_view.show()
+
+    def add_string_list():
+        for batch in batches:
+            string_model.setStringList(sorted(set(batch).union(string_model.stringList()), key=natural_sort_key))
+    timed("QStringListModel (re-sort per add)", add_string_list)
+
+    file_model = FileListModel(sort_key=natural_sort_key)
+    file_view = QListView()
+    file_view.setUniformItemSizes(True)
+    file_view.setModel(file_model)
+    file_view.show()
+
+    def add_file_model():
+        for batch in batches:
+            file_model.addPaths(batch)
+    timed("FileListModel.addPaths", add_file_model)
+    assert file_model.paths() == string_model.stringList()
+
+    # Image Resizer: 한 번에 놓기
+    list_widget = QListWidget()
+    list_widget.show()
+
+    def add_list_widget():
+        for path in paths:
+            list_widget.addItem(path)
+    timed("QListWidget.addItem", add_list_widget)
+
+    drop_model = FileListModel()
+    drop_view = QListView()
+    drop_view.setUniformItemSizes(True)
+    drop_view.setModel(drop_model)
+    drop_view.show()
+    timed("FileListModel.setPaths", lambda: drop_model.setPaths(paths))
+    app.quit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""큰 JPEG에서 전체 디코딩과 축소 디코딩(draft + reduce)의 리사이즈 시간을 비교.
+
+    python benchmarks/bench_jpeg_draft.py [--width 6000 --height 4000 --repeat 3]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw
+
+from file_utilities_core.resize import resize_image
+
+
+def make_photo(path, width, height):
+    # 단색 이미지는 너무 빨리 디코딩되므로 그라데이션과 도형으로 채운다
+    img = Image.linear_gradient('L').resize((width, height)).convert('RGB')
+    draw = ImageDraw.Draw(img)
+    for i in range(0, width, 97):
+        draw.ellipse((i, (i * 7) % height, i + 300, (i * 7) % height + 200), fill=(i % 255, 80, 160))
+    img.save(path, quality=92)
+
+
+def best_time(file_path, repeat, **options):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        resize_image(file_path, (4, 3), **options)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--width', type=int, default=6000)
+    parser.add_argument('--height', type=int, default=4000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, 'photo.jpg')
+        make_photo(file_path, args.width, args.height)
+        print(f"{args.width}x{args.height} JPEG, ratio 4:3, best of {args.repeat}")
+        print(f"{'max size':>10} {'quality':>10} {'fast':>10} {'speedup':>8}")
+        for max_size in (None, 2048, 1024, 512, 256):
+            quality = best_time(file_path, args.repeat, max_size=max_size, fast=False)
+            fast = best_time(file_path, args.repeat, max_size=max_size, fast=True)
+            label = max_size or 'original'
+            print(f"{label:>10} {quality * 1000:>8.0f}ms {fast * 1000:>8.0f}ms {quality / fast:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
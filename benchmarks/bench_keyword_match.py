@@ -0,0 +1,57 @@
+"""키워드 매칭 비교: 기존 `any(keyword in name ...)` 루프 vs 컴파일된 매처.
+
+    python benchmarks/bench_keyword_match.py [--keywords 5000 --files 20000]
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from file_utilities_core.matcher import SUBSTRING, TOKEN, compile_matcher
+
+
+def make_names(count, keywords, rng):
+    names = []
+    for i in range(count):
+        stem = ''.join(rng.choices(string.ascii_letters + string.digits, k=rng.randint(8, 24)))
+        if i % 50 == 0:
+            stem = f"{stem}_{rng.choice(keywords)}"
+        names.append(f"{stem}.jpg")
+    return names
+
+
+def timed(match, names):
+    start = time.perf_counter()
+    hits = sum(1 for name in names if match(name))
+    return time.perf_counter() - start, hits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--keywords', type=int, default=5000)
+    parser.add_argument('--files', type=int, default=20000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    keywords = [f"SKU{rng.randrange(10 ** 7):07d}" for _ in range(args.keywords)]
+    names = make_names(args.files, keywords, rng)
+
+    baseline, expected = timed(lambda name: any(keyword in name for keyword in keywords), names)
+    print(f"{args.files} names x {args.keywords} keywords")
+    print(f"  any(...) loop         {baseline * 1000:9.1f} ms  ({expected} matches)")
+
+    start = time.perf_counter()
+    compile_matcher(keywords)
+    print(f"  compile (substring)   {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+    for label, mode, ignore_case in (("substring", SUBSTRING, False), ("substring -i", SUBSTRING, True), ("token", TOKEN, False)):
+        elapsed, hits = timed(compile_matcher(keywords, mode, ignore_case), names)
+        print(f"  {label:<20}  {elapsed * 1000:9.1f} ms  ({hits} matches, {baseline / elapsed:.0f}x)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""자연 정렬 비교: 기존 re.split 리스트 키 vs natsort (컴파일된 정규식 + LRU 캐시).
+
+    python benchmarks/bench_natsort.py [--files 1000000 --add 10000]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from file_utilities_core import natsort
+from file_utilities_core.natsort import casefold_sort_key, merge_sorted, natural_sort_key
+
+
+def old_natural_sort_key(s):
+    """이전 버전 (호출마다 정규식 캐시 조회 + 리스트 생성)."""
+    return [int(text) if text.isdigit() else text.lower() for text in re.split(r'(\d+)', s)]
+
+
+def make_names(count, rng):
+    prefixes = ["IMG_", "DSC", "Screenshot 2024-0", "scan page ", "사진 "]
+    return [f"{rng.choice(prefixes)}{rng.randrange(10 ** 6)} ({rng.randrange(20)}).jpg" for _ in range(count)]
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    result = func()
+    print(f"  {label:<40} {time.perf_counter() - start:7.2f} s")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=1000000)
+    parser.add_argument('--add', type=int, default=10000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    names = make_names(args.files, rng)
+    added = make_names(args.add, rng)
+    print(f"{args.files} names, then {args.add} more (key cache: {natsort.KEY_CACHE_SIZE})")
+
+    expected = timed("old key: sort", lambda: sorted(names, key=old_natural_sort_key))
+    timed("old key: add + re-sort all", lambda: sorted(expected + added, key=old_natural_sort_key))
+
+    result = timed("natsort: sort (cold cache)", lambda: sorted(names, key=natural_sort_key))
+    assert result == expected
+    # 캐시에 남은 만큼 (마지막 KEY_CACHE_SIZE 개) 다시 계산하지 않는다
+    sample = result[-natsort.KEY_CACHE_SIZE:]
+    timed(f"natsort: re-sort {len(sample)} cached", lambda: sorted(sample, key=natural_sort_key))
+    timed("natsort: merge_sorted", lambda: merge_sorted(result, added))
+    timed("casefold: sort", lambda: sorted(names, key=casefold_sort_key))
+
+
+if __name__ == '__main__':
+    main()
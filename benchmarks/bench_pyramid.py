@@ -0,0 +1,74 @@
+"""여러 크기 출력 비교: 크기마다 resize_image()를 다시 실행 vs 한 번 디코딩하는 resize_pyramid().
+
+    python benchmarks/bench_pyramid.py [--width 6000 --height 4000 --repeat 3]
+
+기본 프리셋(2048, 1024, 512, 256, 256 정사각 썸네일)을 쓰고, 참고로 디코딩만 한 시간도 보여 준다.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw
+
+from file_utilities_core.pyramid import DEFAULT_PRESET, resize_pyramid
+from file_utilities_core.resize import resize_image
+
+
+def make_photo(path, width, height):
+    # 단색 이미지는 너무 빨리 디코딩되므로 그라데이션과 도형으로 채운다
+    img = Image.linear_gradient('L').resize((width, height)).convert('RGB')
+    draw = ImageDraw.Draw(img)
+    for i in range(0, width, 97):
+        draw.ellipse((i, (i * 7) % height, i + 300, (i * 7) % height + 200), fill=(i % 255, 80, 160))
+    img.save(path, quality=92)
+
+
+def decode_only(file_path, fast):
+    with Image.open(file_path) as img:
+        img.load()
+
+
+def separate(file_path, fast):
+    for level in DEFAULT_PRESET:
+        resize_image(file_path, level.ratio or (16, 9), max_size=level.max_size, fast=fast)
+
+
+def pyramid(file_path, fast):
+    resize_pyramid(file_path, (16, 9), fast=fast)
+
+
+def best_time(function, file_path, repeat, fast):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(file_path, fast)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--width', type=int, default=6000)
+    parser.add_argument('--height', type=int, default=4000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        file_path = os.path.join(tmp, 'photo.jpg')
+        make_photo(file_path, args.width, args.height)
+        print(f"{args.width}x{args.height} JPEG -> {len(DEFAULT_PRESET)} sizes, ratio 16:9, best of {args.repeat}")
+        print(f"{'mode':<8} {'decode':>8} {'separate':>10} {'pyramid':>10} {'speedup':>8}")
+        for fast in (False, True):
+            decode = best_time(decode_only, file_path, args.repeat, fast)
+            old = best_time(separate, file_path, args.repeat, fast)
+            new = best_time(pyramid, file_path, args.repeat, fast)
+            print(f"{'fast' if fast else 'quality':<8} {decode * 1000:>6.0f}ms {old * 1000:>8.0f}ms "
+                  f"{new * 1000:>8.0f}ms {old / new:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""이름 일괄 변경 비교: 기존 임시 이름 2단계 방식 vs plan_renames() 한 번에.
+
+임시 폴더에 파일을 만들고 같은 키워드로 두 번 바꾼다. 두 번째는 이미 원하는
+이름인 상태라 새 방식은 아무것도 하지 않아야 한다.
+
+    python benchmarks/bench_rename.py [--files 50000]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from file_utilities_core.natsort import natural_sort_key
+from file_utilities_core.renamer import rename_files
+
+
+def two_pass_rename(file_paths, keyword, start=1):
+    """이전 버전의 rename_files (모든 파일을 임시 이름으로 한 번, 최종 이름으로 한 번)."""
+    temp_file_list = []
+    for i, file_path in enumerate(file_paths, start=1):
+        dir_name, old_file_name = os.path.split(file_path)
+        file_extension = os.path.splitext(old_file_name)[1]
+        temp_path = os.path.join(dir_name, f"A{random.randint(1000, 9999)}temp{str(i).zfill(2)}{file_extension}")
+        os.rename(file_path, temp_path)
+        temp_file_list.append((temp_path, file_extension))
+    current_files = set(file_paths)
+    updated_file_list = []
+    number = start
+    for temp_path, file_extension in temp_file_list:
+        new_path = os.path.join(os.path.dirname(temp_path), f"{keyword}{str(number).zfill(2)}{file_extension}")
+        while os.path.exists(new_path) and new_path not in current_files:
+            number += 1
+            new_path = os.path.join(os.path.dirname(temp_path), f"{keyword}{str(number).zfill(2)}{file_extension}")
+        os.rename(temp_path, new_path)
+        updated_file_list.append(new_path)
+        current_files.add(new_path)
+        number += 1
+    return sorted(updated_file_list, key=natural_sort_key)
+
+
+def run(label, rename, folder):
+    files = sorted((os.path.join(folder, name) for name in os.listdir(folder)), key=natural_sort_key)
+    start = time.perf_counter()
+    first = rename(files, 'IMG_')
+    middle = time.perf_counter()
+    rename(first, 'IMG_')
+    end = time.perf_counter()
+    print(f"  {label:<12} first {middle - start:7.2f} s   again {end - middle:7.2f} s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=50000)
+    args = parser.parse_args()
+
+    print(f"{args.files} files")
+    with tempfile.TemporaryDirectory() as journal_dir:
+        journal_path = os.path.join(journal_dir, 'rename_journal.jsonl')
+        journaled = lambda file_paths, keyword: rename_files(file_paths, keyword, journal_path=journal_path)
+        for label, rename in (("two-pass", two_pass_rename), ("planner", rename_files), ("+ journal", journaled)):
+            with tempfile.TemporaryDirectory() as tmp:
+                for i in range(args.files):
+                    open(os.path.join(tmp, f"photo {i}.jpg"), 'wb').close()
+                run(label, rename, tmp)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""이름 템플릿 비교: 토큰별 메타데이터 수집 시간 (스레드 1개 vs 여러 개).
+
+임시 폴더에 EXIF가 있는 작은 JPEG을 만들고 plan_renames()만 실행한다 (이름은
+바꾸지 않음). 번호만 쓰는 템플릿은 파일을 열지 않아야 한다.
+
+    python benchmarks/bench_rename_template.py [--files 10000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+
+from file_utilities_core.renamer import plan_renames
+
+TEMPLATES = ["img", "{stem}_{mtime:%Y%m%d}", "{width}x{height}_{n:04}", "{taken:%Y-%m-%d}_{n:04}", "{hash:12}"]
+
+
+def make_photos(folder, count):
+    img = Image.new('RGB', (64, 48), (120, 80, 40))
+    exif = Image.Exif()
+    paths = []
+    for i in range(count):
+        exif.get_ifd(0x8769)[36867] = f"2023:05:{1 + i % 28:02d} 10:{i % 60:02d}:00"
+        path = os.path.join(folder, f"DSC{i:05d}.jpg")
+        img.save(path, exif=exif)
+        paths.append(path)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_photos(tmp, args.files)
+        print(f"{args.files} photos")
+        for template in TEMPLATES:
+            timings = []
+            for workers in (1, 16):
+                start = time.perf_counter()
+                plan_renames(paths, template, workers=workers)
+                timings.append(time.perf_counter() - start)
+            print(f"  {template:<26} 1 thread {timings[0]:6.2f} s   16 threads {timings[1]:6.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""결과 캐시로 같은 배치를 다시 리사이즈할 때의 시간 비교.
+
+    python benchmarks/bench_resize_cache.py [--files 5000 --width 320 --height 240 --workers 1]
+
+처음 실행(캐시 채우기), 그대로 다시 실행, 파일 1%를 추가하고 다시 실행한 시간을
+원본 파일 상태만 읽는 시간(scan)과 비교한다. 해시와 수정 시각 키를 모두 잰다.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image, ImageDraw
+
+from file_utilities_core.resize import resize_batch
+from file_utilities_core.resize_cache import ResizeCache
+
+
+def make_images(directory, start, count, width, height):
+    paths = []
+    for i in range(start, start + count):
+        img = Image.new('RGB', (width, height), (i % 256, (i // 256) % 256, 120))
+        ImageDraw.Draw(img).ellipse((i % width, 10, i % width + 60, 70), fill=(250, 220, 0))
+        path = os.path.join(directory, f'{i:06d}.jpg')
+        img.save(path, quality=85)
+        paths.append(path)
+    return paths
+
+
+def run(paths, cache_dir, workers, hash_contents):
+    cache = ResizeCache(cache_dir, hash_contents=hash_contents)
+    start = time.perf_counter()
+    cached = 0
+    try:
+        for index, file_path, encoded, error in resize_batch(paths, (1, 1), workers, cache, max_size=128):
+            if error:
+                raise RuntimeError(error)
+            cached += encoded.cached
+    finally:
+        cache.close()
+    return time.perf_counter() - start, cached
+
+
+def scan(paths):
+    start = time.perf_counter()
+    for path in paths:
+        os.stat(path)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--files', type=int, default=5000)
+    parser.add_argument('--width', type=int, default=320)
+    parser.add_argument('--height', type=int, default=240)
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_images(tmp, 0, args.files, args.width, args.height)
+        added = make_images(tmp, args.files, max(1, args.files // 100), args.width, args.height)
+        print(f"{args.files} JPEGs of {args.width}x{args.height}, max size 128, {args.workers} worker(s)")
+        print(f"  scan (stat only)        {scan(paths):7.2f} s")
+        for hash_contents in (True, False):
+            cache_dir = os.path.join(tmp, f'cache-{hash_contents}')
+            label = 'content hash' if hash_contents else 'size+mtime'
+            elapsed, cached = run(paths, cache_dir, args.workers, hash_contents)
+            print(f"  {label:<12} first      {elapsed:7.2f} s  ({cached} from cache)")
+            elapsed, cached = run(paths, cache_dir, args.workers, hash_contents)
+            print(f"  {label:<12} again      {elapsed:7.2f} s  ({cached} from cache)")
+            elapsed, cached = run(paths + added, cache_dir, args.workers, hash_contents)
+            print(f"  {label:<12} +{len(added)} files {elapsed:7.2f} s  ({cached} from cache)")
+
+
+if __name__ == '__main__':
+    main()
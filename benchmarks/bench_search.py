@@ -0,0 +1,74 @@
+"""스니펫 검색 비교: 모든 스니펫을 훑는 부분 문자열 검색 vs search.SearchIndex.
+
+    python benchmarks/bench_search.py [--snippets 50000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from file_utilities_core.search import SearchIndex
+from file_utilities_core.snippets import new_snippet
+
+QUERIES = ["meeting", "addr", "thnks", "invoice 2024", "hello wrld", "a", "zzzz"]
+
+
+def make_words(rng, count):
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = {"meeting", "address", "thanks", "invoice", "2024", "hello", "world", "regards"}
+    while len(words) < count:
+        words.add("".join(rng.choice(letters) for _ in range(rng.randint(3, 10))))
+    return sorted(words)
+
+
+def make_snippets(count, rng):
+    words = make_words(rng, 30000)
+    # 자주 쓰는 단어가 많이 나오도록 (Zipf 비슷하게)
+    weights = [1 / (rank + 1) for rank in range(len(words))]
+    rng.shuffle(weights)
+    snippets = []
+    for i in range(count):
+        title = " ".join(rng.choices(words, weights, k=rng.randint(0, 4)))
+        text = " ".join(rng.choices(words, weights, k=rng.randint(5, 60)))
+        snippets.append(new_snippet(text, title))
+    return snippets
+
+
+def scan(snippets, query):
+    words = query.casefold().split()
+    return [snippet['id'] for snippet in snippets
+            if all(word in (snippet['title'] + ' ' + snippet['text']).casefold() for word in words)]
+
+
+def timed(label, func, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<40} {elapsed * 1000:9.2f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--snippets', type=int, default=50000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    snippets = make_snippets(args.snippets, rng)
+    print(f"{args.snippets} snippets")
+
+    index = timed("build index", lambda: SearchIndex(snippets))
+    edited = dict(snippets[0], title="weekly meeting notes")
+    timed("update one snippet", lambda: index.update(edited), repeat=100)
+    for query in QUERIES:
+        found = timed(f"scan: {query!r}", lambda: scan(snippets, query))
+        ranked = timed(f"index: {query!r}", lambda: index.search(query), repeat=10)
+        print(f"    {len(found)} substring matches, {len(ranked)} ranked matches")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""스니펫 저장 비교: 키 입력마다 text_data.json 전체 다시 쓰기 vs SQLite 행 갱신.
+
+    python benchmarks/bench_snippets.py [--snippets 5000 --keystrokes 200]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from file_utilities_core.snippets import SnippetStore, SnippetWriter, new_snippet, save_snippets
+
+
+def timed(label, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {elapsed:7.3f} s")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--snippets', type=int, default=5000)
+    parser.add_argument('--keystrokes', type=int, default=200)
+    args = parser.parse_args()
+
+    snippets = [new_snippet(f"snippet {i} " + "lorem ipsum " * 20, f"title {i}") for i in range(args.snippets)]
+    edited = snippets[args.snippets // 2]
+    print(f"{args.snippets} snippets, typing a {args.keystrokes}-character title into one of them")
+
+    with tempfile.TemporaryDirectory() as folder:
+        json_path = os.path.join(folder, 'text_data.json')
+
+        def json_rewrite():
+            for i in range(args.keystrokes):
+                edited['title'] = 'x' * i
+                save_snippets(snippets, json_path)
+
+        timed("json: rewrite every keystroke", json_rewrite)
+
+        store = SnippetStore(os.path.join(folder, 'snippets.db'), json_path=json_path)
+        position = args.snippets // 2
+
+        def sqlite_upsert():
+            for i in range(args.keystrokes):
+                edited['title'] = 'x' * i
+                store.save(edited, position)
+
+        timed("sqlite: upsert every keystroke", sqlite_upsert)
+
+        writer = SnippetWriter(store, delay=0.05)
+
+        def debounced():
+            for i in range(args.keystrokes):
+                edited['title'] = 'x' * i
+                writer.save(edited, position)
+
+        timed("sqlite + writer: UI thread cost", debounced)
+        timed("sqlite + writer: flush on exit", writer.close)
+        assert store.load()[position]['title'] == 'x' * (args.keystrokes - 1)
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
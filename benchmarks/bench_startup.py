@@ -0,0 +1,91 @@
+"""File Utilities 시작 시간 측정: import 시간, 첫 화면 표시까지의 시간, 탭별 생성 시간.
+
+매번 새 인터프리터를 띄워 측정한다. --max-import-ms / --max-paint-ms 를 주면
+기준을 넘을 때 종료 코드 1을 돌려주므로 회귀 검사에 쓸 수 있다.
+
+    python benchmarks/bench_startup.py [--runs 5] [--max-paint-ms 800]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r"""
+import json, sys, time
+start = time.perf_counter()
+import file_utilities
+imported = time.perf_counter()
+
+from PyQt5.QtCore import QEvent, QObject, QTimer
+from PyQt5.QtWidgets import QApplication
+
+result = {'import': imported - start, 'modules': sorted(m for m in ('PIL', 'keyboard') if m in sys.modules)}
+
+class PaintWatcher(QObject):
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and 'paint' not in result:
+            result['paint'] = time.perf_counter() - start
+            QTimer.singleShot(0, openTabs)
+        return False
+
+def openTabs():
+    for index in range(len(file_utilities.TABS)):
+        tab_start = time.perf_counter()
+        window.openTab(index)
+        result[f'tab{index}'] = time.perf_counter() - tab_start
+    print(json.dumps(result))
+    app.quit()
+
+app = QApplication(sys.argv)
+window = file_utilities.MainApp()
+watcher = PaintWatcher()
+window.installEventFilter(watcher)
+window.show()
+app.exec_()
+"""
+
+
+def run_once():
+    env = dict(os.environ)
+    if sys.platform.startswith('linux') and not env.get('DISPLAY'):
+        env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    output = subprocess.run([sys.executable, '-c', CHILD], cwd=ROOT, env=env,
+                            capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--max-import-ms', type=float, default=None)
+    parser.add_argument('--max-paint-ms', type=float, default=None)
+    args = parser.parse_args()
+
+    runs = [run_once() for _ in range(args.runs)]
+    sys.path.insert(0, ROOT)
+    from file_utilities import TABS
+
+    def median_ms(key):
+        return statistics.median(run[key] for run in runs) * 1000
+
+    import_ms = median_ms('import')
+    paint_ms = median_ms('paint')
+    print(f"median of {args.runs} runs")
+    print(f"  import file_utilities   {import_ms:8.1f} ms")
+    print(f"  first paint             {paint_ms:8.1f} ms")
+    for index, (module_name, class_name, icon, title) in enumerate(TABS):
+        print(f"  open tab {title:<14} {median_ms(f'tab{index}'):8.1f} ms")
+    if runs[0]['modules']:
+        print(f"  warning: imported at startup: {', '.join(runs[0]['modules'])}")
+
+    failed = ((args.max_import_ms is not None and import_ms > args.max_import_ms)
+              or (args.max_paint_ms is not None and paint_ms > args.max_paint_ms))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
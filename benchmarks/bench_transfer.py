@@ -0,0 +1,91 @@
+"""전송 엔진 비교: 파일마다 shutil.copy2 vs TransferEngine (동시 전송 수별).
+
+임시 폴더에 작은 파일과 큰 파일이 섞인 트리를 만들어 복사한다. --target 으로
+다른 드라이브(네트워크 드라이브 등)를 지정하면 그쪽으로 복사한다.
+
+    python benchmarks/bench_transfer.py [--small 2000 --large 4 --large-mb 64]
+"""
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from file_utilities_core.transfer import TransferEngine, device_of, is_rotational
+
+
+def make_tree(root, small, small_kb, large, large_mb):
+    files = []
+    chunk = os.urandom(1024 * 1024)
+    for i in range(small):
+        folder = os.path.join(root, f"d{i % 20}")
+        os.makedirs(folder, exist_ok=True)
+        path = os.path.join(folder, f"small_{i}.bin")
+        with open(path, 'wb') as f:
+            f.write(chunk[:small_kb * 1024])
+        files.append(path)
+    for i in range(large):
+        path = os.path.join(root, f"large_{i}.bin")
+        with open(path, 'wb') as f:
+            for _ in range(large_mb):
+                f.write(chunk)
+        files.append(path)
+    return files
+
+
+def run(label, files, target, copy_all, total_bytes):
+    os.makedirs(target)
+    start = time.perf_counter()
+    copy_all(files, target)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<22} {elapsed:7.2f} s  {total_bytes / elapsed / 2 ** 20:8.1f} MB/s")
+    shutil.rmtree(target)
+
+
+def sequential(files, target):
+    for i, path in enumerate(files):
+        shutil.copy2(path, os.path.join(target, f"{i}_{os.path.basename(path)}"))
+
+
+def engine_copy(workers, serialize_rotational=True):
+    def copy_all(files, target):
+        with TransferEngine(workers, serialize_rotational=serialize_rotational) as engine:
+            futures = [engine.submit(path, os.path.join(target, f"{i}_{os.path.basename(path)}"))
+                       for i, path in enumerate(files)]
+        for future in futures:
+            future.result()
+    return copy_all
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--small', type=int, default=2000)
+    parser.add_argument('--small-kb', type=int, default=32)
+    parser.add_argument('--large', type=int, default=4)
+    parser.add_argument('--large-mb', type=int, default=64)
+    parser.add_argument('--target', help="folder to copy into (default: the temp folder)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, tempfile.TemporaryDirectory(dir=args.target) as target_root:
+        files = make_tree(os.path.join(tmp, 'src'), args.small, args.small_kb, args.large, args.large_mb)
+        total_bytes = sum(os.path.getsize(path) for path in files)
+        rotational = is_rotational(device_of(target_root))
+        print(f"{args.small} x {args.small_kb} KB + {args.large} x {args.large_mb} MB "
+              f"({total_bytes / 2 ** 20:.0f} MB), target rotational: {rotational}")
+
+        run("shutil.copy2", files, os.path.join(target_root, 'seq'), sequential, total_bytes)
+        for workers in (1, 4, 8):
+            run(f"TransferEngine({workers})", files, os.path.join(target_root, f"engine{workers}"),
+                engine_copy(workers), total_bytes)
+        if rotational:
+            # 장치 판별을 끄고 강제로 동시에 복사했을 때와 비교
+            for workers in (4, 8):
+                run(f"  forced parallel ({workers})", files, os.path.join(target_root, f"forced{workers}"),
+                    engine_copy(workers, serialize_rotational=False), total_bytes)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,235 +1,315 @@
-import json
-import uuid
-from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QPushButton,
-                             QTextEdit, QLabel, QScrollArea)
-from PyQt5.QtCore import Qt, QEvent
-from PyQt5.QtGui import QFontMetrics, QFont
-
-from .text_button import TextButton
-from .text_expander import TextExpander
-
-class Copytxt(QWidget):
-    def __init__(self):
-        super().__init__()
-        self.activeExpander = None
-        self.initUI()
-        self.loadData()
-
-    def initUI(self):
-        self.setWindowTitle('Copy the txt')
-        self.setGeometry(100, 100, 800, 600)
-
-        font = QFont()
-        font.setPointSize(12)
-        QApplication.setFont(font)
-
-        self.mainLayout = QVBoxLayout()
-        self.setLayout(self.mainLayout)
-
-        self.setStyleSheet("""
-            QWidget {
-                font-size: 20px;
-            }
-            QPushButton {
-                background-color: #007AFF;
-                color: white;
-                border-radius: 5px;
-                padding: 14px;
-                margin: 1px;
-                text-align: left;
-            }
-            QPushButton:hover {
-                background-color: #005BCB;
-            }
-            QPushButton#addButton {
-                background-color: #4CAF50;
-                font-weight: bold;
-                text-align: center;
-            }
-            QPushButton#addButton:hover {
-                background-color: #43A047;
-            }
-            QTextEdit {
-                border: 1px solid #007AFF;
-                border-radius: 5px;
-                padding: 5px;
-                margin-bottom: 10px;
-            }
-            QLabel {
-                color: #007AFF;
-                margin: 5px;
-            }
-        """)
-
-        self.textInput = QTextEdit(self)
-        self.textInput.setPlaceholderText('Enter text here...')
-        font = self.textInput.font()
-        fontMetrics = QFontMetrics(font)
-        lineHeight = fontMetrics.lineSpacing()
-        self.textInput.setFixedHeight(lineHeight * 4 + 10)
-        self.mainLayout.addWidget(self.textInput)
-
-        self.addButton = QPushButton('Add', self)
-        self.addButton.setObjectName('addButton')
-        self.addButton.clicked.connect(self.onAddButtonClicked)
-        self.mainLayout.addWidget(self.addButton)
-
-        self.scrollArea = QScrollArea(self)
-        self.scrollArea.setWidgetResizable(True)
-        self.scrollWidget = QWidget()
-        self.scrollLayout = QVBoxLayout(self.scrollWidget)
-        self.scrollLayout.setAlignment(Qt.AlignTop)
-        self.scrollLayout.setSpacing(3)
-        self.scrollArea.setWidget(self.scrollWidget)
-        self.mainLayout.addWidget(self.scrollArea)
-
-        self.scrollWidget.setAcceptDrops(True)
-
-        self.statusLabel = QLabel('', self)
-        self.mainLayout.addWidget(self.statusLabel)
-
-        self.installEventFilter(self)
-
-    def getWidgetIndex(self, widget):
-        return self.scrollLayout.indexOf(widget)
-
-    def eventFilter(self, source, event):
-        if event.type() == QEvent.User + 1:  # 사용자 정의 이벤트를 확인합니다.
-            # CustomEvent의 text 속성을 사용하여 copyTextToClipboard 메서드를 호출합니다.
-            self.copyTextToClipboard(event.text)
-            return True
-        return super().eventFilter(source, event)
-
-    def onAddButtonClicked(self):
-        text = self.textInput.toPlainText()
-        if text:
-            self.addTextButton(text)
-            self.textInput.clear()
-
-    def addTextButton(self, text, title=None, id=None, shortcut=None):
-        button = TextButton(text, self, self.scrollWidget)
-        if id is not None:
-            button.id = id  # 고유 ID 할당
-        else:
-            button.id = str(uuid.uuid4())  # 새 위젯의 경우 새로운 고유 ID 생성
-        if title:
-            button.updateTitle(title)
-        if shortcut:
-            button.shortcut = shortcut  # 단축키 할당
-            button.registerShortcut(shortcut)  # 단축키 등록
-        self.scrollLayout.addWidget(button)
-        self.saveData()
-
-    def copyTextToClipboard(self, text):
-        singleLineText = text.replace('\n', ' ')
-        shortenedText = singleLineText if len(singleLineText) <= 20 else singleLineText[:17] + '...'
-        QApplication.clipboard().setText(text)
-        self.updateStatusLabel(f'"{shortenedText}" copied to clipboard.')
-        self.saveData()
-
-    def toggleExpander(self, text, button):
-        if button.expander and button.expander.isVisible():
-            button.expander.close()
-            button.expander = None
-            button.expandButton.setText('▶')
-        else:
-            if self.activeExpander:
-                self.activeExpander.close()
-            button.expander = TextExpander(text, button)
-            button.expander.adjustPosition(self)
-            button.expander.show()
-            button.expandButton.setText('▼')
-            self.activeExpander = button.expander
-        self.saveData()
-
-    def dragEnterEvent(self, event):
-        event.accept()
-
-    def dropEvent(self, event):
-        # 드래그된 위젯의 ID 추출
-        draggedId = event.mimeData().text()
-        draggedIndex = self.findIndexById(draggedId)
-        
-        # 드롭 위치에 있는 위젯의 인덱스 찾기
-        dropPosition = event.pos()
-        dropWidget = self.scrollArea.widget().childAt(dropPosition)
-        dropIndex = self.findIndexByWidget(dropWidget)
-        
-        # 위젯 순서 변경
-        if 0 <= draggedIndex < self.scrollLayout.count() and 0 <= dropIndex < self.scrollLayout.count():
-            self.reorderWidgets(draggedIndex, dropIndex)
-            event.acceptProposedAction()
-
-    def reorderWidgets(self, sourceIndex, targetIndex):
-        # 위젯 재배치
-        widgetToMove = self.scrollLayout.takeAt(sourceIndex).widget()
-        # 드래그된 위젯을 제거한 후의 인덱스 변경 고려
-        if sourceIndex < targetIndex:
-            targetIndex -= 1
-        self.scrollLayout.insertWidget(targetIndex, widgetToMove)
-        # 변경 사항 저장
-        self.saveData()
-
-
-    def findIndexById(self, id):
-        for i in range(self.scrollLayout.count()):
-            widget = self.scrollLayout.itemAt(i).widget()
-            if hasattr(widget, 'id') and widget.id == id:
-                return i
-        return -1
-
-    def findIndexByWidget(self, widget):
-        if widget:
-            return self.scrollLayout.indexOf(widget.parentWidget())
-        return -1
-    
-    def findButtonById(self, id):
-        """주어진 ID를 가진 TextButton을 찾아 반환"""
-        for i in range(self.scrollLayout.count()):
-            widget = self.scrollLayout.itemAt(i).widget()
-            if hasattr(widget, 'id') and widget.id == id:
-                return widget
-        return None
-
-    def moveEvent(self, event):
-        super().moveEvent(event)
-        if self.activeExpander and self.activeExpander.isVisible():
-            self.activeExpander.adjustPosition(self)
-
-    def updateStatusLabel(self, message):
-        self.statusLabel.setText(message)
-    
-    def saveData(self):
-        data = []
-        for i in range(self.scrollLayout.count()):
-            widget = self.scrollLayout.itemAt(i).widget()
-            if widget and isinstance(widget, TextButton):
-                data.append({
-                    'id': widget.id,  # 고유 ID도 저장
-                    'text': widget.originalText,
-                    'title': widget.title,
-                    'shortcut': widget.shortcut  # 단축키 정보 저장
-                })
-        with open('text_data.json', 'w') as outfile:
-            json.dump(data, outfile, indent=4)
-
-    def loadData(self):
-        try:
-            with open('text_data.json', 'r') as infile:
-                data = json.load(infile)
-                for item in data:
-                    # addTextButton 메서드 호출 시 고유 ID도 전달
-                    self.addTextButton(item['text'], item.get('title'), item.get('id'), item.get('shortcut'))
-        except FileNotFoundError:
-            print("Data file not found. Starting with an empty clipboard.")
-        except json.JSONDecodeError:
-            print("Error decoding JSON from file.")
-
-
-    def closeEvent(self, event):
-        self.saveData()
-        for i in range(self.scrollLayout.count()):
-            widget = self.scrollLayout.itemAt(i).widget()
-            if widget and isinstance(widget, TextButton) and widget.expander:
-                widget.expander.close()
+import sqlite3
+from PyQt5.QtWidgets import (QApplication, QWidget, QVBoxLayout, QPushButton,
+                             QTextEdit, QLabel, QLineEdit)
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtGui import QFontMetrics, QFont
+
+from file_utilities_core.snippets import SnippetStore, SnippetWriter, new_snippet
+
+from .hotkeys import HotkeyEvent, HotkeyManager
+from .shortcut_dialog import ShortcutDialog
+from .search_worker import SearchWorker
+from .snippet_model import SearchResultModel, SnippetListModel
+from .snippet_view import SnippetDelegate, SnippetListView
+from .text_expander import TextExpander
+
+class Copytxt(QWidget):
+    # 기록 스레드에서 난 저장 오류를 GUI 스레드로 넘긴다
+    saveFailed = pyqtSignal(str)
+
+    def __init__(self):
+        super().__init__()
+        self.activeExpander = None
+        self.store = None
+        self.writer = None
+        # 스니펫 id -> 저장소의 위치. 행 순서대로 커지지만 지운 자리는 비어 있다
+        self.positions = {}
+        self.hotkeys = HotkeyManager(self)
+        self.initUI()
+        self.loadData()
+        self.searchWorker.start()
+        # 탭으로 쓰일 때는 closeEvent가 오지 않으므로 종료할 때 남은 변경을 기록한다
+        QApplication.instance().aboutToQuit.connect(self.closeStore)
+        QApplication.instance().aboutToQuit.connect(self.searchWorker.stop)
+        QApplication.instance().aboutToQuit.connect(self.hotkeys.close)
+
+    def initUI(self):
+        self.setWindowTitle('Copy the txt')
+        self.setGeometry(100, 100, 800, 600)
+
+        font = QFont()
+        font.setPointSize(12)
+        QApplication.setFont(font)
+
+        self.mainLayout = QVBoxLayout()
+        self.setLayout(self.mainLayout)
+
+        self.setStyleSheet("""
+            QWidget {
+                font-size: 20px;
+            }
+            QPushButton {
+                background-color: #007AFF;
+                color: white;
+                border-radius: 5px;
+                padding: 14px;
+                margin: 1px;
+                text-align: left;
+            }
+            QPushButton:hover {
+                background-color: #005BCB;
+            }
+            QPushButton#addButton {
+                background-color: #4CAF50;
+                font-weight: bold;
+                text-align: center;
+            }
+            QPushButton#addButton:hover {
+                background-color: #43A047;
+            }
+            QTextEdit {
+                border: 1px solid #007AFF;
+                border-radius: 5px;
+                padding: 5px;
+                margin-bottom: 10px;
+            }
+            QLabel {
+                color: #007AFF;
+                margin: 5px;
+            }
+        """)
+
+        self.textInput = QTextEdit(self)
+        self.textInput.setPlaceholderText('Enter text here...')
+        font = self.textInput.font()
+        fontMetrics = QFontMetrics(font)
+        lineHeight = fontMetrics.lineSpacing()
+        self.textInput.setFixedHeight(lineHeight * 4 + 10)
+        self.mainLayout.addWidget(self.textInput)
+
+        self.addButton = QPushButton('Add', self)
+        self.addButton.setObjectName('addButton')
+        self.addButton.clicked.connect(self.onAddButtonClicked)
+        self.mainLayout.addWidget(self.addButton)
+
+        self.searchEdit = QLineEdit(self)
+        self.searchEdit.setPlaceholderText('Search...')
+        self.searchEdit.setClearButtonEnabled(True)
+        self.searchEdit.textChanged.connect(self.onSearchTextChanged)
+        self.mainLayout.addWidget(self.searchEdit)
+
+        self.model = SnippetListModel(self)
+        self.resultModel = SearchResultModel(self.model, self)
+        self.searchWorker = SearchWorker(self)
+        self.searchWorker.resultsReady.connect(self.showSearchResults)
+        self.delegate = SnippetDelegate(self)
+        self.delegate.copyClicked.connect(self.copySnippet)
+        self.delegate.deleteClicked.connect(self.deleteSnippet)
+        self.delegate.expandClicked.connect(self.toggleExpander)
+        self.delegate.shortcutClicked.connect(self.setShortcut)
+        self.listView = SnippetListView(self)
+        self.listView.setModel(self.model)
+        self.listView.setItemDelegate(self.delegate)
+        self.listView.moveRequested.connect(self.moveSnippet)
+        self.mainLayout.addWidget(self.listView)
+
+        self.statusLabel = QLabel('', self)
+        self.mainLayout.addWidget(self.statusLabel)
+
+        self.installEventFilter(self)
+
+    def eventFilter(self, source, event):
+        if event.type() == HotkeyEvent.TYPE:
+            # 그 사이 여러 번 눌렸으면 마지막 것만 클립보드에 남는다
+            pending = self.hotkeys.takePending()
+            if pending:
+                self.copySnippet(pending[-1])
+            return True
+        return super().eventFilter(source, event)
+
+    def onAddButtonClicked(self):
+        text = self.textInput.toPlainText()
+        if text:
+            self.addSnippet(text)
+            self.textInput.clear()
+
+    def addSnippet(self, text, title=None):
+        snippet = new_snippet(text, title)
+        last = self.model.rowCount() - 1
+        self.positions[snippet['id']] = self.positions[self.model.snippet(last)['id']] + 1 if last >= 0 else 0
+        self.model.addSnippet(snippet)
+        self.listView.scrollToBottom()
+        self.saveSnippet(snippet['id'])
+
+    def copySnippet(self, id):
+        row = self.model.rowOf(id)
+        if row >= 0:
+            self.copyTextToClipboard(self.model.snippet(row)['text'])
+
+    def copyTextToClipboard(self, text):
+        singleLineText = text.replace('\n', ' ')
+        shortenedText = singleLineText if len(singleLineText) <= 20 else singleLineText[:17] + '...'
+        QApplication.clipboard().setText(text)
+        self.updateStatusLabel(f'"{shortenedText}" copied to clipboard.')
+
+    def toggleExpander(self, id):
+        expanded = self.activeExpander is not None and self.activeExpander.snippetId == id
+        if self.activeExpander:
+            self.activeExpander.close()
+        if not expanded:
+            snippet = self.model.snippet(self.model.rowOf(id))
+            self.activeExpander = TextExpander(snippet['text'], snippet['title'], id, self, parent=self)
+            self.activeExpander.adjustPosition(self)
+            self.activeExpander.show()
+            self.delegate.expandedId = id
+            self.listView.viewport().update()
+
+    def expanderClosed(self, expander):
+        if expander is self.activeExpander:
+            self.activeExpander = None
+            self.delegate.expandedId = None
+            self.listView.viewport().update()
+
+    def updateTitle(self, id, title):
+        if self.model.updateSnippet(id, title=title) >= 0:
+            self.saveSnippet(id)
+
+    def updateText(self, id, text):
+        if self.model.updateSnippet(id, text=text) >= 0:
+            self.saveSnippet(id)
+
+    def setShortcut(self, id):
+        dialog = ShortcutDialog(self)
+        dialog.shortcutSet.connect(lambda shortcut: self.registerShortcut(id, shortcut))
+        dialog.exec_()
+
+    def registerShortcut(self, id, shortcut, save=True):
+        # 이전에 설정된 단축키 제거
+        self.unregisterShortcut(id)
+
+        if shortcut:
+            try:
+                otherId = self.hotkeys.register(shortcut, id)
+            except ValueError:
+                self.updateStatusLabel(f'"{shortcut}" cannot be used as a shortcut.')
+                shortcut = None
+            else:
+                # 다른 스니펫이 쓰던 단축키면 그쪽에서 제거
+                if otherId is not None:
+                    self.removeShortcut(otherId)
+        self.model.updateSnippet(id, shortcut=shortcut or None)
+        if save:
+            self.saveSnippet(id)
+
+    def unregisterShortcut(self, id):
+        row = self.model.rowOf(id)
+        shortcut = self.model.snippet(row)['shortcut'] if row >= 0 else None
+        if shortcut and self.hotkeys.owner(shortcut) == id:
+            self.hotkeys.unregister(shortcut)
+
+    def removeShortcut(self, id):
+        self.unregisterShortcut(id)
+        if self.model.updateSnippet(id, shortcut=None) >= 0:
+            self.saveSnippet(id)
+
+    def moveSnippet(self, id, targetRow):
+        if self.listView.model() is not self.model:  # 검색 결과에서는 순서를 바꾸지 않는다
+            return
+        moved = self.model.moveSnippet(self.model.rowOf(id), targetRow)
+        if moved:
+            # 사이에 있던 스니펫들의 위치만 저장
+            self.savePositions(*moved)
+            self.searchWorker.setOrder(snippet['id'] for snippet in self.model.snippets())
+
+    def onSearchTextChanged(self, text):
+        if text.strip():
+            self.searchWorker.search(text)
+        else:
+            self.searchWorker.search('')
+            self.listView.setModel(self.model)
+            self.listView.setDragEnabled(True)
+            self.updateStatusLabel('')
+
+    def showSearchResults(self, query, ids):
+        if query != self.searchEdit.text():  # 그 사이에 검색어가 바뀌었으면 버린다
+            return
+        self.resultModel.setIds(ids)
+        if self.listView.model() is not self.resultModel:
+            self.listView.setModel(self.resultModel)
+            self.listView.setDragEnabled(False)
+        self.updateStatusLabel(f'{len(ids)} snippets found.')
+
+    def moveEvent(self, event):
+        super().moveEvent(event)
+        if self.activeExpander and self.activeExpander.isVisible():
+            self.activeExpander.adjustPosition(self)
+
+    def updateStatusLabel(self, message):
+        self.statusLabel.setText(message)
+
+    def showSaveError(self, message):
+        # 변경은 writer에 남아 있어 다음 저장 때 다시 기록된다
+        self.updateStatusLabel(f'Could not save snippets ({message}). Changes will be retried.')
+
+    def saveSnippet(self, id):
+        """스니펫 하나를 저장 (실제 기록은 writer가 모아서 백그라운드에서 한다)."""
+        row = self.model.rowOf(id)
+        if row < 0:
+            return
+        self.searchWorker.updateSnippet(self.model.snippet(row))
+        if self.writer is not None:
+            self.writer.save(self.model.snippet(row), self.positions.get(id))
+
+    def savePositions(self, start, end):
+        # 구간 안에서 순서만 바뀌었으므로 그 구간이 쓰던 위치들을 새 순서대로 다시 나눠 준다
+        ids = [self.model.snippet(row)['id'] for row in range(start, min(end, self.model.rowCount()))]
+        positions = dict(zip(ids, sorted(self.positions[id] for id in ids)))
+        self.positions.update(positions)
+        if self.writer is not None:
+            self.writer.set_positions(positions)
+
+    def deleteSnippet(self, id):
+        if self.activeExpander and self.activeExpander.snippetId == id:
+            self.activeExpander.close()
+        self.unregisterShortcut(id)
+        self.delegate.forget(id)
+        row = self.model.removeSnippet(id)
+        if row < 0:
+            return
+        self.searchWorker.removeSnippet(id)
+        # 뒤의 스니펫들의 위치는 그대로 둔다 (불러올 때 위치 순서로 정렬한다)
+        self.positions.pop(id, None)
+        if self.writer is not None:
+            self.writer.delete(id)
+
+    def loadData(self):
+        try:
+            self.store = SnippetStore()
+            snippets = self.store.load()
+            self.positions = self.store.positions()
+        except sqlite3.Error as e:
+            print(f"Error opening the snippet database: {e}")
+            self.store = None
+            return
+        self.model.setSnippets(snippets)
+        self.searchWorker.setSnippets(snippets)
+        for snippet in snippets:
+            if snippet['shortcut']:
+                self.registerShortcut(snippet['id'], snippet['shortcut'], save=False)
+        self.saveFailed.connect(self.showSaveError)
+        self.writer = SnippetWriter(self.store, on_error=lambda e: self.saveFailed.emit(str(e)))
+
+    def closeStore(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+        if self.store is not None:
+            self.store.close()
+            self.store = None
+
+    def closeEvent(self, event):
+        if self.writer is not None:
+            self.writer.flush()
+        if self.activeExpander:
+            self.activeExpander.close()
         super().closeEvent(event)
\ No newline at end of file
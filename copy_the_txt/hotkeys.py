@@ -0,0 +1,135 @@
+import threading
+
+from PyQt5.QtCore import QEvent
+from PyQt5.QtWidgets import QApplication
+
+# 단축키 문자열(ShortcutDialog 형식)과 keyboard 이벤트의 수정자 이름 -> 공통 이름
+MODIFIERS = {
+    'shift': 'shift', 'left shift': 'shift', 'right shift': 'shift',
+    'ctrl': 'ctrl', 'left ctrl': 'ctrl', 'right ctrl': 'ctrl', 'control': 'ctrl',
+    'alt': 'alt', 'left alt': 'alt', 'right alt': 'alt', 'alt gr': 'alt',
+    'meta': 'windows', 'windows': 'windows', 'left windows': 'windows', 'right windows': 'windows',
+    'command': 'windows',
+}
+
+
+class HotkeyEvent(QEvent):
+    """눌린 단축키가 있다는 알림. 스니펫 ID는 HotkeyManager.takePending()으로 가져간다."""
+    TYPE = QEvent.Type(QEvent.User + 1)
+
+    def __init__(self):
+        super().__init__(self.TYPE)
+
+
+def parseChord(chord):
+    """'Shift+Ctrl+A' -> (frozenset({'shift', 'ctrl'}), 'a'). 수정자 순서와 대소문자는 무시."""
+    if chord.endswith('++'):
+        modifiers, key = chord[:-2], '+'
+    else:
+        modifiers, _, key = chord.rpartition('+')
+    names = [name.strip().lower() for name in modifiers.split('+') if name.strip()]
+    unknown = [name for name in names if name not in MODIFIERS]
+    if unknown or not key.strip():
+        raise ValueError(f"invalid shortcut: {chord!r}")
+    return frozenset(MODIFIERS[name] for name in names), key.strip().lower()
+
+
+class HotkeyManager:
+    """전역 단축키를 keyboard 훅 하나로 처리.
+
+    단축키마다 keyboard.add_hotkey를 부르지 않고, 훅 하나가 눌린 수정자를 기억했다가
+    (수정자, 키) -> 스니펫 ID 표에서 바로 찾는다. 훅은 keyboard 스레드에서 돌기 때문에
+    눌린 ID를 쌓아 두고, 쌓이기 시작할 때만 receiver에 HotkeyEvent를 하나 보낸다.
+    표는 GUI 스레드에서 새로 만들어 바꿔 끼우므로 훅에서 잠글 필요가 없다.
+    """
+
+    def __init__(self, receiver):
+        self.receiver = receiver
+        self._chords = {}     # (수정자, 키 이름) -> 스니펫 ID
+        self._byScanCode = {} # (수정자, 스캔 코드) -> ID
+        self._held = set()    # 눌려 있는 수정자
+        self._pending = []
+        self._lock = threading.Lock()
+        self._hook = None
+
+    def owner(self, chord):
+        try:
+            return self._chords.get(parseChord(chord))
+        except ValueError:
+            return None
+
+    def register(self, chord, id):
+        """단축키를 스니펫에 연결하고, 다른 스니펫이 쓰던 단축키였으면 그 ID를 반환.
+
+        'Ctrl+Shift+1'과 'Shift+Ctrl+1'은 같은 단축키이다. 잘못된 단축키면 ValueError.
+        """
+        key = parseChord(chord)
+        previous = self._chords.get(key)
+        chords = dict(self._chords)
+        chords[key] = id
+        self._rebuild(chords)
+        self._ensureHook()
+        return previous if previous != id else None
+
+    def unregister(self, chord):
+        key = parseChord(chord)
+        if key in self._chords:
+            chords = dict(self._chords)
+            del chords[key]
+            self._rebuild(chords)
+
+    def _rebuild(self, chords):
+        byScanCode = {}
+        for (modifiers, key), id in chords.items():
+            for scanCode in self._scanCodes(key):
+                byScanCode[modifiers, scanCode] = id
+        self._chords = chords
+        self._byScanCode = byScanCode
+
+    def _scanCodes(self, key):
+        import keyboard
+        try:
+            return keyboard.key_to_scan_codes(key, error_if_missing=False)
+        except (OSError, ValueError):  # 키 배치를 읽을 수 없으면 이름으로만 찾는다
+            return ()
+
+    def _ensureHook(self):
+        if self._hook is None:
+            import keyboard  # 전역 후킹 라이브러리는 단축키를 처음 쓸 때 로드
+            self._hook = keyboard.hook(self._onKey)
+
+    def _onKey(self, event):
+        # keyboard 스레드에서 호출된다
+        name = (event.name or '').lower()
+        modifier = MODIFIERS.get(name)
+        if modifier is not None:
+            if event.event_type == 'down':
+                self._held.add(modifier)
+            else:
+                self._held.discard(modifier)
+            return
+        if event.event_type != 'down':
+            return
+        modifiers = frozenset(self._held)
+        id = self._byScanCode.get((modifiers, event.scan_code))
+        if id is None:
+            id = self._chords.get((modifiers, name))
+        if id is None:
+            return
+        with self._lock:
+            first = not self._pending
+            self._pending.append(id)
+        if first:
+            QApplication.postEvent(self.receiver, HotkeyEvent())
+
+    def takePending(self):
+        """쌓인 스니펫 ID 목록을 가져간다 (GUI 스레드)."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return pending
+
+    def close(self):
+        if self._hook is not None:
+            import keyboard
+            keyboard.unhook(self._hook)
+            self._hook = None
@@ -0,0 +1,77 @@
+import threading
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from file_utilities_core.search import SearchIndex
+
+
+class SearchWorker(QThread):
+    """스니펫 검색 색인을 백그라운드 스레드에서 유지하고 검색.
+
+    색인은 이 스레드에서만 바꾸므로, GUI 스레드는 변경과 검색어를 넘기기만 한다. 밀린
+    검색어는 마지막 것만 계산하고, 색인이 바뀌면 마지막 검색어로 다시 검색해 보낸다.
+    """
+    resultsReady = pyqtSignal(str, list)  # (검색어, 점수 순 스니펫 ID 목록)
+
+    def __init__(self, parent=None):
+        super(SearchWorker, self).__init__(parent)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._changes = []
+        self._query = None
+        self._stopped = False
+        self.index = SearchIndex()
+
+    def _push(self, change):
+        with self._lock:
+            self._changes.append(change)
+        self._wake.set()
+
+    def setSnippets(self, snippets):
+        self._push(('set', [dict(snippet) for snippet in snippets]))
+
+    def updateSnippet(self, snippet):
+        """추가 또는 수정된 스니펫 (모델이 dict를 바꾸므로 복사해서 넘긴다)."""
+        self._push(('update', dict(snippet)))
+
+    def removeSnippet(self, id):
+        self._push(('remove', id))
+
+    def setOrder(self, ids):
+        self._push(('order', list(ids)))
+
+    def search(self, query):
+        with self._lock:
+            self._query = query
+        self._wake.set()
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+        self.wait()
+
+    def run(self):
+        lastQuery = ''
+        while True:
+            self._wake.wait()
+            with self._lock:
+                changes, self._changes = self._changes, []
+                query, self._query = self._query, None
+                self._wake.clear()
+            if self._stopped:
+                return
+            for kind, value in changes:
+                if kind == 'set':
+                    self.index = SearchIndex(value)
+                elif kind == 'update':
+                    self.index.update(value)
+                elif kind == 'remove':
+                    self.index.remove(value)
+                elif kind == 'order':
+                    self.index.set_order(value)
+            if query is not None:
+                lastQuery = query
+            elif not changes:
+                continue
+            if lastQuery.strip():
+                self.resultsReady.emit(lastQuery, self.index.search(lastQuery))
@@ -0,0 +1,139 @@
+"""Copy the txt 스니펫 목록 모델.
+
+스니펫은 snippets.new_snippet() 형식의 dict 리스트 하나에 담고, ID -> 행 dict를
+함께 유지해서 단축키나 드래그로 ID가 들어와도 목록을 훑지 않고 행을 찾는다.
+"""
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+
+IdRole = Qt.UserRole
+TextRole = Qt.UserRole + 1
+TitleRole = Qt.UserRole + 2
+ShortcutRole = Qt.UserRole + 3
+
+
+class SnippetListModel(QAbstractListModel):
+    def __init__(self, parent=None):
+        super(SnippetListModel, self).__init__(parent)
+        self._snippets = []
+        self._rows = {}  # ID -> 행
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._snippets)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        snippet = self._snippets[index.row()]
+        if role == Qt.DisplayRole:
+            return snippet['title'] or snippet['text']
+        if role == Qt.ToolTipRole:
+            return snippet['title'] or snippet['text']
+        if role == IdRole:
+            return snippet['id']
+        if role == TextRole:
+            return snippet['text']
+        if role == TitleRole:
+            return snippet['title']
+        if role == ShortcutRole:
+            return snippet['shortcut']
+        return None
+
+    def snippets(self):
+        return list(self._snippets)
+
+    def snippet(self, row):
+        return self._snippets[row]
+
+    def rowOf(self, id):
+        """ID의 행 번호 (없으면 -1)."""
+        return self._rows.get(id, -1)
+
+    def setSnippets(self, snippets):
+        self.beginResetModel()
+        self._snippets = list(snippets)
+        self._rows = {}
+        self._reindex(0, len(self._snippets))
+        self.endResetModel()
+
+    def addSnippet(self, snippet):
+        """맨 뒤에 추가하고 행 번호를 반환."""
+        row = len(self._snippets)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._snippets.append(snippet)
+        self._rows[snippet['id']] = row
+        self.endInsertRows()
+        return row
+
+    def updateSnippet(self, id, **fields):
+        """text, title, shortcut 중 주어진 값만 바꾸고 행 번호를 반환."""
+        row = self.rowOf(id)
+        if row < 0:
+            return row
+        self._snippets[row].update(fields)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return row
+
+    def removeSnippet(self, id):
+        """지우고 지운 행 번호를 반환 (뒤의 행들은 한 칸씩 당겨짐)."""
+        row = self.rowOf(id)
+        if row < 0:
+            return row
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._snippets[row]
+        del self._rows[id]
+        self._reindex(row, len(self._snippets))
+        self.endRemoveRows()
+        return row
+
+    def moveSnippet(self, source, target):
+        """source 행을 target 행 앞으로 옮긴다 (target이 행 수면 맨 뒤로).
+
+        위치가 바뀐 행 범위 ``(시작, 끝)`` 을 반환하며 옮기지 않았으면 None.
+        """
+        if not 0 <= source < len(self._snippets) or not 0 <= target <= len(self._snippets):
+            return None
+        if target in (source, source + 1):
+            return None
+        self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), target)
+        snippet = self._snippets.pop(source)
+        if source < target:
+            target -= 1
+        self._snippets.insert(target, snippet)
+        start, end = min(source, target), max(source, target) + 1
+        self._reindex(start, end)
+        self.endMoveRows()
+        return start, end
+
+    def _reindex(self, start, end):
+        for row in range(start, end):
+            self._rows[self._snippets[row]['id']] = row
+
+
+class SearchResultModel(QAbstractListModel):
+    """검색 결과 (스니펫 ID 목록). 내용은 원본 SnippetListModel에서 읽는다."""
+
+    def __init__(self, source, parent=None):
+        super(SearchResultModel, self).__init__(parent)
+        self.source = source
+        self._ids = []
+        source.dataChanged.connect(self._sourceChanged)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._ids)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        # 지워진 스니펫은 새 결과가 올 때까지 빈 행으로 둔다
+        row = self.source.rowOf(self._ids[index.row()])
+        return self.source.data(self.source.index(row), role) if row >= 0 else None
+
+    def setIds(self, ids):
+        self.beginResetModel()
+        self._ids = list(ids)
+        self.endResetModel()
+
+    def _sourceChanged(self):
+        if self._ids:
+            self.dataChanged.emit(self.index(0), self.index(len(self._ids) - 1))
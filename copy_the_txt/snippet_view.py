@@ -0,0 +1,162 @@
+"""Copy the txt 스니펫 목록 뷰와 델리게이트.
+
+스니펫마다 위젯을 만들지 않고, 보이는 행만 델리게이트가 직접 그린다. 행 안의
+버튼(복사, 삭제, 펼치기, 단축키)도 그림이며 클릭 위치로 구분해 신호를 보낸다.
+"""
+from PyQt5.QtWidgets import QAbstractItemView, QApplication, QListView, QStyle, QStyledItemDelegate
+from PyQt5.QtCore import QMimeData, QRect, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QDrag, QFontMetrics, QPainter
+
+from .snippet_model import IdRole, ShortcutRole
+
+BUTTON_COLOR = QColor('#007AFF')
+HOVER_COLOR = QColor('#005BCB')
+TEXT_COLOR = QColor('white')
+
+PADDING = 14
+SPACING = 2
+DELETE_WIDTH = 50
+EXPAND_WIDTH = 50
+SHORTCUT_WIDTH = 140
+
+COPY, DELETE, EXPAND, SHORTCUT = range(4)
+
+
+class SnippetDelegate(QStyledItemDelegate):
+    """한 줄짜리 스니펫 행. 줄인 글자는 스니펫마다 마지막 너비의 결과를 기억한다."""
+    copyClicked = pyqtSignal(str)
+    deleteClicked = pyqtSignal(str)
+    expandClicked = pyqtSignal(str)
+    shortcutClicked = pyqtSignal(str)
+
+    def __init__(self, parent=None):
+        super(SnippetDelegate, self).__init__(parent)
+        self.expandedId = None
+        self._elided = {}  # ID -> (너비, 원래 글자, 줄인 글자)
+
+    def buttonRects(self, rect):
+        """(복사, 삭제, 펼치기, 단축키) 영역."""
+        right = rect.right() + 1
+        rects = []
+        for width in (SHORTCUT_WIDTH, EXPAND_WIDTH, DELETE_WIDTH):
+            right -= width
+            rects.append(QRect(right, rect.top() + 1, width - SPACING, rect.height() - 2))
+            right -= SPACING
+        copyRect = QRect(rect.left() + 1, rect.top() + 1, right - rect.left() - 1, rect.height() - 2)
+        return [copyRect] + rects[::-1]
+
+    def elidedText(self, id, text, fontMetrics, width):
+        cached = self._elided.get(id)
+        if cached is not None and cached[0] == width and cached[1] == text:
+            return cached[2]
+        elided = fontMetrics.elidedText(text.replace('\n', ' '), Qt.ElideRight, width)
+        self._elided[id] = (width, text, elided)
+        return elided
+
+    def forget(self, id):
+        self._elided.pop(id, None)
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), QFontMetrics(option.font).lineSpacing() + PADDING * 2)
+
+    def paint(self, painter, option, index):
+        id = index.data(IdRole)
+        if id is None:
+            return
+        shortcut = index.data(ShortcutRole)
+        copyRect, deleteRect, expandRect, shortcutRect = self.buttonRects(option.rect)
+        hovered = bool(option.state & QStyle.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        for rect, color in ((copyRect, HOVER_COLOR if hovered else BUTTON_COLOR),
+                            (deleteRect, BUTTON_COLOR), (expandRect, BUTTON_COLOR), (shortcutRect, BUTTON_COLOR)):
+            painter.setBrush(color)
+            painter.drawRoundedRect(rect, 5, 5)
+
+        painter.setFont(option.font)
+        painter.setPen(TEXT_COLOR)
+        textRect = copyRect.adjusted(PADDING, 0, -PADDING, 0)
+        text = self.elidedText(id, index.data(Qt.DisplayRole), option.fontMetrics, textRect.width())
+        painter.drawText(textRect, Qt.AlignLeft | Qt.AlignVCenter, text)
+        painter.drawText(deleteRect, Qt.AlignCenter, '✖')
+        painter.drawText(expandRect, Qt.AlignCenter, '▼' if id == self.expandedId else '▶')
+        painter.drawText(shortcutRect, Qt.AlignCenter,
+                         option.fontMetrics.elidedText(shortcut or 'Set Shortcut', Qt.ElideRight, shortcutRect.width() - 8))
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if event.type() != event.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return False
+        for part, rect in enumerate(self.buttonRects(option.rect)):
+            if rect.contains(event.pos()):
+                signal = (self.copyClicked, self.deleteClicked, self.expandClicked, self.shortcutClicked)[part]
+                signal.emit(index.data(IdRole))
+                return True
+        return False
+
+
+class SnippetListView(QListView):
+    """끌어서 순서를 바꿀 수 있는 스니펫 목록. 놓으면 moveRequested(ID, 대상 행).
+
+    setDragEnabled(False)면 (검색 결과를 보여 줄 때) 순서를 바꿀 수 없다.
+    """
+    moveRequested = pyqtSignal(str, int)
+
+    def __init__(self, parent=None):
+        super(SnippetListView, self).__init__(parent)
+        self.setUniformItemSizes(True)
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setSpacing(1)
+        self.setMouseTracking(True)
+        self.setDragEnabled(True)
+        self.setAcceptDrops(True)
+        self.viewport().setAcceptDrops(True)
+        self.dragStartPosition = None
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.dragStartPosition = event.pos()
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if not (event.buttons() & Qt.LeftButton) or self.dragStartPosition is None or not self.dragEnabled():
+            return super().mouseMoveEvent(event)
+        if (event.pos() - self.dragStartPosition).manhattanLength() < QApplication.startDragDistance():
+            return
+        index = self.indexAt(self.dragStartPosition)
+        self.dragStartPosition = None
+        if not index.isValid() or index.data(IdRole) is None:
+            return
+        drag = QDrag(self)
+        mimeData = QMimeData()
+        mimeData.setText(index.data(IdRole))  # 스니펫 ID를 mimeData에 설정
+        drag.setMimeData(mimeData)
+        drag.exec_(Qt.MoveAction)
+
+    def mouseReleaseEvent(self, event):
+        self.dragStartPosition = None
+        super().mouseReleaseEvent(event)
+
+    def dragEnterEvent(self, event):
+        if event.source() is self and event.mimeData().hasText():
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+    def dragMoveEvent(self, event):
+        if event.source() is self:
+            event.acceptProposedAction()
+        else:
+            event.ignore()
+
+    def dropEvent(self, event):
+        if event.source() is not self:
+            return event.ignore()
+        # 놓은 행 앞으로 옮긴다. 빈 곳에 놓으면 맨 뒤로
+        index = self.indexAt(event.pos())
+        target = index.row() if index.isValid() else self.model().rowCount()
+        self.moveRequested.emit(event.mimeData().text(), target)
+        event.acceptProposedAction()
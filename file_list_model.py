@@ -0,0 +1,177 @@
+"""파일 경로 목록을 보여 주는 테이블 모델 (File Renamer, Image Resizer 공용).
+
+경로는 문자열 리스트 하나에만 담고 항목 객체를 따로 만들지 않으며, 화면에 보일
+때만 data()에서 표시 문자열을 만든다. 수십만 개를 넣어도 뷰가 느려지지 않도록
+QListView에는 setUniformItemSizes(True), QTreeView에는 setUniformRowHeights(True)를
+함께 쓴다.
+"""
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QColor
+
+from file_utilities_core.natsort import insertion_points
+
+# 한 번에 추가하는 경로가 이보다 많은 구간으로 흩어지면 행 삽입 대신 전체를 병합한다
+MAX_INSERT_RUNS = 64
+
+PREVIEW_COLUMN = 1
+CONFLICT_COLOR = QColor('#ffe0e0')
+
+
+class FileListModel(QAbstractTableModel):
+    """중복 없는 경로 목록. sort_key를 주면 항상 그 순서로 정렬된 상태를 유지한다.
+
+    display(path)를 주면 화면에 보일 문자열을 바꿀 수 있고, 툴팁은 항상 전체 경로이다.
+    preview가 참이면 두 번째 열에 updatePreview()로 받은 새 이름을 보여 주고, 다른
+    파일과 겹쳐 바뀐 이름은 배경색으로 표시한다.
+    """
+
+    def __init__(self, sort_key=None, display=None, preview=False, parent=None):
+        super(FileListModel, self).__init__(parent)
+        self.sort_key = sort_key
+        self.display = display
+        self.preview = preview
+        self._paths = []
+        self._members = set()
+        self._previews = {}  # 경로 -> (새 이름, 겹침 여부)
+        self._rows = None    # 경로 -> 행 (미리 보기가 바뀐 행을 찾을 때 만들고, 행이 바뀌면 버린다)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return 2 if self.preview else 1
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return ("File", "New name")[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        path = self._paths[index.row()]
+        if index.column() == PREVIEW_COLUMN:
+            preview = self._previews.get(path)
+            if preview is None:
+                return None
+            if role == Qt.DisplayRole:
+                return preview[0]
+            if role == Qt.BackgroundRole and preview[1]:
+                return CONFLICT_COLOR
+            if role == Qt.ToolTipRole and preview[1]:
+                return "Changed to avoid a name that is already taken"
+            return None
+        if role == Qt.DisplayRole:
+            return self.display(path) if self.display else path
+        if role == Qt.ToolTipRole:
+            return path
+        return None
+
+    def updatePreview(self, changes):
+        """{경로: (새 이름, 겹침 여부)} 중 바뀐 것만 받아 반영 (None이면 지움)."""
+        for path, preview in changes.items():
+            if preview is None:
+                self._previews.pop(path, None)
+            else:
+                self._previews[path] = preview
+        self._previewChanged(changes)
+
+    def clearPreview(self):
+        paths = list(self._previews)
+        self._previews.clear()
+        self._previewChanged(paths)
+
+    def _previewChanged(self, paths):
+        # 바뀐 행만, 이어진 행끼리 묶어 dataChanged를 보낸다
+        if not self.preview or not paths:
+            return
+        if self._rows is None:
+            self._rows = {path: row for row, path in enumerate(self._paths)}
+        rows = sorted(self._rows[path] for path in paths if path in self._rows)
+        start = 0
+        for i in range(1, len(rows) + 1):
+            if i == len(rows) or rows[i] != rows[i - 1] + 1:
+                self.dataChanged.emit(self.index(rows[start], PREVIEW_COLUMN), self.index(rows[i - 1], PREVIEW_COLUMN))
+                start = i
+
+    def paths(self):
+        return list(self._paths)
+
+    def path(self, row):
+        return self._paths[row]
+
+    def __len__(self):
+        return len(self._paths)
+
+    def clear(self):
+        self.setPaths([])
+
+    def setPaths(self, paths):
+        """목록 전체를 바꾼다."""
+        paths = self._unique(paths, set())
+        if self.sort_key:
+            paths.sort(key=self.sort_key)
+        self.beginResetModel()
+        self._paths = paths
+        self._members = set(paths)
+        self._previews.clear()
+        self._rows = None
+        self.endResetModel()
+
+    def addPaths(self, paths):
+        """목록에 없는 경로만 추가하고 추가한 수를 반환.
+
+        정렬된 목록이면 새 경로만 정렬한 뒤 natsort.insertion_points()로 자리를 찾아,
+        이어진 구간마다 beginInsertRows를 한 번씩 호출한다. 구간이 너무 많으면 한 번에 병합한다.
+        """
+        new_paths = self._unique(paths, self._members)
+        if not new_paths:
+            return 0
+        if not self.sort_key:
+            self._insert(len(self._paths), new_paths)
+            return len(new_paths)
+
+        new_paths.sort(key=self.sort_key)
+        runs = []  # (삽입 위치, 경로 목록)
+        for position, path in zip(insertion_points(self._paths, new_paths, self.sort_key), new_paths):
+            if runs and runs[-1][0] == position:
+                runs[-1][1].append(path)
+            else:
+                runs.append((position, [path]))
+
+        if len(runs) > MAX_INSERT_RUNS:
+            merged = []
+            previous = 0
+            for position, run in runs:
+                merged.extend(self._paths[previous:position])
+                merged.extend(run)
+                previous = position
+            merged.extend(self._paths[previous:])
+            self.beginResetModel()
+            self._paths = merged
+            self._members.update(new_paths)
+            self._rows = None
+            self.endResetModel()
+        else:
+            # 뒤에서부터 넣어야 앞쪽 삽입 위치가 바뀌지 않는다
+            for position, run in reversed(runs):
+                self._insert(position, run)
+        return len(new_paths)
+
+    def _unique(self, paths, existing):
+        unique = []
+        seen = set()
+        for path in paths:
+            if path not in existing and path not in seen:
+                seen.add(path)
+                unique.append(path)
+        return unique
+
+    def _insert(self, position, paths):
+        self.beginInsertRows(QModelIndex(), position, position + len(paths) - 1)
+        self._paths[position:position] = paths
+        self._members.update(paths)
+        self._rows = None
+        self.endInsertRows()
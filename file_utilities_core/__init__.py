@@ -0,0 +1 @@
+"""File Utilities의 Qt 독립 핵심 로직."""
@@ -0,0 +1,321 @@
+"""움직이는 이미지(GIF, 애니메이션 WebP, APNG)를 한 프레임씩 리사이즈해서 저장.
+
+Pillow의 save(save_all=True)는 GIF/PNG는 모든 프레임을, WebP는 append_images
+목록을 메모리에 모은 뒤 쓰기 때문에 긴 애니메이션에서는 메모리가 프레임 수에
+비례해 커진다. 여기서는 디코딩 -> 리사이즈 -> 인코딩을 프레임마다 이어서 해서
+동시에 메모리에 있는 프레임이 몇 개를 넘지 않게 한다.
+
+- GIF: 프레임마다 한 장짜리 GIF로 인코딩한 뒤, 그 팔레트를 지역 색상표로 옮겨 이어 쓴다.
+- APNG: 프레임마다 PNG로 인코딩한 뒤, IDAT 청크를 fdAT 청크로 바꿔 이어 쓴다.
+- WebP: Pillow의 WebP 인코더에 프레임을 하나씩 만들어 내는 이미지를 넘긴다.
+
+크롭 영역은 애니메이션마다 한 번만 계산하고(FramePlan), GIF/APNG가 알려 주는 프레임
+갱신 영역이 크롭 영역(리샘플링할 때는 필터가 읽는 주변까지)에 닿지 않으면 리사이즈하지
+않고 이전 결과를 다시 쓴다. GIF와 APNG 저장은 같은 프레임이 이어지면 한 프레임으로
+합쳐 표시 시간만 늘린다.
+"""
+import io
+import math
+import struct
+import zlib
+
+from PIL import Image, ImageSequence
+
+from .encode import replacing
+
+# 프레임을 하나씩 저장할 수 있는 형식
+ANIMATED_FORMATS = ('GIF', 'PNG', 'WEBP')
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# LANCZOS 필터가 출력 픽셀 하나에 읽는 반경 (원본을 줄이는 배율을 곱하기 전)
+_LANCZOS_SUPPORT = 3.0
+
+
+def is_animated(img):
+    return img.format in ANIMATED_FORMATS and getattr(img, 'is_animated', False)
+
+
+def crop_box(canvas_size, size):
+    """ImageOps.fit()과 같은 방식으로 가운데를 size의 비율로 자를 영역."""
+    width, height = canvas_size
+    output_ratio = size[0] / size[1]
+    if width / height >= output_ratio:
+        crop_width, crop_height = output_ratio * height, height
+    else:
+        crop_width, crop_height = width, width / output_ratio
+    left = (width - crop_width) / 2
+    top = (height - crop_height) / 2
+    return left, top, left + crop_width, top + crop_height
+
+
+class FramePlan:
+    """애니메이션의 모든 프레임에 똑같이 적용할 크롭 영역과 리샘플링 방법."""
+
+    def __init__(self, canvas_size, size):
+        self.size = size
+        self.box = crop_box(canvas_size, size)
+        left, top = round(self.box[0]), round(self.box[1])
+        # 크기를 줄이지 않으면 리샘플링 없이 정수 좌표로 자르기만 한다
+        self.crop_only = (round(self.box[2] - self.box[0]), round(self.box[3] - self.box[1])) == size
+        if self.crop_only:
+            self.box = (left, top, left + size[0], top + size[1])
+            self.reach = self.box
+        else:
+            # 리샘플링은 크롭 영역 밖의 원본 픽셀도 필터 반경 x 축소 배율만큼 읽는다
+            margin_x = math.ceil(_LANCZOS_SUPPORT * max((self.box[2] - self.box[0]) / size[0], 1.0))
+            margin_y = math.ceil(_LANCZOS_SUPPORT * max((self.box[3] - self.box[1]) / size[1], 1.0))
+            self.reach = (self.box[0] - margin_x, self.box[1] - margin_y,
+                          self.box[2] + margin_x, self.box[3] + margin_y)
+
+    def touches(self, region):
+        """region(None이면 알 수 없음)이 결과에 영향을 주는 영역(reach)과 겹치는지."""
+        if region is None:
+            return True
+        if not region:
+            return False
+        x0, y0, x1, y1 = region
+        return x0 < self.reach[2] and x1 > self.reach[0] and y0 < self.reach[3] and y1 > self.reach[1]
+
+    def apply(self, frame):
+        """팔레트 프레임은 자르기만 할 때 그대로 두고, 리샘플링할 때는 투명한 픽셀이
+        있을 때만 RGBA로 바꾼다."""
+        if self.crop_only:
+            return frame.crop(self.box)
+        if frame.mode not in ('RGB', 'RGBA'):
+            frame = frame.convert('RGBA' if frame.has_transparency_data else 'RGB')
+        return frame.resize(self.size, Image.Resampling.LANCZOS, box=self.box)
+
+
+def _update_regions(frame):
+    """``(이 프레임이 그린 영역, 다음 프레임 전에 지워질 영역)``. 빈 튜플은 없음, None은 알 수 없음."""
+    if frame.format == 'GIF':
+        extent = frame.dispose_extent
+        return extent, extent if frame.disposal_method >= 2 else ()
+    if frame.format == 'PNG' and 'bbox' in frame.info:
+        extent = frame.info['bbox']
+        return extent, extent if frame.info.get('disposal') else ()
+    return None, None
+
+
+def iter_frames(img, size):
+    """``(리사이즈된 프레임, 표시 시간 ms)`` 를 한 프레임씩 yield.
+
+    이전 프레임과 크롭 영역 안이 같으면 이전 결과 객체를 그대로 다시 yield한다.
+    """
+    plan = FramePlan(img.size, size)
+    previous = None
+    disposed = None  # 이전 프레임이 지운 영역
+    for frame in ImageSequence.Iterator(img):
+        drawn, next_disposed = _update_regions(frame)
+        if previous is None or plan.touches(drawn) or plan.touches(disposed):
+            previous = plan.apply(frame)
+        disposed = next_disposed
+        yield previous, frame.info.get('duration', 0)
+
+
+def save_animated(img, path, size):
+    """img의 모든 프레임을 size로 잘라 같은 형식으로 path에 저장."""
+    frames = iter_frames(img, size)
+    loop = img.info.get('loop', 0)
+    if img.format == 'GIF':
+        save_gif_frames(path, frames, size, loop)
+    elif img.format == 'PNG':
+        mode = 'RGBA' if img.has_transparency_data else 'RGB'
+        save_apng_frames(path, _same_mode(frames, mode), size, loop)
+    elif img.format == 'WEBP':
+        stream = _FrameStream(frames, img.n_frames)
+        with replacing(path) as partial:
+            stream.save(partial, 'WEBP', save_all=True, duration=stream.durations, loop=loop,
+                        background=img.info.get('background', (0, 0, 0, 0)))
+    else:
+        raise ValueError(f"unsupported animated format: {img.format}")
+
+
+def _same_mode(frames, mode):
+    # 다시 쓰인 프레임은 변환 결과도 다시 써서 저장 쪽에서 같은 프레임으로 알아보게 한다
+    source = converted = None
+    for frame, duration in frames:
+        if frame is not source:
+            source, converted = frame, frame.convert(mode)
+        yield converted, duration
+
+
+# --------------------------------------------------------------------
+# GIF
+
+def _skip_sub_blocks(data, pos):
+    while data[pos]:
+        pos += data[pos] + 1
+    return pos + 1
+
+
+def _gif_frame_blocks(data):
+    """한 장짜리 GIF에서 ``(그래픽 제어 확장, 이미지 블록)`` 을 꺼낸다.
+
+    전역 색상표는 이미지 서술자 뒤의 지역 색상표로 옮긴다.
+    """
+    flags = data[10]
+    pos = 13
+    color_table = b''
+    if flags & 0x80:
+        color_table = data[pos:pos + (3 << ((flags & 0x07) + 1))]
+        pos += len(color_table)
+    control = b''
+    while data[pos] != 0x2C:  # 이미지 서술자 ','
+        if data[pos] != 0x21:  # 확장 '!'
+            raise ValueError("unexpected block in GIF frame")
+        end = _skip_sub_blocks(data, pos + 2)
+        if data[pos + 1] == 0xF9:
+            control = data[pos:end]
+        pos = end
+    packed = data[pos + 9]
+    end = pos + 10
+    if packed & 0x80:
+        end += 3 << ((packed & 0x07) + 1)
+    end = _skip_sub_blocks(data, end + 1)  # LZW 코드 크기 바이트 다음부터 데이터 블록
+    if packed & 0x80 or not color_table:
+        return control, data[pos:end]
+    packed |= 0x80 | (flags & 0x07)
+    return control, data[pos:pos + 9] + bytes([packed]) + color_table + data[pos + 10:end]
+
+
+def _write_gif_frame(fp, control, image, duration):
+    if control:
+        # 그래픽 제어 확장의 표시 시간(1/100초)을 합친 시간으로 바꾼다
+        control = control[:4] + struct.pack('<H', min(int(duration / 10), 0xFFFF)) + control[6:]
+    fp.write(control)
+    fp.write(image)
+
+
+def save_gif_frames(path, frames, size, loop=0):
+    """``(프레임, 표시 시간)`` 을 차례로 받아 애니메이션 GIF로 저장.
+
+    프레임마다 자기 팔레트(지역 색상표)를 쓰고 전체 화면을 덮으므로, 이전 프레임은
+    배경으로 지운다 (disposal 2). 그래야 투명한 픽셀에 이전 프레임이 비치지 않는다.
+    같은 프레임 객체가 이어지면 한 번만 쓰고 표시 시간을 더한다.
+    """
+    with replacing(path) as partial, open(partial, 'wb') as fp:
+        fp.write(b'GIF89a' + struct.pack('<HHBBB', size[0], size[1], 0, 0, 0))
+        fp.write(b'!\xff\x0bNETSCAPE2.0\x03\x01' + struct.pack('<H', loop) + b'\x00')
+        pending = None  # [프레임, 그래픽 제어 확장, 이미지 블록, 표시 시간]
+        for frame, duration in frames:
+            if pending is not None and frame is pending[0]:
+                pending[3] += duration
+                continue
+            if pending is not None:
+                _write_gif_frame(fp, *pending[1:])
+            buffer = io.BytesIO()
+            frame.save(buffer, 'GIF', duration=duration, disposal=2)
+            pending = [frame, *_gif_frame_blocks(buffer.getvalue()), duration]
+        if pending is not None:
+            _write_gif_frame(fp, *pending[1:])
+        fp.write(b';')
+
+
+# --------------------------------------------------------------------
+# APNG
+
+def _png_chunks(data):
+    pos = len(_PNG_SIGNATURE)
+    while pos < len(data):
+        length, kind = struct.unpack('>I4s', data[pos:pos + 8])
+        yield kind, data[pos + 8:pos + 8 + length]
+        pos += length + 12
+
+
+def _write_chunk(fp, kind, body):
+    fp.write(struct.pack('>I', len(body)) + kind + body + struct.pack('>I', zlib.crc32(kind + body)))
+
+
+def _write_apng_frame(fp, chunks, duration, size, sequence):
+    """프레임 하나(fcTL + IDAT 또는 fdAT)를 쓰고 다음 순번을 반환."""
+    # 합친 표시 시간이 65.535초를 넘으면 1/100초 단위로 적는다
+    delay, scale = (int(duration), 1000) if duration <= 0xFFFF else (min(int(duration / 10), 0xFFFF), 100)
+    # fcTL: 순번, 크기, 위치, 표시 시간(delay/scale초), dispose_op, blend_op
+    _write_chunk(fp, b'fcTL', struct.pack('>IIIIIHHBB', sequence, size[0], size[1], 0, 0,
+                                          delay, scale, 0, 0))
+    first = sequence == 0
+    sequence += 1
+    for kind, body in chunks:
+        if kind != b'IDAT':
+            continue
+        if first:
+            _write_chunk(fp, b'IDAT', body)
+        else:
+            _write_chunk(fp, b'fdAT', struct.pack('>I', sequence) + body)
+            sequence += 1
+    return sequence
+
+
+def save_apng_frames(path, frames, size, loop=0):
+    """``(프레임, 표시 시간)`` 을 차례로 받아 APNG로 저장.
+
+    모든 프레임은 같은 모드여야 하며, 각 프레임이 전체 화면을 그대로 덮어쓴다. 같은
+    프레임 객체가 이어지면 한 번만 쓰고 표시 시간을 더한다. 프레임 수를 적는 acTL
+    청크는 맨 앞에 오므로 다 쓴 뒤 돌아가서 고친다.
+    """
+    sequence = 0
+    count = 0
+    with replacing(path) as partial, open(partial, 'wb') as fp:
+        fp.write(_PNG_SIGNATURE)
+        pending = None  # [프레임, 청크 목록, 표시 시간]
+        for frame, duration in frames:
+            if pending is not None and frame is pending[0]:
+                pending[2] += duration
+                continue
+            buffer = io.BytesIO()
+            frame.save(buffer, 'PNG')
+            chunks = list(_png_chunks(buffer.getvalue()))
+            if pending is None:
+                for kind, body in chunks:
+                    if kind == b'IDAT':
+                        break
+                    _write_chunk(fp, kind, body)
+                    if kind == b'IHDR':
+                        actl_offset = fp.tell()
+                        _write_chunk(fp, b'acTL', struct.pack('>II', 0, loop))
+            else:
+                sequence = _write_apng_frame(fp, pending[1], pending[2], size, sequence)
+                count += 1
+            pending = [frame, chunks, duration]
+        if pending is not None:
+            _write_apng_frame(fp, pending[1], pending[2], size, sequence)
+            count += 1
+        _write_chunk(fp, b'IEND', b'')
+        if count:
+            fp.seek(actl_offset)
+            _write_chunk(fp, b'acTL', struct.pack('>II', count, loop))
+
+
+# --------------------------------------------------------------------
+# WebP
+
+class _FrameStream(Image.Image):
+    """프레임을 요청할 때마다 하나씩 만들어 내는 여러 장짜리 이미지 (앞으로만 seek).
+
+    Pillow의 WebP 인코더는 이미지를 seek하며 프레임을 하나씩 넘기므로, 이 객체를
+    넘기면 전체 프레임을 목록으로 만들지 않는다. durations는 지금까지 만든 프레임의
+    표시 시간이며, 인코더가 각 프레임을 넣은 뒤 읽는다.
+    """
+
+    def __init__(self, frames, frame_count):
+        super().__init__()
+        self._frames = frames
+        self.n_frames = frame_count
+        self.durations = []
+        self._position = -1
+        self.seek(0)
+
+    def seek(self, frame):
+        if frame <= self._position:  # 저장이 끝나고 처음 프레임으로 되돌리는 호출
+            return
+        image, duration = next(self._frames)
+        self.im = image.im
+        self._mode = image.mode
+        self._size = image.size
+        self.info = dict(image.info)
+        self.durations.append(duration)
+        self._position = frame
+
+    def tell(self):
+        return self._position
@@ -0,0 +1,275 @@
+"""`file-utilities` 명령행 도구.
+
+각 하위 명령은 실행될 때만 필요한 모듈을 import하므로 시작이 빠르다.
+"""
+import argparse
+import os
+import sys
+
+
+def parse_ratio(text):
+    try:
+        width, height = map(int, text.split(':'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid ratio: {text!r} (expected W:H)")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"invalid ratio: {text!r}")
+    return width, height
+
+
+def run_rename(args):
+    from .natsort import natural_sort_key
+    from .renamer import RENAME_JOURNAL, rename_files
+
+    file_paths = sorted(set(args.files), key=natural_sort_key)
+    try:
+        new_paths = rename_files(file_paths, args.keyword, args.start, journal_path=RENAME_JOURNAL)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    except RuntimeError as e:
+        print(f"error: {e} (use undo-rename or undo-rename --resume)", file=sys.stderr)
+        return 1
+    for new_path in new_paths:
+        print(new_path)
+    return 0
+
+
+def run_undo_rename(args):
+    from .renamer import RENAME_JOURNAL, recover_renames
+
+    if not os.path.exists(RENAME_JOURNAL):
+        print("nothing to undo", file=sys.stderr)
+        return 0
+    count = recover_renames(RENAME_JOURNAL, rollback=not args.resume)
+    print(f"{'Resumed' if args.resume else 'Undid'} {count} renames.", file=sys.stderr)
+    return 0
+
+
+def run_resize(args):
+    import csv
+
+    from .encode import OutputOptions, format_bytes, summarize
+    from .resize import resize_batch
+
+    try:
+        output = OutputOptions(args.format, args.quality, args.progressive, args.optimize,
+                               args.subsampling, args.metadata)
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 2
+    if args.preset:
+        from .pyramid import DEFAULT_PRESET, load_preset, pyramid_batch
+
+        try:
+            preset = DEFAULT_PRESET if args.preset == 'default' else load_preset(args.preset)
+        except (OSError, ValueError) as e:
+            print(f"error: {e}", file=sys.stderr)
+            return 2
+
+    cache = None
+    if args.cache:
+        from .resize_cache import ResizeCache
+
+        cache = ResizeCache(args.cache, args.cache_size * 1024 ** 2, hash_contents=not args.cache_by_mtime)
+    if args.preset:
+        results = pyramid_batch(args.files, args.ratio, preset, args.workers, cache, fast=args.fast, output=output)
+    else:
+        results = resize_batch(args.files, args.ratio, args.workers, cache,
+                               max_size=args.max_size, fast=args.fast, output=output)
+    report = open(args.report, 'w', newline='', encoding='utf-8') if args.report else None
+    writer = csv.writer(report) if report else None
+    if writer:
+        writer.writerow(['source', 'source_bytes', 'output', 'format', 'output_bytes', 'encode_ms'])
+    total_files = len(args.files)
+    failed = 0
+    encoded_files = []
+    try:
+        for done, (index, file_path, encoded, error) in enumerate(results, start=1):
+            if error:
+                failed += 1
+                print(f"[{done}/{total_files}] {file_path}: {error}", file=sys.stderr)
+                continue
+            encoded = encoded if args.preset else [encoded]
+            encoded_files.extend(encoded)
+            for result in encoded:
+                timing = 'cached' if result.cached else f"{result.seconds * 1000:.0f} ms"
+                print(f"[{done}/{total_files}] {result.path}  {format_bytes(result.size)}  {timing}")
+                if writer:
+                    writer.writerow([file_path, os.path.getsize(file_path), result.path, result.format,
+                                     result.size, f"{result.seconds * 1000:.1f}"])
+    finally:
+        if report:
+            report.close()
+        if cache:
+            cache.close()
+    print(summarize(encoded_files), file=sys.stderr)
+    return 1 if failed else 0
+
+
+def run_move(args):
+    from .mover import COPY, MOVE, parse_keywords, process_files
+    from .transfer import has_pending_moves, recover_moves
+
+    if args.resume or args.rollback:
+        if not has_pending_moves(args.target):
+            print(f"nothing to recover in {args.target}", file=sys.stderr)
+            return 0
+        count = recover_moves(args.target, rollback=args.rollback)
+        print(f"{'Rolled back' if args.rollback else 'Resumed'} {count} files.", file=sys.stderr)
+        return 0
+
+    keywords = list(args.keyword)
+    if args.keywords_file:
+        with open(args.keywords_file, 'r', encoding='utf-8') as f:
+            keywords.extend(parse_keywords(f.read()))
+    if not keywords:
+        print("error: no keywords given", file=sys.stderr)
+        return 2
+    operation = COPY if args.copy else MOVE
+    try:
+        processed_files = process_files(args.source, args.target, keywords, operation,
+                                        match_mode=args.mode, ignore_case=args.ignore_case,
+                                        transfer_workers=args.jobs)
+    except RuntimeError as e:
+        print(f"error: {e} (use --resume or --rollback)", file=sys.stderr)
+        return 1
+    for file_name in processed_files:
+        print(file_name)
+    print(f"{len(processed_files)} files processed.", file=sys.stderr)
+    return 0
+
+
+def run_snippets(args):
+    from . import snippets as store
+
+    snippet_store = store.SnippetStore(args.data)
+    try:
+        return _run_snippet_action(args, store, snippet_store)
+    finally:
+        snippet_store.close()
+
+
+def _run_snippet_action(args, store, snippet_store):
+    snippets = snippet_store.load()
+
+    if args.action == 'list':
+        for snippet in snippets:
+            label = snippet['title'] or snippet['text'].replace('\n', ' ')
+            shortcut = f"  [{snippet['shortcut']}]" if snippet['shortcut'] else ""
+            print(f"{snippet['id'][:8]}  {label[:60]}{shortcut}")
+        return 0
+
+    if args.action == 'search':
+        from .search import SearchIndex
+
+        found = SearchIndex(snippets).search(args.query, args.limit)
+        by_id = {snippet['id']: snippet for snippet in snippets}
+        for id in found:
+            label = by_id[id]['title'] or by_id[id]['text'].replace('\n', ' ')
+            print(f"{id[:8]}  {label[:60]}")
+        return 0 if found else 1
+
+    if args.action == 'add':
+        text = args.text if args.text is not None else sys.stdin.read()
+        snippet = store.new_snippet(text, args.title)
+        snippet_store.save(snippet, snippet_store.next_position())
+        print(snippet['id'])
+        return 0
+
+    snippet = store.find_snippet(snippets, args.id)
+    if snippet is None:
+        print(f"error: no unique snippet with id {args.id!r}", file=sys.stderr)
+        return 1
+    if args.action == 'show':
+        sys.stdout.write(snippet['text'])
+    elif args.action == 'remove':
+        snippet_store.delete(snippet['id'])
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='file-utilities', description="File Utilities without the GUI.")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    rename = subparsers.add_parser('rename', help="rename files to KEYWORD01, KEYWORD02, ... or a template")
+    rename.add_argument('keyword', help="keyword, or a template such as '{parent}_{taken:%%Y%%m%%d}_{n:03}' "
+                                        "(tokens: n, stem, ext, parent, mtime, ctime, size, width, height, taken, hash)")
+    rename.add_argument('files', nargs='+')
+    rename.add_argument('-s', '--start', type=int, default=1, help="first number (default: 1)")
+    rename.set_defaults(func=run_rename)
+
+    undo_rename = subparsers.add_parser('undo-rename', help="undo the last rename (or roll back an interrupted one)")
+    undo_rename.add_argument('--resume', action='store_true', help="finish an interrupted rename instead of undoing it")
+    undo_rename.set_defaults(func=run_undo_rename)
+
+    resize = subparsers.add_parser('resize', help="crop images to an aspect ratio")
+    resize.add_argument('files', nargs='+', help="image files to resize")
+    resize.add_argument('-r', '--ratio', type=parse_ratio, default=(16, 9), help="target aspect ratio, e.g. 16:9 (default)")
+    resize.add_argument('-w', '--workers', type=int, default=None, help="number of worker processes (default: CPU count)")
+    resize.add_argument('--fast', action='store_true', help="decode JPEGs at reduced scale before the final LANCZOS pass")
+    # 프리셋은 크기마다 긴 변을 정하므로 --max-size와 함께 쓸 수 없다
+    sizes = resize.add_mutually_exclusive_group()
+    sizes.add_argument('-m', '--max-size', type=int, default=None, help="limit the longer output edge to this many pixels")
+    sizes.add_argument('-p', '--preset', help="write every size of a JSON preset file from one decode, "
+                                              "or 'default' (2048, 1024, 512, 256 and a 256 square thumb)")
+    resize.add_argument('-f', '--format', type=str.upper, choices=('JPEG', 'WEBP', 'PNG', 'AVIF'),
+                        help="output format (default: same as the source)")
+    resize.add_argument('-q', '--quality', type=int, help="JPEG/WebP/AVIF quality 1-100 (default: encoder default)")
+    resize.add_argument('--progressive', action='store_true', help="write progressive JPEGs")
+    resize.add_argument('--optimize', action='store_true', help="spend more time for smaller JPEG/PNG/WebP files")
+    resize.add_argument('--subsampling', choices=('4:4:4', '4:2:2', '4:2:0'),
+                        help="JPEG/AVIF chroma subsampling (default: encoder default)")
+    resize.add_argument('--metadata', choices=('keep', 'strip', 'icc'), default='icc',
+                        help="keep EXIF/XMP/ICC, strip everything, or keep only the ICC profile (default)")
+    resize.add_argument('--report', metavar='CSV', help="write output bytes and encoding time per file to CSV")
+    resize.add_argument('--cache', nargs='?', const='resize_cache', metavar='DIR',
+                        help="skip images already resized with the same settings, using a result cache "
+                             "in DIR (default: resize_cache)")
+    resize.add_argument('--cache-size', type=int, default=2048, metavar='MB',
+                        help="evict the least recently used results above this size (default: 2048)")
+    resize.add_argument('--cache-by-mtime', action='store_true',
+                        help="key the cache by file size and modification time instead of a content hash "
+                             "(faster first run, no duplicate detection)")
+    resize.set_defaults(func=run_resize)
+
+    move = subparsers.add_parser('move', help="move or copy files whose name contains a keyword")
+    move.add_argument('source')
+    move.add_argument('target')
+    move.add_argument('-k', '--keyword', action='append', default=[], help="keyword to match (repeatable)")
+    move.add_argument('-f', '--keywords-file', help="file with one keyword per line")
+    move.add_argument('-m', '--mode', choices=('substring', 'glob', 'regex', 'token'), default='substring',
+                      help="how keywords match file names (default: substring)")
+    move.add_argument('-i', '--ignore-case', action='store_true', help="match keywords case-insensitively")
+    move.add_argument('--copy', action='store_true', help="copy instead of move")
+    move.add_argument('-j', '--jobs', type=int, default=4, help="number of transfers to run at once (default: 4)")
+    recovery = move.add_mutually_exclusive_group()
+    recovery.add_argument('--resume', action='store_true', help="finish an interrupted move into TARGET and exit")
+    recovery.add_argument('--rollback', action='store_true', help="undo an interrupted move into TARGET and exit")
+    move.set_defaults(func=run_move)
+
+    snippets = subparsers.add_parser('snippets', help="manage Copy the txt snippets")
+    snippets.add_argument('--data', default='snippets.db',
+                          help="snippet database (default: snippets.db; text_data.json next to it is imported once)")
+    actions = snippets.add_subparsers(dest='action', required=True)
+    actions.add_parser('list', help="list snippets")
+    search = actions.add_parser('search', help="search titles and text (prefix and typo tolerant)")
+    search.add_argument('query')
+    search.add_argument('-n', '--limit', type=int, default=20, help="show at most this many matches (default: 20)")
+    add = actions.add_parser('add', help="add a snippet (reads stdin when TEXT is omitted)")
+    add.add_argument('text', nargs='?')
+    add.add_argument('-t', '--title')
+    for action in ('show', 'remove'):
+        actions.add_parser(action, help=f"{action} a snippet").add_argument('id')
+    snippets.set_defaults(func=run_snippets)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
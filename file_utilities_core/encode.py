@@ -0,0 +1,187 @@
+"""리사이즈 결과의 저장 형식과 인코더 설정.
+
+OutputOptions로 형식(JPEG, WebP, PNG, 가능하면 AVIF), 품질, 프로그레시브/최적화,
+크로마 서브샘플링, 메타데이터 정책(모두 유지, 모두 제거, ICC 프로필만 유지)을
+정하고, save_image()는 저장한 파일의 크기와 인코딩 시간을 EncodedFile로 돌려준다.
+"""
+import contextlib
+import os
+import time
+
+from PIL import Image
+
+# 저장 형식 -> 확장자
+OUTPUT_FORMATS = {'JPEG': '.jpg', 'WEBP': '.webp', 'PNG': '.png', 'AVIF': '.avif'}
+
+KEEP_METADATA = 'keep'
+STRIP_METADATA = 'strip'
+KEEP_ICC = 'icc'
+METADATA_POLICIES = (KEEP_METADATA, STRIP_METADATA, KEEP_ICC)
+
+# JPEG과 AVIF만 쓴다 (WebP 손실 압축은 항상 4:2:0)
+SUBSAMPLINGS = ('4:4:4', '4:2:2', '4:2:0')
+
+# 결과 파일을 다 쓸 때까지 쓰는 임시 이름의 접미사
+PARTIAL_SUFFIX = '.fu-writing'
+
+# 저장할 때 각 메타데이터를 받아 쓰는 Pillow 인코더
+_ICC_FORMATS = ('JPEG', 'PNG', 'WEBP', 'AVIF', 'TIFF')
+_EXIF_FORMATS = ('JPEG', 'PNG', 'WEBP', 'AVIF', 'TIFF')
+_XMP_FORMATS = ('JPEG', 'WEBP', 'AVIF')
+# 인자가 없으면 이미지의 info(리사이즈해도 원본 것이 따라온다)에서 ICC 프로필을 가져가는 인코더
+_ICC_FROM_INFO = ('PNG', 'AVIF', 'TIFF')
+
+
+def available_formats():
+    """이 Pillow로 저장할 수 있는 OUTPUT_FORMATS (AVIF는 빌드에 따라 없다)."""
+    Image.init()
+    return [name for name in OUTPUT_FORMATS if name in Image.SAVE]
+
+
+class OutputOptions:
+    """저장 설정. format이 None이면 원본 형식, quality가 None이면 인코더 기본값."""
+
+    def __init__(self, format=None, quality=None, progressive=False, optimize=False,
+                 subsampling=None, metadata=KEEP_ICC):
+        if format is not None:
+            format = format.upper()
+            if format not in OUTPUT_FORMATS:
+                raise ValueError(f"unsupported output format: {format!r}")
+            if format not in available_formats():
+                raise ValueError(f"{format} is not supported by this Pillow build")
+        if quality is not None and not 1 <= quality <= 100:
+            raise ValueError(f"quality must be between 1 and 100: {quality!r}")
+        if subsampling is not None and subsampling not in SUBSAMPLINGS:
+            raise ValueError(f"unknown chroma subsampling: {subsampling!r}")
+        if metadata not in METADATA_POLICIES:
+            raise ValueError(f"unknown metadata policy: {metadata!r}")
+        self.format = format
+        self.quality = quality
+        self.progressive = progressive
+        self.optimize = optimize
+        self.subsampling = subsampling
+        self.metadata = metadata
+
+    def extension(self, ext):
+        """원본 확장자 ext 대신 쓸 결과 파일의 확장자."""
+        return OUTPUT_FORMATS[self.format] if self.format else ext
+
+    def save_arguments(self, format, source):
+        """format으로 저장할 때 Image.save()에 넘길 인자. source는 메타데이터를 가져올 원본."""
+        arguments = {}
+        if self.quality is not None and format in ('JPEG', 'WEBP', 'AVIF'):
+            arguments['quality'] = self.quality
+        if format == 'JPEG':
+            arguments['progressive'] = self.progressive
+            arguments['optimize'] = self.optimize
+        elif format == 'PNG':
+            arguments['optimize'] = self.optimize
+        elif format == 'WEBP' and self.optimize:
+            arguments['method'] = 6  # 가장 느리고 작은 압축
+        if self.subsampling and format in ('JPEG', 'AVIF'):
+            arguments['subsampling'] = self.subsampling
+
+        # 메타데이터는 인코더가 지원하고 원본에 있을 때만 넘긴다
+        icc_profile = source.info.get('icc_profile')
+        if icc_profile and format in _ICC_FORMATS:
+            if self.metadata != STRIP_METADATA:
+                arguments['icc_profile'] = icc_profile
+            elif format in _ICC_FROM_INFO:
+                arguments['icc_profile'] = None  # 이미지 info의 프로필을 가져가지 않게 막는다
+        if self.metadata == KEEP_METADATA:
+            exif = source.getexif() if format in _EXIF_FORMATS else None
+            if exif:
+                arguments['exif'] = exif
+            if source.info.get('xmp') and format in _XMP_FORMATS:
+                arguments['xmp'] = source.info['xmp']
+        return arguments
+
+    def __repr__(self):
+        return (f"OutputOptions(format={self.format!r}, quality={self.quality!r}, "
+                f"progressive={self.progressive!r}, optimize={self.optimize!r}, "
+                f"subsampling={self.subsampling!r}, metadata={self.metadata!r})")
+
+
+class EncodedFile:
+    """저장한 결과 파일 하나: 경로, 형식, 바이트 수, 저장(인코딩)에 걸린 초.
+
+    cached가 참이면 다시 만들지 않고 resize_cache에서 가져온 결과이다 (seconds는 0).
+    """
+
+    def __init__(self, path, format, size, seconds, cached=False):
+        self.path = path
+        self.format = format
+        self.size = size
+        self.seconds = seconds
+        self.cached = cached
+
+    def __repr__(self):
+        cached = ", cached=True" if self.cached else ""
+        return f"EncodedFile({self.path!r}, {self.format!r}, {self.size!r}, {self.seconds:.3f}{cached})"
+
+
+def output_format(path):
+    """확장자로 Pillow 저장 형식을 정한다."""
+    Image.init()
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in Image.EXTENSION:
+        raise ValueError(f"unknown image extension: {ext!r}")
+    return Image.EXTENSION[ext]
+
+
+def _encodable(image, format):
+    # 알파가 없는 JPEG과 CMYK가 없는 PNG에 맞게 모드를 바꾼다 (나머지는 인코더가 바꾼다)
+    if format == 'JPEG' and image.mode not in ('RGB', 'L', 'CMYK'):
+        return image.convert('RGB')
+    if format == 'PNG' and image.mode == 'CMYK':
+        return image.convert('RGB')
+    return image
+
+
+@contextlib.contextmanager
+def replacing(path):
+    """path 대신 쓸 임시 경로를 주고, 다 쓰면 path로 바꿔 넣는다 (실패하면 임시 파일을 지운다).
+
+    기존 파일을 제자리에서 고쳐 쓰지 않으므로 그 파일에 걸린 하드 링크(resize_cache가
+    보관한 결과)는 바뀌지 않고, 쓰다 멈춰도 반쯤 쓴 결과가 남지 않는다.
+    """
+    partial = path + PARTIAL_SUFFIX
+    try:
+        yield partial
+        os.replace(partial, path)
+    except BaseException:
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+        raise
+
+
+def save_image(image, path, source, options=None):
+    """image를 path의 확장자에 맞는 형식으로 options대로 저장하고 EncodedFile을 반환."""
+    options = options or OutputOptions()
+    format = output_format(path)
+    start = time.perf_counter()
+    with replacing(path) as partial:
+        _encodable(image, format).save(partial, format, **options.save_arguments(format, source))
+    seconds = time.perf_counter() - start
+    return EncodedFile(path, format, os.path.getsize(path), seconds)
+
+
+def format_bytes(size):
+    """바이트 수를 ``12.3 MB`` 처럼 읽기 쉽게."""
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} TB"
+
+
+def summarize(encoded_files):
+    """결과 파일 목록의 총 크기와 인코딩 시간을 한 줄로."""
+    encoded_files = list(encoded_files)
+    total_size = sum(encoded.size for encoded in encoded_files)
+    total_seconds = sum(encoded.seconds for encoded in encoded_files)
+    cached = sum(1 for encoded in encoded_files if encoded.cached)
+    return (f"{len(encoded_files)} files{f' ({cached} from cache)' if cached else ''}, "
+            f"{format_bytes(total_size)} written, {total_seconds:.2f} s encoding")
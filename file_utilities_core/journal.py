@@ -0,0 +1,49 @@
+"""추가 전용(append-only) 작업 기록 파일.
+
+파일 작업을 하기 전에 무엇을 할지 먼저 기록해 두면, 도중에 프로그램이 죽어도
+다음 실행에서 이어서 하거나 되돌릴 수 있다. 레코드는 JSON 배열 한 줄씩 쓴다.
+"""
+import json
+import os
+import threading
+
+
+class Journal:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def append(self, *fields):
+        """레코드를 버퍼에 추가. 디스크에 남는 것은 commit() 이후이다."""
+        line = json.dumps(fields, ensure_ascii=False, separators=(',', ':'))
+        with self._lock:
+            self._file.write(line + '\n')
+
+    def commit(self):
+        """지금까지 추가한 레코드를 디스크에 확실히 기록 (fsync)."""
+        with self._lock:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self, remove=False):
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+        if remove:
+            os.remove(self.path)
+
+    @staticmethod
+    def read(path):
+        """기록된 레코드 목록. 쓰다가 끊긴 마지막 줄은 무시한다."""
+        records = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break
+        return records
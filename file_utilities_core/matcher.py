@@ -0,0 +1,137 @@
+"""여러 키워드를 파일 이름 한 번 훑기로 검사하는 매처.
+
+키워드가 수천 개여도 `any(keyword in name ...)` 처럼 키워드 수에 비례하지 않도록
+한 번 컴파일해 두고 모든 파일에 재사용한다.
+"""
+import fnmatch
+import re
+
+SUBSTRING = 'substring'
+GLOB = 'glob'
+REGEX = 'regex'
+TOKEN = 'token'
+MODES = (SUBSTRING, GLOB, REGEX, TOKEN)
+
+
+class AhoCorasick:
+    """Aho–Corasick 오토마톤. 텍스트 길이에 비례하는 시간에 모든 키워드를 찾는다."""
+
+    def __init__(self, patterns):
+        self.goto = [{}]      # 트라이 간선
+        self.fail = [0]
+        self.lengths = [()]   # 각 노드에서 끝나는 키워드 길이들 (fail 링크 포함)
+        for pattern in patterns:
+            self._insert(pattern)
+        self._build()
+        # 실제로 지나간 (노드, 문자) 전이를 캐시해서 fail 링크를 반복해 타지 않도록 한다
+        self.delta = [dict(edges) for edges in self.goto]
+
+    def _insert(self, pattern):
+        node = 0
+        for ch in pattern:
+            next_node = self.goto[node].get(ch)
+            if next_node is None:
+                next_node = len(self.goto)
+                self.goto[node][ch] = next_node
+                self.goto.append({})
+                self.fail.append(0)
+                self.lengths.append(())
+            node = next_node
+        if len(pattern) not in self.lengths[node]:
+            self.lengths[node] += (len(pattern),)
+
+    def _build(self):
+        # BFS 순서로 fail 링크를 계산하고 출력 길이를 합친다
+        order = list(self.goto[0].values())
+        for node in order:
+            for ch, child in self.goto[node].items():
+                order.append(child)
+                state = self.fail[node]
+                while state and ch not in self.goto[state]:
+                    state = self.fail[state]
+                target = self.goto[state].get(ch, 0)
+                self.fail[child] = target if target != child else 0
+                self.lengths[child] += self.lengths[self.fail[child]]
+
+    def _step(self, node, ch):
+        state = node
+        while True:
+            next_node = self.goto[state].get(ch)
+            if next_node is not None or state == 0:
+                next_node = next_node or 0
+                break
+            state = self.fail[state]
+        self.delta[node][ch] = next_node
+        return next_node
+
+    def search(self, text):
+        """키워드가 하나라도 들어 있으면 True."""
+        delta = self.delta
+        lengths = self.lengths
+        node = 0
+        for ch in text:
+            next_node = delta[node].get(ch)
+            node = self._step(node, ch) if next_node is None else next_node
+            if lengths[node]:
+                return True
+        return False
+
+    def iter_matches(self, text):
+        """``(시작, 끝)`` 위치를 끝 위치 순서로 yield."""
+        delta = self.delta
+        node = 0
+        for end, ch in enumerate(text, start=1):
+            next_node = delta[node].get(ch)
+            node = self._step(node, ch) if next_node is None else next_node
+            for length in self.lengths[node]:
+                yield end - length, end
+
+
+def _is_word_char(ch):
+    return ch.isalnum()
+
+
+def compile_matcher(keywords, mode=SUBSTRING, ignore_case=False):
+    """키워드 목록을 `match(file_name) -> bool` 함수로 컴파일.
+
+    mode:
+        substring  키워드가 이름 어디든 들어 있으면 일치 (기본값)
+        glob       `*.jpg`, `IMG_00??.*` 같은 와일드카드가 이름 전체와 일치
+        regex      정규식이 이름의 일부와 일치
+        token      키워드가 영숫자가 아닌 문자(또는 처음/끝)로 둘러싸여 있을 때 일치
+
+    잘못된 mode나 정규식은 ValueError.
+    """
+    keywords = [keyword for keyword in keywords if keyword]
+    if mode not in MODES:
+        raise ValueError(f"unknown match mode: {mode!r}")
+    if not keywords:
+        return lambda file_name: False
+
+    if mode in (GLOB, REGEX):
+        if mode == GLOB:
+            patterns = [fnmatch.translate(keyword) for keyword in keywords]
+        else:
+            patterns = keywords
+        try:
+            regex = re.compile('|'.join(f'(?:{pattern})' for pattern in patterns), re.IGNORECASE if ignore_case else 0)
+        except re.error as e:
+            raise ValueError(f"invalid pattern: {e}")
+        return regex.match if mode == GLOB else regex.search
+
+    fold = str.casefold if ignore_case else None
+    automaton = AhoCorasick(fold(keyword) if fold else keyword for keyword in keywords)
+
+    if mode == SUBSTRING:
+        if fold:
+            return lambda file_name: automaton.search(fold(file_name))
+        return automaton.search
+
+    def match_token(file_name):
+        text = fold(file_name) if fold else file_name
+        for start, end in automaton.iter_matches(text):
+            if (start == 0 or not _is_word_char(text[start - 1])) and \
+                    (end == len(text) or not _is_word_char(text[end])):
+                return True
+        return False
+    return match_token
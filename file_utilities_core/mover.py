@@ -0,0 +1,306 @@
+"""키워드가 포함된 파일을 찾아 다른 폴더로 이동/복사하는 핵심 로직."""
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .matcher import SUBSTRING, compile_matcher
+from .names import NameIndex
+from .transfer import TRANSFER_WORKERS, MoveJournal, TransferEngine, has_pending_moves
+
+MOVE = 'move'
+COPY = 'copy'
+
+# 폴더 탐색 스레드 수 (네트워크 드라이브의 지연 시간을 숨기기 위해 CPU 수보다 많게)
+SCAN_WORKERS = 16
+
+# 같은 장치 안의 이동은 이만큼 모아서 한 번의 기록(fsync)으로 이름만 바꾼다
+RENAME_BATCH_SIZE = 256
+
+_SCAN_DONE = object()
+
+
+class ProcessStats:
+    """process_files() 진행 상황. 실행 중에 다른 스레드에서 읽어도 된다."""
+
+    def __init__(self):
+        self.scanned = 0        # 검사한 파일 수
+        self.matched = 0        # 키워드와 일치한 파일 수
+        self.processed = 0      # 처리가 끝난 파일 수
+        self.bytes_matched = 0  # 옮겨야 할 전체 바이트 (탐색 중에는 계속 늘어남)
+        self.bytes_done = 0     # 옮긴 바이트
+        self.scan_done = False
+        self.started = time.monotonic()
+
+    @property
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    @property
+    def throughput(self):
+        """초당 바이트."""
+        elapsed = self.elapsed
+        return self.bytes_done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self):
+        """남은 예상 시간(초). 아직 알 수 없으면 None. 탐색이 끝나기 전에는 하한값이다."""
+        throughput = self.throughput
+        if not throughput:
+            return None
+        return max(0.0, (self.bytes_matched - self.bytes_done) / throughput)
+
+    def snapshot(self):
+        return {
+            'scanned': self.scanned,
+            'matched': self.matched,
+            'processed': self.processed,
+            'bytes_matched': self.bytes_matched,
+            'bytes_done': self.bytes_done,
+            'scan_done': self.scan_done,
+            'elapsed': self.elapsed,
+            'throughput': self.throughput,
+            'eta': self.eta,
+        }
+
+
+class ProcessControl:
+    """다른 스레드에서 실행 중인 process_files()를 일시정지/재개/취소."""
+
+    def __init__(self):
+        self._cancelled = threading.Event()
+        self._running = threading.Event()
+        self._running.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def paused(self):
+        return not self._running.is_set()
+
+    def pause(self):
+        self._running.clear()
+
+    def resume(self):
+        self._running.set()
+
+    def cancel(self):
+        self._cancelled.set()
+        self._running.set()  # 일시정지 중이면 깨워서 바로 끝나게 함
+
+    def wait(self):
+        """일시정지 중이면 재개될 때까지 기다리고, 계속 진행해도 되면 True."""
+        self._running.wait()
+        return not self._cancelled.is_set()
+
+
+def parse_keywords(text):
+    """줄 단위로 입력된 키워드 목록에서 빈 줄을 제외."""
+    return [keyword for keyword in text.split('\n') if keyword]
+
+
+def scan_tree(source_folder, match, workers=SCAN_WORKERS, on_scanned=None, on_finished=None):
+    """하위 폴더들을 스레드 풀에서 병렬로 탐색하며 match(file_name)가 참인 파일을 yield.
+
+    찾는 즉시 ``(root, file_name, size)`` 를 돌려주므로 탐색이 끝나기 전에 다음
+    단계를 시작할 수 있다. os.walk와 같이 심볼릭 링크 폴더는 따라가지 않고, 읽을
+    수 없는 폴더는 건너뛴다. 순서는 보장하지 않는다.
+
+    on_scanned(파일 수, 일치 목록)는 폴더 하나를 읽을 때마다, on_finished()는 모든
+    폴더를 다 읽은 순간 호출된다 (아직 yield되지 않은 결과가 남아 있을 수 있음).
+    둘 다 탐색 스레드에서 불리므로 스레드 안전해야 한다.
+    """
+    results = queue.Queue()
+    stop = threading.Event()
+    pending = 0
+    lock = threading.Lock()
+
+    def submit(directory):
+        nonlocal pending
+        with lock:
+            pending += 1
+        pool.submit(scan, directory)
+
+    def scan(directory):
+        nonlocal pending
+        try:
+            if stop.is_set():
+                return
+            matches = []
+            file_count = 0
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        if not entry.is_symlink():
+                            submit(entry.path)
+                        continue
+                    file_count += 1
+                    if match(entry.name):
+                        # 크기는 탐색 스레드에서 미리 읽어 둔다 (진행률 계산용)
+                        try:
+                            size = entry.stat().st_size
+                        except OSError:
+                            size = 0
+                        matches.append((directory, entry.name, size))
+            if on_scanned:
+                on_scanned(file_count, matches)
+            if matches:
+                results.put(matches)
+        except OSError:
+            pass
+        except BaseException as e:
+            results.put(e)
+        finally:
+            with lock:
+                pending -= 1
+                finished = pending == 0
+            if finished:
+                if on_finished:
+                    on_finished()
+                results.put(_SCAN_DONE)
+
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='scan')
+    try:
+        submit(source_folder)
+        while True:
+            batch = results.get()
+            if batch is _SCAN_DONE:
+                break
+            if isinstance(batch, BaseException):
+                raise batch
+            yield from batch
+    finally:
+        # 소비하는 쪽이 중간에 멈추면 남은 탐색도 중단
+        stop.set()
+        pool.shutdown(wait=True)
+
+
+def process_files(source_folder, target_folder, keywords, operation=MOVE, scan_workers=SCAN_WORKERS,
+                  match_mode=SUBSTRING, ignore_case=False, stats=None, control=None, progress=None,
+                  transfer_workers=TRANSFER_WORKERS):
+    """키워드와 일치하는 파일을 처리하고 처리된 파일 이름 목록을 반환.
+
+    소스 폴더 바로 아래의 파일은 목록에만 추가하고, 하위 폴더의 파일은 타겟
+    폴더로 옮긴다. 이름이 겹치면 `이름_1`, `이름_2` ... 로 바꾸는데, 타겟 폴더는
+    처음에 한 번만 읽어 NameIndex로 관리한다. 폴더 탐색은 scan_tree()가 백그라운드에서
+    진행하며, 찾은 파일은 탐색이 끝나기를 기다리지 않고 바로 처리한다. 키워드 매칭 방식은 matcher.compile_matcher()를 따른다.
+    전송은 TransferEngine이 transfer_workers 개씩 동시에 실행한다.
+
+    stats(ProcessStats)를 주면 진행 상황이 갱신되고, control(ProcessControl)로
+    일시정지/취소할 수 있다. 취소되면 그때까지 처리한 목록을 반환한다.
+    progress(stats, file_name)는 파일 하나를 처리할 때마다 (전송 스레드에서도) 호출된다.
+    전송 중 오류가 나면 새 전송을 멈추고, 진행 중인 전송이 끝난 뒤 첫 오류를 올린다.
+
+    이동은 타겟 폴더의 기록 파일(MoveJournal)에 남기며 진행한다. 같은 장치 안의 이동은
+    RENAME_BATCH_SIZE 개씩 묶어 이름만 바꾸고, 다른 장치로는 staged_move()로 옮긴다.
+    정상적으로 끝나거나 취소되면 기록 파일을 지우고, 오류로 멈추면 남겨 두어
+    transfer.recover_moves()로 이어서 하거나 되돌릴 수 있게 한다. 기록이 남아 있는
+    상태에서는 이동을 시작하지 않는다 (RuntimeError).
+    """
+    if operation not in (MOVE, COPY):
+        raise ValueError(f"unknown operation: {operation!r}")
+    if operation == MOVE and has_pending_moves(target_folder):
+        raise RuntimeError(f"an interrupted move into {target_folder} has to be resumed or rolled back first")
+    # 키워드 매처는 실행마다 한 번만 만든다
+    match = compile_matcher(keywords, match_mode, ignore_case)
+    processed_files = []
+    stats = stats or ProcessStats()
+    stats_lock = threading.Lock()
+
+    def on_scanned(file_count, matches):
+        # 탐색 스레드에서 호출: 찾는 즉시 세야 남은 양과 ETA를 알 수 있다
+        moving = sum(size for root, file_name, size in matches if root != source_folder)
+        with stats_lock:
+            stats.scanned += file_count
+            stats.matched += len(matches)
+            stats.bytes_matched += moving
+
+    def on_finished():
+        stats.scan_done = True
+
+    # 타겟 폴더는 한 번만 읽고, 아직 끝나지 않은 전송이 잡아 둔 이름도 여기에 예약한다
+    names = NameIndex(target_folder)
+    errors = []
+    # 전송 대기열이 끝없이 쌓이지 않도록 동시에 맡겨 둘 작업 수를 제한
+    in_flight = threading.BoundedSemaphore(max(1, transfer_workers) * 4)
+
+    def finish(file_name, size):
+        with stats_lock:
+            stats.bytes_done += size
+            stats.processed += 1
+            processed_files.append(file_name)
+        if progress:
+            progress(stats, file_name)
+
+    def transfer_done(future, target_file, size):
+        in_flight.release()
+        error = future.exception()
+        if error is not None:
+            errors.append(error)
+            return
+        finish(os.path.basename(target_file), size)
+
+    journal = MoveJournal(target_folder) if operation == MOVE else None
+    renames = []
+
+    def flush_renames():
+        # 기록을 먼저 한 번에 남긴 뒤 이름을 바꾼다
+        ids = journal.begin('rename', [(source_file, target_file) for source_file, target_file, size in renames])
+        try:
+            for move_id, (source_file, target_file, size) in zip(ids, renames):
+                os.rename(source_file, target_file)
+                journal.done([move_id])
+                finish(os.path.basename(target_file), size)
+        except OSError as e:
+            errors.append(e)
+        renames.clear()
+
+    try:
+        with TransferEngine(transfer_workers, journal=journal) as engine:
+            for root, file_name, size in scan_tree(source_folder, match, scan_workers, on_scanned, on_finished):
+                if errors or (control and not control.wait()):
+                    break
+                source_file = os.path.join(root, file_name)
+
+                # 원본 폴더 구조에서의 상대 경로 계산
+                relative_path = os.path.relpath(root, source_folder)
+                target_dir = os.path.join(target_folder, relative_path)
+
+                # 소스 폴더의 직접적인 하위가 아닌 경우만 중복 검사 수행
+                if relative_path != '.':
+                    # 타겟 파일 경로 설정 (파일명 중복 시 `이름_N` 으로)
+                    target_file = os.path.join(target_folder, names.reserve(file_name))
+
+                    # 파일 이동 또는 복사
+                    os.makedirs(target_dir, exist_ok=True)
+                    if operation == MOVE and engine.same_device(source_file, target_file):
+                        renames.append((source_file, target_file, size))
+                        if len(renames) >= RENAME_BATCH_SIZE:
+                            flush_renames()
+                        continue
+                    in_flight.acquire()
+                    future = engine.submit(source_file, target_file, move=operation == MOVE)
+                    future.add_done_callback(lambda future, target_file=target_file, size=size: transfer_done(future, target_file, size))
+                else:
+                    # 소스 폴더에 직접 위치한 파일은 아무런 조치 없이 목록에 추가만 함
+                    finish(file_name, 0)
+            if renames and not errors:
+                flush_renames()
+    except BaseException:
+        # 예상하지 못한 오류: 기록을 남겨 두고 다음 실행에서 복구하게 한다
+        if journal:
+            journal.close(remove=False)
+        raise
+
+    if journal:
+        journal.close(remove=not errors)
+    if errors:
+        raise errors[0]
+    return processed_files
@@ -0,0 +1,51 @@
+"""대상 폴더의 파일 이름 색인. 겹치는 이름에 붙일 `_1`, `_2` ... 를 빠르게 정한다."""
+import os
+import threading
+
+
+class NameIndex:
+    """폴더를 한 번만 읽어 이름을 메모리에 두고, 새 이름을 예약해 준다.
+
+    이름마다 다음에 시도할 번호를 기억하므로 같은 이름이 수천 번 겹쳐도 파일마다
+    os.path.exists를 반복하지 않는다. 예약은 잠금 안에서 하므로 여러 전송 스레드가
+    동시에 써도 같은 이름을 두 번 내주지 않는다. 대소문자 구분은 os.path.normcase를 따른다.
+    """
+
+    def __init__(self, folder):
+        self.folder = folder
+        self._names = set()
+        self._counters = {}  # 원래 이름 -> 다음에 시도할 번호
+        self._lock = threading.Lock()
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    self._names.add(os.path.normcase(entry.name))
+        except FileNotFoundError:
+            pass
+
+    def __contains__(self, file_name):
+        with self._lock:
+            return os.path.normcase(file_name) in self._names
+
+    def reserve(self, file_name):
+        """file_name이 비어 있으면 그대로, 아니면 `이름_N.확장자` 를 예약하고 반환."""
+        key = os.path.normcase(file_name)
+        with self._lock:
+            if key not in self._names:
+                self._names.add(key)
+                return file_name
+            base, extension = os.path.splitext(file_name)
+            counter = self._counters.get(key, 1)
+            while True:
+                candidate = f"{base}_{counter}{extension}"
+                counter += 1
+                if os.path.normcase(candidate) not in self._names:
+                    break
+            self._counters[key] = counter
+            self._names.add(os.path.normcase(candidate))
+            return candidate
+
+    def release(self, file_name):
+        """예약을 취소 (그 이름으로 파일을 만들지 못했을 때)."""
+        with self._lock:
+            self._names.discard(os.path.normcase(file_name))
@@ -0,0 +1,96 @@
+"""자연 정렬 ("img2" < "img10") 키와 정렬된 목록 병합.
+
+정규식은 한 번만 컴파일하고, 경로별 키는 크기가 정해진 LRU 캐시에 둔다. 파일을
+추가할 때마다 전체를 다시 정렬하지 않고 merge_sorted()로 새 경로만 끼워 넣는다.
+"""
+import functools
+import locale
+import re
+
+# 경로별로 기억해 둘 정렬 키 수
+KEY_CACHE_SIZE = 1 << 18
+
+_DIGITS = re.compile(r'(\d+)')
+
+
+def _split(text):
+    # split 결과는 항상 문자, 숫자, 문자, ... 순서라 같은 자리끼리는 타입이 같다
+    parts = _DIGITS.split(text)
+    parts[1::2] = map(int, parts[1::2])
+    return parts
+
+
+@functools.lru_cache(maxsize=KEY_CACHE_SIZE)
+def natural_sort_key(s):
+    """숫자를 포함한 문자열을 올바르게 정렬 (대소문자 무시: str.lower)."""
+    # 부분마다 바꾸는 것보다 전체를 한 번에 소문자로 바꾸는 것이 빠르다
+    return tuple(_split(s.lower()))
+
+
+@functools.lru_cache(maxsize=KEY_CACHE_SIZE)
+def casefold_sort_key(s):
+    """natural_sort_key와 같지만 str.casefold로 비교 ('ß' == 'ss' 등)."""
+    return tuple(_split(s.casefold()))
+
+
+@functools.lru_cache(maxsize=KEY_CACHE_SIZE)
+def locale_sort_key(s):
+    """문자 부분을 현재 로케일(LC_COLLATE)의 순서로 비교 (가나다, 악센트 등).
+
+    로케일을 바꾼 뒤에는 locale_sort_key.cache_clear()를 호출해야 한다.
+    """
+    parts = _split(s)
+    parts[0::2] = map(locale.strxfrm, parts[0::2])
+    return tuple(parts)
+
+
+SORT_KEYS = {
+    'natural': natural_sort_key,
+    'casefold': casefold_sort_key,
+    'locale': locale_sort_key,
+}
+
+
+def insertion_points(sorted_items, sorted_new, key=natural_sort_key):
+    """정렬된 sorted_new의 각 항목이 sorted_items에 들어갈 위치 목록 (같은 키 뒤).
+
+    앞 항목의 위치부터 1, 2, 4, ... 칸씩 건너뛰며 찾으므로 (갤로핑) 기존 항목의 키는
+    새 항목 사이 간격의 로그만큼만 계산한다.
+    """
+    points = []
+    low = 0
+    size = len(sorted_items)
+    for item in sorted_new:
+        item_key = key(item)
+        step = 1
+        high = low
+        while high < size and not item_key < key(sorted_items[high]):
+            low = high + 1
+            high += step
+            step *= 2
+        high = min(high, size)
+        while low < high:
+            middle = (low + high) // 2
+            if item_key < key(sorted_items[middle]):
+                high = middle
+            else:
+                low = middle + 1
+        points.append(low)
+    return points
+
+
+def merge_sorted(sorted_items, new_items, key=natural_sort_key):
+    """key 순서로 정렬된 sorted_items에 new_items를 병합한 새 리스트 (O(n + k log k)).
+
+    새 항목만 정렬하고 insertion_points()로 자리를 찾은 뒤 구간째로 이어 붙인다.
+    """
+    sorted_new = sorted(new_items, key=key)
+    merged = []
+    previous = 0
+    for position, item in zip(insertion_points(sorted_items, sorted_new, key), sorted_new):
+        if position > previous:
+            merged.extend(sorted_items[previous:position])
+            previous = position
+        merged.append(item)
+    merged.extend(sorted_items[previous:])
+    return merged
@@ -0,0 +1,183 @@
+"""이미지 하나를 한 번만 디코딩해서 여러 크기(썸네일 피라미드)로 저장.
+
+프리셋은 크기 목록이다. 큰 크기부터 만들고, 각 크기는 원본 대신 이미 만든 것 중
+가장 작은(그러면서 크롭 영역을 담고 해상도가 충분한) 결과에서 줄인다. 인코딩과
+저장은 스레드에서 하므로 다음 크기를 줄이는 동안 앞의 크기가 저장된다.
+
+프리셋 파일(JSON) 예::
+
+    {"sizes": [
+        {"suffix": "2048", "max_size": 2048},
+        {"suffix": "1024", "max_size": 1024},
+        {"suffix": "thumb", "max_size": 256, "ratio": "1:1"}
+    ]}
+
+suffix를 빼면 max_size가 쓰이고, ratio를 빼면 작업의 비율을 따른다. 결과는
+``{원래 이름}_{suffix}{확장자}`` 로 저장된다.
+"""
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from PIL import Image
+
+from .animated import crop_box, is_animated, save_animated
+from .encode import EncodedFile, save_image
+from .resize import calculate_output_size, load_reduced, run_batch
+
+# 파일 하나의 결과를 동시에 저장하는 스레드 수
+PYRAMID_WRITERS = 4
+
+
+class PyramidLevel:
+    """피라미드의 한 크기. ratio가 None이면 작업의 비율을 쓴다."""
+
+    def __init__(self, suffix, max_size=None, ratio=None):
+        self.suffix = suffix
+        self.max_size = max_size
+        self.ratio = ratio
+
+    def __repr__(self):
+        return f"PyramidLevel({self.suffix!r}, {self.max_size!r}, {self.ratio!r})"
+
+
+DEFAULT_PRESET = [
+    PyramidLevel('2048', 2048),
+    PyramidLevel('1024', 1024),
+    PyramidLevel('512', 512),
+    PyramidLevel('256', 256),
+    PyramidLevel('thumb', 256, (1, 1)),
+]
+
+
+def _parse_ratio(text):
+    try:
+        width, height = map(int, str(text).split(':'))
+    except ValueError:
+        raise ValueError(f"invalid ratio: {text!r} (expected W:H)")
+    if width <= 0 or height <= 0:
+        raise ValueError(f"invalid ratio: {text!r}")
+    return width, height
+
+
+def parse_preset(data):
+    """프리셋 dict(JSON에서 읽은 것)를 PyramidLevel 목록으로. 잘못되면 ValueError."""
+    sizes = data.get('sizes') if isinstance(data, dict) else None
+    if not isinstance(sizes, list) or not sizes:
+        raise ValueError("preset needs a non-empty \"sizes\" list")
+    levels = []
+    for entry in sizes:
+        if not isinstance(entry, dict):
+            raise ValueError(f"invalid size entry: {entry!r}")
+        max_size = entry.get('max_size')
+        if max_size is not None and (not isinstance(max_size, int) or max_size <= 0):
+            raise ValueError(f"invalid max_size: {max_size!r}")
+        suffix = str(entry.get('suffix') or max_size or 'resized')
+        if os.sep in suffix or (os.altsep and os.altsep in suffix):
+            raise ValueError(f"invalid suffix: {suffix!r}")
+        ratio = _parse_ratio(entry['ratio']) if entry.get('ratio') is not None else None
+        levels.append(PyramidLevel(suffix, max_size, ratio))
+    suffixes = [level.suffix for level in levels]
+    if len(set(suffixes)) != len(suffixes):
+        raise ValueError("preset sizes need different suffixes")
+    return levels
+
+
+def load_preset(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        try:
+            data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"invalid preset file: {e}")
+    return parse_preset(data)
+
+
+def _covers(region, box):
+    # 부동소수점 오차를 감안해 region이 box를 담는지
+    return (region[0] <= box[0] + 1e-6 and region[1] <= box[1] + 1e-6
+            and region[2] >= box[2] - 1e-6 and region[3] >= box[3] - 1e-6)
+
+
+def _source_scale(size, box):
+    # 원본 한 픽셀이 출력에서 차지하는 크기
+    return max(size[0] / (box[2] - box[0]), size[1] / (box[3] - box[1]))
+
+
+def _fit_from(sources, box, size):
+    """sources(``(이미지, 원본 좌표로 나타낸 그 이미지의 영역)``, 큰 것부터) 중 box를
+    size 이상의 해상도로 담은 가장 작은 이미지에서 잘라 줄인다.
+
+    맞는 것이 없으면 마지막으로 확인하는 sources[0](디코딩한 원본)을 쓴다.
+    """
+    for image, region in reversed(sources):
+        scale_x = image.width / (region[2] - region[0])
+        scale_y = image.height / (region[3] - region[1])
+        if (_covers(region, box) and (box[2] - box[0]) * scale_x >= size[0]
+                and (box[3] - box[1]) * scale_y >= size[1]):
+            break
+    local_box = ((box[0] - region[0]) * scale_x, (box[1] - region[1]) * scale_y,
+                 (box[2] - region[0]) * scale_x, (box[3] - region[1]) * scale_y)
+    return image.resize(size, Image.Resampling.LANCZOS, box=local_box)
+
+
+def resize_pyramid(file_path, ratio, preset=None, fast=False, output=None):
+    """file_path를 한 번 디코딩해서 preset(PyramidLevel 목록, 기본 DEFAULT_PRESET)의
+    모든 크기로 저장하고, encode.EncodedFile 목록을 preset 순서대로 반환.
+
+    fast가 참이면 가장 큰 해상도가 필요한 크기에 맞춰 축소 디코딩한다. output은
+    모든 크기에 쓰는 encode.OutputOptions이다. 움직이는 이미지는 크기마다
+    animated.save_animated()로 프레임을 다시 디코딩하고 원래 형식으로 저장한다.
+    """
+    levels = DEFAULT_PRESET if preset is None else preset
+    base, ext = os.path.splitext(file_path)
+    with Image.open(file_path) as img:
+        width, height = img.size
+        plans = []
+        for level in levels:
+            size = calculate_output_size(width, height, level.ratio or ratio, level.max_size)
+            plans.append((level, size, crop_box((width, height), size)))
+
+        if img.format == 'GIF' or is_animated(img):
+            encoded_files = []
+            for level, size, box in plans:
+                path = f"{base}_{level.suffix}{'.gif' if img.format == 'GIF' else ext}"
+                start = time.perf_counter()
+                save_animated(img, path, size)
+                encoded_files.append(EncodedFile(path, img.format, os.path.getsize(path),
+                                                 time.perf_counter() - start))
+            return encoded_files
+
+        if fast:
+            # 원본 대비 가장 큰 배율이 필요한 크기에 맞춰 축소 디코딩
+            level, size, box = max(plans, key=lambda plan: _source_scale(plan[1], plan[2]))
+            source = load_reduced(img, level.ratio or ratio, size)
+        else:
+            source = img
+            source.load()
+        sources = [(source, (0, 0, width, height))]
+        # 저장 스레드들이 동시에 EXIF를 읽어 들이지 않도록 미리 읽어 둔다
+        img.getexif()
+
+        ext = output.extension(ext) if output else ext
+        paths = [f"{base}_{level.suffix}{ext}" for level, size, box in plans]
+        with ThreadPoolExecutor(max_workers=min(PYRAMID_WRITERS, len(plans))) as executor:
+            futures = []
+            # 큰 크기부터 줄여야 다음 크기를 방금 만든 결과에서 줄일 수 있다
+            for index in sorted(range(len(plans)), key=lambda i: plans[i][1][0] * plans[i][1][1], reverse=True):
+                level, size, box = plans[index]
+                resized = _fit_from(sources, box, size)
+                sources.append((resized, box))
+                futures.append((index, executor.submit(save_image, resized, paths[index], img, output)))
+            encoded_files = [None] * len(plans)
+            for index, future in futures:
+                encoded_files[index] = future.result()
+    return encoded_files
+
+
+def pyramid_batch(file_paths, ratio, preset=None, workers=None, cache=None, **options):
+    """파일들을 여러 프로세스에 나눠 resize_pyramid()하고, 끝나는 순서대로
+    ``(index, file_path, EncodedFile 목록, error)`` 를 yield. cache는 resize_batch()와 같다."""
+    if cache is not None:
+        return cache.batch(resize_pyramid, file_paths, (ratio, preset), workers, **options)
+    return run_batch(resize_pyramid, file_paths, (ratio, preset), workers, **options)
@@ -0,0 +1,259 @@
+"""파일 일괄 이름 변경 핵심 로직."""
+import os
+
+from .journal import Journal
+from .names import NameIndex
+from .natsort import natural_sort_key
+from .template import METADATA_WORKERS, Template, gather_metadata
+
+# 순환 이름 변경을 끊을 때 쓰는 임시 이름의 접미사
+TEMP_SUFFIX = '.rename-tmp'
+
+# 마지막 이름 변경 기록 (되돌리기/중단된 작업 복구용). 다른 설정 파일처럼 현재 폴더에 둔다.
+RENAME_JOURNAL = 'rename_journal.jsonl'
+# 진행 기록은 이만큼의 단계마다 한 번씩 fsync한다
+JOURNAL_GROUP_SIZE = 4096
+
+
+def _key(path):
+    return os.path.normcase(path)
+
+
+def plan_renames(file_paths, template, start=1, workers=METADATA_WORKERS):
+    """바꿀 이름을 메모리에서 모두 정하고 ``(새 경로 목록, 실행할 os.rename 단계)`` 를 반환.
+
+    template은 키워드(→ `{키워드}{번호:02}{확장자}`) 또는 template.Template 문법이다.
+    번호는 start부터 파일 순서대로 붙이며, 목록 밖의 파일과 이름이 겹치면 그 번호를
+    건너뛴다. 번호를 쓰지 않는 템플릿에서 이름이 겹치면 `_1`, `_2` ... 를 붙인다.
+    폴더마다 한 번만 읽고, 템플릿이 쓰는 메타데이터만 workers 개의 스레드로 읽는다.
+
+    이미 원하는 이름인 파일은 건드리지 않는다. 다른 파일이 아직 쓰고 있는 이름으로
+    바꿔야 하면 그 파일을 먼저 옮기도록 순서를 정하고, 서로 이름을 맞바꾸는 순환
+    (a→b, b→a 등)에서만 한 파일을 임시 이름으로 옮겨 끊는다. 그래서 단계 수는
+    바뀌는 파일 수 + 순환 수이다.
+    """
+    file_paths = list(file_paths)
+    template = template if isinstance(template, Template) else Template(template)
+    indexes = {}
+    metadata = gather_metadata(file_paths, template.needs, workers)
+    new_paths = [new_path for new_path, conflicted in _assign_names(file_paths, template, start, metadata, indexes)]
+    moves = [(file_path, new_path) for file_path, new_path in zip(file_paths, new_paths) if new_path != file_path]
+    return new_paths, _order_moves(moves, lambda dir_name: _index_of(indexes, dir_name))
+
+
+def preview_renames(file_paths, template, start=1, metadata=None, indexes=None, cancelled=None):
+    """이름은 바꾸지 않고 plan_renames()와 같은 규칙으로 ``[(새 경로, 겹침 여부)]`` 를 반환.
+
+    겹침 여부는 템플릿대로 만든 이름이 다른 파일과 겹쳐 번호를 건너뛰거나 `_N` 을
+    붙였는지이다. 미리 보기를 여러 번 계산할 때 metadata(paths와 같은 순서의 dict
+    목록)와 indexes(폴더 -> NameIndex, 계산 중에 채워짐)를 넘기면 다시 읽지 않는다.
+    cancelled()가 참이 되면 중간에 멈추고 None을 반환한다.
+    """
+    file_paths = list(file_paths)
+    template = template if isinstance(template, Template) else Template(template)
+    if metadata is None:
+        metadata = gather_metadata(file_paths, template.needs)
+    return _assign_names(file_paths, template, start, metadata, {} if indexes is None else indexes, cancelled)
+
+
+def _index_of(indexes, dir_name):
+    index = indexes.get(dir_name)
+    if index is None:
+        index = indexes[dir_name] = NameIndex(dir_name or os.curdir)
+    return index
+
+
+# 이만큼마다 취소 여부를 확인한다
+_CANCEL_CHECK_INTERVAL = 4096
+
+
+def _assign_names(file_paths, template, start, metadata, indexes, cancelled=None):
+    sources = {_key(path) for path in file_paths}
+    planned = set()
+
+    def is_free(new_path, index):
+        # 목록 밖의 파일이 쓰고 있는 이름이나 이번에 이미 정한 이름이 아니어야 한다
+        key = _key(new_path)
+        return key not in planned and (os.path.basename(new_path) not in index or key in sources)
+
+    names = []
+    number = start
+    for row, (file_path, info) in enumerate(zip(file_paths, metadata)):
+        if cancelled and row % _CANCEL_CHECK_INTERVAL == 0 and cancelled():
+            return None
+        dir_name = os.path.dirname(file_path)
+        index = _index_of(indexes, dir_name)
+        conflicted = False
+        while True:
+            new_path = os.path.join(dir_name, template.format(file_path, number, info))
+            if template.uses_number:
+                number += 1
+            if is_free(new_path, index) or not template.uses_number:
+                break
+            conflicted = True
+        if not is_free(new_path, index):
+            conflicted = True
+            base, extension = os.path.splitext(new_path)
+            suffix = 1
+            while not is_free(f"{base}_{suffix}{extension}", index):
+                suffix += 1
+            new_path = f"{base}_{suffix}{extension}"
+        planned.add(_key(new_path))
+        names.append((new_path, conflicted))
+    return names
+
+
+def _order_moves(moves, index_of):
+    """이동 목록을 대상 이름이 비어 있는 순서로 정렬하고 순환은 임시 이름으로 끊는다.
+
+    대상 이름은 서로 겹치지 않으므로 이동들은 사슬 또는 순환을 이룬다.
+    """
+    by_source = {_key(src): i for i, (src, dst) in enumerate(moves)}
+    targets = {_key(dst) for src, dst in moves}
+    done = [False] * len(moves)
+    steps = []
+    for first in range(len(moves)):
+        if done[first]:
+            continue
+        # 대상 이름을 아직 쓰고 있는 파일을 따라가며 사슬을 모은다
+        chain = []
+        in_chain = set()
+        i = first
+        while i is not None and not done[i] and i not in in_chain:
+            chain.append(i)
+            in_chain.add(i)
+            src, dst = moves[i]
+            i = by_source.get(_key(dst)) if _key(dst) != _key(src) else None
+        cycle = i == first and len(chain) > 1
+        for i in chain:
+            done[i] = True
+        if cycle:
+            src, dst = moves[first]
+            dir_name, file_name = os.path.split(src)
+            stem, extension = os.path.splitext(file_name)
+            while True:
+                temp_path = os.path.join(dir_name, index_of(dir_name).reserve(f"{stem}{TEMP_SUFFIX}{extension}"))
+                if _key(temp_path) not in targets:
+                    break
+            steps.append((src, temp_path))
+            steps.extend(moves[i] for i in reversed(chain[1:]))
+            steps.append((temp_path, dst))
+        else:
+            # 사슬 끝의 대상 이름은 비어 있으므로 뒤에서부터 옮긴다
+            steps.extend(moves[i] for i in reversed(chain))
+    return steps
+
+
+def rename_files(file_paths, template, start=1, journal_path=None):
+    """파일들을 template(키워드면 `{keyword}{번호:02}{확장자}`)대로 바꾸고 새 경로 목록을 반환.
+
+    plan_renames()로 정한 순서대로 필요한 만큼만 os.rename 한다. journal_path를 주면
+    각 단계를 실행하기 전에 기록해 두어 undo_renames()로 되돌리거나, 중간에 멈췄을
+    때 recover_renames()로 이어서 할 수 있다. 그 경로에 끝나지 않은 기록이 있으면
+    RuntimeError.
+    """
+    new_paths, steps = plan_renames(file_paths, template, start)
+    if journal_path is None:
+        for src, dst in steps:
+            os.rename(src, dst)
+    else:
+        _apply_journaled(steps, journal_path)
+    return sorted(new_paths, key=natural_sort_key)
+
+
+# 기록 레코드:
+#   ["B", 번호, 원래 경로, 새 경로]  실행할 단계 (순환을 끊는 임시 이름도 한 단계)
+#   ["D", n]                        처음 n 단계를 실행함
+#   ["C"]                           모두 끝남
+
+def _apply_journaled(steps, journal_path):
+    if has_unfinished_renames(journal_path):
+        raise RuntimeError("an interrupted rename has to be resumed or rolled back first")
+    if os.path.exists(journal_path):
+        # 끝난 기록은 새 작업으로 바꾼다 (되돌리기는 마지막 작업만)
+        os.remove(journal_path)
+    journal = Journal(journal_path)
+    applied = 0
+    try:
+        # 전체 계획을 먼저 한 번의 fsync로 남겨야 중간에 멈춰도 마저 할 수 있다
+        for step_id, (src, dst) in enumerate(steps):
+            journal.append('B', step_id, src, dst)
+        journal.commit()
+        for group_start in range(0, len(steps), JOURNAL_GROUP_SIZE):
+            for src, dst in steps[group_start:group_start + JOURNAL_GROUP_SIZE]:
+                os.rename(src, dst)
+                applied += 1
+            journal.append('D', applied)
+            journal.commit()
+        journal.append('C')
+    finally:
+        if applied < len(steps):
+            journal.append('D', applied)
+        journal.close()
+
+
+def read_rename_journal(journal_path):
+    """``(단계 목록, 실행한 것으로 기록된 단계 수, 끝났는지)`` 를 반환."""
+    steps = []
+    applied = 0
+    complete = False
+    for record in Journal.read(journal_path):
+        if record[0] == 'B':
+            steps.append((record[2], record[3]))
+        elif record[0] == 'D':
+            applied = max(applied, record[1])
+        elif record[0] == 'C':
+            complete = True
+    return steps, applied, complete
+
+
+def has_unfinished_renames(journal_path=RENAME_JOURNAL):
+    if not os.path.exists(journal_path):
+        return False
+    return not read_rename_journal(journal_path)[2]
+
+
+def rename_origins(steps):
+    """단계 목록을 따라가 ``{최종 경로: 원래 경로}`` 를 만든다 (임시 이름은 빠짐)."""
+    origins = {}
+    for src, dst in steps:
+        origins[dst] = origins.pop(src, src)
+    return origins
+
+
+def recover_renames(journal_path=RENAME_JOURNAL, rollback=False):
+    """기록된 이름 변경을 마저 실행하거나(기본) 모두 되돌리고, 옮긴 파일 수를 반환.
+
+    기록된 진행 단계는 참고만 하고, 각 단계는 실제 파일 상태(원래 이름과 새 이름 중
+    어느 쪽이 있는지)로 판단하므로 마지막 기록이 유실돼도 안전하다. 되돌리면 기록을
+    지우고, 마저 실행하면 끝난 기록으로 남겨 나중에 되돌릴 수 있게 한다.
+    """
+    steps, applied, complete = read_rename_journal(journal_path)
+    count = 0
+    if rollback:
+        for src, dst in reversed(steps):
+            if os.path.exists(dst) and not os.path.exists(src):
+                os.rename(dst, src)
+                count += 1
+        os.remove(journal_path)
+        return count
+
+    if not complete:
+        journal = Journal(journal_path)
+        try:
+            for step_id, (src, dst) in enumerate(steps):
+                if step_id < applied:
+                    continue
+                if os.path.exists(src) and not os.path.exists(dst):
+                    os.rename(src, dst)
+                    count += 1
+            journal.append('D', len(steps))
+            journal.append('C')
+        finally:
+            journal.close()
+    return count
+
+
+def undo_renames(journal_path=RENAME_JOURNAL):
+    """마지막 이름 변경(끝났든 중간에 멈췄든)을 되돌린다."""
+    return recover_renames(journal_path, rollback=True)
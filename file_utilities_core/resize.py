@@ -0,0 +1,154 @@
+"""이미지 리사이즈 핵심 로직.
+
+PyQt5를 import하지 않으므로 워커 프로세스나 GUI 없는 환경에서도 사용할 수 있다.
+"""
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PIL import Image, ImageOps
+
+from .animated import is_animated, save_animated
+from .encode import EncodedFile, save_image
+
+
+def calculate_new_size(width, height, ratio):
+    target_width, target_height = ratio
+    aspect_ratio = width / height
+    target_aspect_ratio = target_width / target_height
+
+    if aspect_ratio > target_aspect_ratio:
+        # 원본이 더 넓은 경우
+        new_width = int(height * target_aspect_ratio)
+        new_height = height
+    else:
+        # 원본이 더 높은 경우
+        new_width = width
+        new_height = int(width / target_aspect_ratio)
+
+    return new_width, new_height
+
+
+def calculate_output_size(width, height, ratio, max_size=None):
+    """비율에 맞춘 크기를 구하고, max_size가 있으면 긴 변이 그 이하가 되도록 축소."""
+    new_width, new_height = calculate_new_size(width, height, ratio)
+    if max_size and max(new_width, new_height) > max_size:
+        scale = max_size / max(new_width, new_height)
+        new_width = max(1, round(new_width * scale))
+        new_height = max(1, round(new_height * scale))
+    return new_width, new_height
+
+
+# reduce()가 지원하는 모드 (팔레트 이미지 등은 그대로 둔다)
+REDUCIBLE_MODES = ('L', 'LA', 'RGB', 'RGBA', 'CMYK', 'I', 'F')
+
+
+def _reduction_limit(img, ratio, output_size):
+    # 크롭 영역이 출력 크기보다 작아지지 않는 최대 축소 배율
+    crop_width, crop_height = calculate_new_size(img.width, img.height, ratio)
+    return min(crop_width / output_size[0], crop_height / output_size[1])
+
+
+def load_reduced(img, ratio, output_size):
+    """출력 크기를 덮는 가장 작은 2의 거듭제곱 배율로 이미지를 디코딩.
+
+    JPEG은 draft()로 DCT 단계에서 1/2, 1/4, 1/8 로 디코딩하고, 남은 배율은
+    reduce()로 줄인다. 마무리 LANCZOS 리샘플링은 호출하는 쪽에서 한다.
+    """
+    limit = _reduction_limit(img, ratio, output_size)
+    if img.format == 'JPEG' and limit >= 2:
+        scale = next(s for s in (8, 4, 2) if s <= limit)
+        img.draft(img.mode, (img.width // scale, img.height // scale))
+        limit = _reduction_limit(img, ratio, output_size)
+
+    img.load()
+    if limit >= 2 and img.mode in REDUCIBLE_MODES:
+        factor = 2 ** int(math.log2(limit))
+        img = img.reduce(factor)
+    return img
+
+
+def resize_image(file_path, ratio, max_size=None, fast=False, output=None):
+    """이미지를 비율에 맞게 잘라 `_resized` 파일로 저장하고 encode.EncodedFile을 반환.
+
+    max_size를 주면 결과의 긴 변을 그 크기로 제한한다. fast가 참이면 필요한
+    만큼만 축소 디코딩한 뒤 LANCZOS로 마무리해 큰 JPEG을 훨씬 빨리 처리한다.
+    output(encode.OutputOptions)으로 저장 형식과 인코더 설정을 정한다.
+    GIF와 애니메이션 WebP/APNG는 animated.save_animated()로 프레임마다 처리하며,
+    원래 형식으로 저장하고 걸린 시간에는 디코딩과 리사이즈도 포함된다.
+    """
+    base, ext = os.path.splitext(file_path)
+    with Image.open(file_path) as img:
+        if img.format == 'GIF' or is_animated(img):
+            # GIF와 애니메이션 WebP/APNG는 한 프레임씩 리사이즈해서 바로 저장
+            new_size = calculate_output_size(img.width, img.height, ratio, max_size)
+            resized_file_path = f"{base}_resized{'.gif' if img.format == 'GIF' else ext}"
+            start = time.perf_counter()
+            save_animated(img, resized_file_path, new_size)
+            return EncodedFile(resized_file_path, img.format, os.path.getsize(resized_file_path),
+                               time.perf_counter() - start)
+        # Process non-GIF images
+        new_size = calculate_output_size(img.width, img.height, ratio, max_size)
+        source = load_reduced(img, ratio, new_size) if fast else img
+        resized_img = ImageOps.fit(source, new_size, Image.Resampling.LANCZOS)
+        resized_file_path = f"{base}_resized{output.extension(ext) if output else ext}"
+        return save_image(resized_img, resized_file_path, img, output)
+
+
+def _run_job(function, index, file_path, args, options):
+    # 워커 프로세스에서 실행되므로 예외 대신 결과 튜플로 돌려준다
+    try:
+        return index, file_path, function(file_path, *args, **options), None
+    except Exception as e:
+        return index, file_path, None, str(e)
+
+
+def run_batch(function, file_paths, args=(), workers=None, **options):
+    """``function(file_path, *args, **options)`` 를 여러 프로세스에 나눠 실행하고,
+    끝나는 순서대로 결과를 yield.
+
+    각 결과는 ``(index, file_path, 반환값, error)`` 튜플이며 실패한 경우 반환값은
+    None, ``error`` 는 오류 메시지이다. function은 워커 프로세스로 넘길 수 있도록
+    모듈 최상위 함수여야 한다.
+    """
+    file_paths = list(file_paths)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(file_paths) or 1))
+
+    if workers == 1:
+        # 프로세스 생성 비용을 아끼기 위해 현재 프로세스에서 처리
+        for index, file_path in enumerate(file_paths):
+            yield _run_job(function, index, file_path, args, options)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [executor.submit(_run_job, function, index, file_path, args, options)
+                   for index, file_path in enumerate(file_paths)]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # 중간에 중단된 경우 아직 시작하지 않은 작업은 취소
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def resize_batch(file_paths, ratio, workers=None, cache=None, **options):
+    """파일들을 여러 프로세스에 나눠 리사이즈하고, 끝나는 순서대로 결과를 yield.
+
+    각 결과는 ``(index, file_path, EncodedFile, error)`` 튜플이다 (run_batch() 참고).
+    options는 그대로 resize_image()에 전달된다. cache(resize_cache.ResizeCache)를
+    주면 이미 같은 설정으로 리사이즈한 원본은 다시 만들지 않는다.
+    """
+    if cache is not None:
+        return cache.batch(resize_image, file_paths, (ratio,), workers, **options)
+    return run_batch(resize_image, file_paths, (ratio,), workers, **options)
+
+
+def main(argv=None):
+    from .cli import main as cli_main
+    return cli_main(['resize', *(sys.argv[1:] if argv is None else argv)])
+
+
+if __name__ == '__main__':
+    sys.exit(main())
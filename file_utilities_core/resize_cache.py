@@ -0,0 +1,255 @@
+"""리사이즈 결과 캐시: 같은 원본을 같은 설정으로 다시 리사이즈하지 않는다.
+
+키는 원본 내용의 해시(또는 hash_contents=False이면 경로, 크기, 수정 시각)와 작업
+설정(함수, 비율, 크기, 인코더 설정 등)으로 만든다. 해시는 (경로, 크기, 수정 시각)이
+같으면 다시 계산하지 않으므로, 다시 실행할 때는 파일 상태만 확인하면 된다.
+
+결과 파일은 캐시 폴더에 하드 링크(안 되면 복사)로 보관하고, 캐시에 있으면 결과
+위치에 링크하거나 복사한다. 결과 파일이 이미 캐시의 것과 같으면 건드리지 않는다.
+리사이즈 함수들은 결과 파일을 제자리에서 고쳐 쓰지 않고 encode.replacing()으로 바꿔
+넣으므로, 다음 실행이 같은 이름에 저장해도 링크된 보관 파일은 바뀌지 않는다.
+색인은 SQLite이며, 전체 크기가 size_limit를 넘으면 가장 오래 쓰지 않은 결과부터 지운다.
+"""
+import hashlib
+import json
+import os
+import shutil
+import sqlite3
+import time
+
+from .encode import EncodedFile
+from .resize import run_batch
+from .template import hash_file
+
+# 다른 설정 파일처럼 현재 폴더에 둔다
+CACHE_DIR = 'resize_cache'
+CACHE_SIZE_LIMIT = 2 * 1024 ** 3
+# 결과를 만드는 방법이 바뀌어 예전 결과를 쓰면 안 될 때 올린다
+CACHE_VERSION = 1
+
+_INDEX_NAME = 'index.db'
+_OBJECTS_NAME = 'objects'
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    outputs TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+# 결과 파일을 제자리에 둘 때 잠깐 쓰는 이름의 접미사
+_PLACING_SUFFIX = '.fu-cache'
+
+
+def _link_or_copy(src, dst):
+    """src를 dst에 하드 링크하고, 링크할 수 없으면 수정 시각까지 복사한다."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _same_file(path, st):
+    # 같은 파일(하드 링크)이거나, 복사본이라 크기와 수정 시각이 같으면 같은 결과로 본다
+    try:
+        other = os.stat(path)
+    except OSError:
+        return False
+    return ((other.st_dev, other.st_ino) == (st.st_dev, st.st_ino)
+            or (other.st_size, other.st_mtime_ns) == (st.st_size, st.st_mtime_ns))
+
+
+class ResizeCache:
+    """디스크에 남는 리사이즈 결과 캐시. 한 스레드에서만 사용해야 한다."""
+
+    def __init__(self, directory=CACHE_DIR, size_limit=CACHE_SIZE_LIMIT, hash_contents=True):
+        self.directory = directory
+        self.size_limit = size_limit
+        self.hash_contents = hash_contents
+        self._objects = os.path.join(directory, _OBJECTS_NAME)
+        os.makedirs(self._objects, exist_ok=True)
+        self.conn = sqlite3.connect(os.path.join(directory, _INDEX_NAME))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        with self.conn:
+            self.conn.executescript(_SCHEMA)
+        self._total = self.conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+        self._used = {}  # 이번에 쓴 결과의 key -> 시각 (나중에 한꺼번에 기록)
+
+    def source_key(self, file_path):
+        """원본 파일을 나타내는 문자열 (내용 해시 또는 경로/크기/수정 시각)."""
+        path = os.path.abspath(file_path)
+        st = os.stat(path)
+        if not self.hash_contents:
+            return f"stat:{path}:{st.st_size}:{st.st_mtime_ns}"
+        row = self.conn.execute('SELECT size, mtime_ns, digest FROM sources WHERE path = ?', (path,)).fetchone()
+        if row and row[:2] == (st.st_size, st.st_mtime_ns):
+            return row[2]
+        digest = hash_file(path)
+        self.conn.execute('INSERT OR REPLACE INTO sources (path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)',
+                          (path, st.st_size, st.st_mtime_ns, digest))
+        return digest
+
+    def job_key(self, source_key, signature):
+        text = f"{CACHE_VERSION}\0{source_key}\0{signature}"
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+    def lookup(self, key):
+        """key의 결과 정보를 반환. 없거나 보관한 파일이 바뀌었으면 None."""
+        row = self.conn.execute('SELECT outputs FROM results WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        result = json.loads(row[0])
+        for output in result['files']:
+            try:
+                st = os.stat(os.path.join(self._objects, output['blob']))
+            except OSError:
+                st = None
+            # 링크된 결과 파일을 다른 프로그램이 제자리에서 고쳐 쓰면 보관한 파일도 바뀐다
+            if st is None or (st.st_size, st.st_mtime_ns) != (output['size'], output['mtime_ns']):
+                self._remove(key, result)
+                return None
+        self._used[key] = time.time()
+        return result
+
+    def restore(self, result, file_path):
+        """lookup()한 결과를 file_path의 결과 위치에 두고 EncodedFile(목록)을 반환."""
+        base, ext = os.path.splitext(file_path)
+        encoded_files = []
+        for output in result['files']:
+            blob = os.path.join(self._objects, output['blob'])
+            tail = output['tail']
+            if output.get('source_ext'):
+                # 원본 확장자를 따르는 결과는 내용이 같은 b.jpeg에서도 b_resized.jpeg가 되어야 한다
+                tail = os.path.splitext(tail)[0] + ext
+            path = base + tail
+            if not _same_file(path, os.stat(blob)):
+                # 링크된 결과 파일을 덮어써 보관한 파일까지 바꾸지 않도록 새 이름에서 바꿔 넣는다
+                placing = path + _PLACING_SUFFIX
+                if os.path.lexists(placing):
+                    os.remove(placing)
+                _link_or_copy(blob, placing)
+                os.replace(placing, path)
+            encoded_files.append(EncodedFile(path, output['format'], output['size'], 0.0, cached=True))
+        return encoded_files if result['many'] else encoded_files[0]
+
+    def store(self, key, file_path, encoded, follows_source=False):
+        """file_path로 만든 결과(EncodedFile 또는 목록)를 key로 보관.
+
+        follows_source가 참이면 결과 확장자가 원본과 같을 때 원본 확장자를 따른 것으로 기억한다.
+        """
+        many = isinstance(encoded, list)
+        encoded_files = encoded if many else [encoded]
+        base, ext = os.path.splitext(file_path)
+        # 결과 위치는 원본 이름 + 꼬리(`_resized.jpg` 등)로 기억한다
+        if not all(encoded_file.path.startswith(base) for encoded_file in encoded_files):
+            return
+        outputs = []
+        total = 0
+        for index, encoded_file in enumerate(encoded_files):
+            tail = encoded_file.path[len(base):]
+            blob = os.path.join(key[:2], f"{key}-{index}{os.path.splitext(tail)[1]}")
+            blob_path = os.path.join(self._objects, blob)
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            if os.path.lexists(blob_path):
+                os.remove(blob_path)
+            _link_or_copy(encoded_file.path, blob_path)
+            st = os.stat(blob_path)
+            outputs.append({'tail': tail, 'blob': blob, 'format': encoded_file.format,
+                            'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+                            'source_ext': follows_source and os.path.splitext(tail)[1] == ext})
+            total += st.st_size
+        old = self.conn.execute('SELECT size FROM results WHERE key = ?', (key,)).fetchone()
+        with self.conn:
+            self.conn.execute('INSERT OR REPLACE INTO results (key, outputs, size, last_used) VALUES (?, ?, ?, ?)',
+                              (key, json.dumps({'many': many, 'files': outputs}), total, time.time()))
+        self._total += total - (old[0] if old else 0)
+        if self._total > self.size_limit:
+            self.evict()
+
+    def _remove(self, key, result):
+        for output in result['files']:
+            try:
+                os.remove(os.path.join(self._objects, output['blob']))
+            except FileNotFoundError:
+                pass
+        row = self.conn.execute('SELECT size FROM results WHERE key = ?', (key,)).fetchone()
+        self.conn.execute('DELETE FROM results WHERE key = ?', (key,))
+        self._used.pop(key, None)
+        if row:
+            self._total -= row[0]
+
+    def evict(self):
+        """전체 크기가 size_limit 이하가 될 때까지 가장 오래 쓰지 않은 결과를 지운다."""
+        self._flush_used()
+        rows = self.conn.execute('SELECT key, outputs FROM results ORDER BY last_used')
+        with self.conn:
+            for key, outputs in rows.fetchall():
+                if self._total <= self.size_limit:
+                    break
+                self._remove(key, json.loads(outputs))
+
+    def _flush_used(self):
+        with self.conn:
+            self.conn.executemany('UPDATE results SET last_used = ? WHERE key = ?',
+                                  [(used, key) for key, used in self._used.items()])
+        self._used.clear()
+
+    def batch(self, function, file_paths, args=(), workers=None, **options):
+        """resize.run_batch()와 같지만 캐시에 있는 결과는 다시 만들지 않는다.
+
+        내용이 같은 원본이 여러 개면 하나만 만들고 나머지는 그 결과를 링크(또는 복사)한다.
+        """
+        signature = repr((function.__module__, function.__qualname__, args, sorted(options.items())))
+        waiting = {}  # key -> 같은 결과를 기다리는 [(index, file_path)], 맨 앞이 만드는 파일
+        # 저장 형식을 정하지 않으면 결과 파일은 원본 확장자를 쓴다
+        output = options.get('output')
+        follows_source = output is None or not output.format
+        for index, file_path in enumerate(file_paths):
+            try:
+                key = self.job_key(self.source_key(file_path), signature)
+                result = self.lookup(key)
+                if result is not None:
+                    yield index, file_path, self.restore(result, file_path), None
+                    continue
+            except OSError as e:
+                yield index, file_path, None, str(e)
+                continue
+            waiting.setdefault(key, []).append((index, file_path))
+        self.conn.commit()
+
+        keys = list(waiting)
+        jobs = run_batch(function, [waiting[key][0][1] for key in keys], args, workers, **options)
+        for job, file_path, encoded, error in jobs:
+            key = keys[job]
+            (index, file_path), *duplicates = waiting[key]
+            yield index, file_path, encoded, error
+            if error:
+                # 같은 내용이면 같은 이유로 실패한다
+                for index, duplicate_path in duplicates:
+                    yield index, duplicate_path, None, error
+                continue
+            try:
+                self.store(key, file_path, encoded, follows_source)
+                result = self.lookup(key)
+            except OSError:
+                # 보관하지 못해도 결과 파일은 이미 저장되었다
+                result = None
+            for index, duplicate_path in duplicates:
+                try:
+                    if result is None:
+                        raise OSError(f"could not reuse the result of {file_path}")
+                    yield index, duplicate_path, self.restore(result, duplicate_path), None
+                except OSError as e:
+                    yield index, duplicate_path, None, str(e)
+
+    def close(self):
+        self._flush_used()
+        self.conn.close()
@@ -0,0 +1,164 @@
+"""스니펫 검색용 역색인.
+
+제목과 본문을 단어로 나눠 단어 -> {스니펫 ID: 가중치} 로 색인한다. 검색어의 각
+단어는 색인 단어의 앞부분과 맞춰 보고(정렬된 단어 목록에서 이분 탐색), 오타도
+한 글자까지는 찾는다. 오타 검사는 SymSpell처럼 단어에서 한 글자씩 뺀 형태를
+미리 색인해 두어 사전 전체를 훑지 않는다.
+
+스니펫을 추가/수정/삭제할 때 그 스니펫의 단어만 갱신한다. 스레드 안전하지 않으므로
+한 스레드(GUI에서는 검색 스레드)에서만 사용한다.
+"""
+import bisect
+import re
+
+_WORDS = re.compile(r'\w+')
+
+TITLE_WEIGHT = 2
+TEXT_WEIGHT = 1
+
+# 단어가 맞은 방식에 따른 점수 (가중치와 곱함)
+EXACT_SCORE = 4
+PREFIX_SCORE = 2
+FUZZY_SCORE = 1
+
+# 오타를 찾을 최소 검색어 길이 (짧으면 거의 모든 단어가 한 글자 차이이다)
+FUZZY_MIN_LENGTH = 3
+# 한 글자를 뺀 검색어로 앞부분을 찾을 최소 길이 ("meetnig" -> "meetings")
+FUZZY_PREFIX_MIN_LENGTH = 5
+
+
+def tokenize(text):
+    return _WORDS.findall(text.casefold())
+
+
+def _deletes(term):
+    return {term[:i] + term[i + 1:] for i in range(len(term))}
+
+
+class SearchIndex:
+    def __init__(self, snippets=()):
+        self._postings = {}  # 단어 -> {ID: 가중치}
+        self._docs = {}      # ID -> 단어 집합
+        self._order = {}     # ID -> 추가된 순서 (점수가 같을 때 목록 순서대로)
+        self._terms = []     # 정렬된 단어 목록 (앞부분 검색용)
+        self._deleted = {}   # 한 글자 뺀 형태 -> 단어 집합 (오타 검색용)
+        self._next_order = 0
+        for snippet in snippets:
+            self.add(snippet)
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, id):
+        return id in self._docs
+
+    def add(self, snippet):
+        """스니펫을 색인 (이미 있으면 다시 색인)."""
+        id = snippet['id']
+        if id in self._docs:
+            self._remove_terms(id)
+        else:
+            self._order[id] = self._next_order
+            self._next_order += 1
+        weights = {}
+        for term in tokenize(snippet['title'] or ''):
+            weights[term] = TITLE_WEIGHT
+        for term in tokenize(snippet['text']):
+            weights[term] = weights.get(term, 0) | TEXT_WEIGHT
+        for term, weight in weights.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._add_term(term)
+            postings[id] = weight
+        self._docs[id] = set(weights)
+
+    update = add
+
+    def remove(self, id):
+        if id in self._docs:
+            self._remove_terms(id)
+            del self._docs[id]
+            del self._order[id]
+
+    def set_order(self, ids):
+        """점수가 같은 결과를 보여 줄 순서 (목록 순서가 바뀌었을 때)."""
+        self._order = {id: order for order, id in enumerate(ids) if id in self._docs}
+        self._next_order = len(self._order)
+
+    def _remove_terms(self, id):
+        for term in self._docs[id]:
+            postings = self._postings[term]
+            del postings[id]
+            if not postings:
+                del self._postings[term]
+                self._remove_term(term)
+
+    def _add_term(self, term):
+        bisect.insort(self._terms, term)
+        for deleted in _deletes(term):
+            self._deleted.setdefault(deleted, set()).add(term)
+
+    def _remove_term(self, term):
+        del self._terms[bisect.bisect_left(self._terms, term)]
+        for deleted in _deletes(term):
+            terms = self._deleted[deleted]
+            terms.discard(term)
+            if not terms:
+                del self._deleted[deleted]
+
+    def _prefixed(self, prefix):
+        start = bisect.bisect_left(self._terms, prefix)
+        end = bisect.bisect_left(self._terms, prefix + '\U0010ffff', start)
+        return self._terms[start:end]
+
+    def _fuzzy(self, word):
+        """word와 한 글자(추가/삭제/바꿈) 차이인 단어, 그리고 word에서 한 글자를 뺀 형태로 시작하는 단어."""
+        terms = set()
+        if len(word) >= FUZZY_MIN_LENGTH:
+            deletes = _deletes(word)
+            terms.update(self._deleted.get(word, ()))  # word에 한 글자가 빠진 경우
+            for deleted in deletes:
+                if deleted in self._postings:  # word에 한 글자가 더 있는 경우
+                    terms.add(deleted)
+                terms.update(self._deleted.get(deleted, ()))  # 한 글자를 잘못 친 경우
+            if len(word) >= FUZZY_PREFIX_MIN_LENGTH:
+                for deleted in deletes:
+                    terms.update(self._prefixed(deleted))
+        return terms
+
+    def _match(self, word):
+        """검색어 단어 하나에 맞는 ``{ID: 점수}``."""
+        scores = {}
+        for term in self._prefixed(word):
+            score = EXACT_SCORE if term == word else PREFIX_SCORE
+            for id, weight in self._postings[term].items():
+                if scores.get(id, 0) < score * weight:
+                    scores[id] = score * weight
+        for term in self._fuzzy(word):
+            for id, weight in self._postings[term].items():
+                if id not in scores or scores[id] < FUZZY_SCORE * weight:
+                    scores[id] = FUZZY_SCORE * weight
+        return scores
+
+    def search(self, query, limit=None):
+        """검색어의 모든 단어가 맞는 스니펫 ID를 점수가 높은 순으로 반환.
+
+        단어마다 가장 잘 맞는 것의 점수(정확히 일치 > 앞부분 일치 > 오타, 제목 > 본문)를
+        더한다. 검색어에 단어가 없으면 빈 목록.
+        """
+        words = sorted(set(tokenize(query)), key=len, reverse=True)
+        if not words:
+            return []
+        total = None
+        for word in words:
+            scores = self._match(word)
+            if total is None:
+                total = scores
+            else:
+                total = {id: score + scores[id] for id, score in total.items() if id in scores}
+            if not total:
+                return []
+        # 목록 순서로 정렬한 뒤 점수로 안정 정렬 (튜플 키보다 훨씬 빠르다)
+        ranked = sorted(sorted(total, key=self._order.__getitem__), key=total.__getitem__, reverse=True)
+        return ranked if limit is None else ranked[:limit]
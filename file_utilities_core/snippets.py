@@ -0,0 +1,282 @@
+"""Copy the txt 스니펫 저장/불러오기.
+
+스니펫은 SQLite 데이터베이스(WAL 모드)에 한 행씩 저장하므로, 제목 한 글자를 바꿔도
+그 행만 다시 쓴다. 예전 형식인 text_data.json은 데이터베이스를 처음 열 때 한 번만
+옮겨 온다. GUI는 SnippetWriter로 변경을 모아 백그라운드 스레드에서 기록한다.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+DATA_FILE = 'text_data.json'
+DB_FILE = 'snippets.db'
+
+# 마지막 변경 후 이만큼(초) 더 변경이 없으면 모아서 기록한다
+WRITE_DELAY = 0.5
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snippets (
+    id TEXT PRIMARY KEY,
+    text TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    shortcut TEXT,
+    position INTEGER NOT NULL
+)
+"""
+# PRAGMA user_version: 1이면 JSON 파일을 이미 옮겨 왔음
+_SCHEMA_VERSION = 1
+
+
+def new_snippet(text, title=None, id=None, shortcut=None):
+    return {
+        'id': id or str(uuid.uuid4()),
+        'text': text,
+        'title': title or "",
+        'shortcut': shortcut,
+    }
+
+
+def load_snippets(path=DATA_FILE):
+    """JSON 파일에서 스니펫 목록을 불러옴. 파일이 없거나 깨진 경우 예외를 그대로 올린다."""
+    with open(path, 'r') as infile:
+        return [new_snippet(item['text'], item.get('title'), item.get('id'), item.get('shortcut'))
+                for item in json.load(infile)]
+
+
+def save_snippets(snippets, path=DATA_FILE):
+    data = [{
+        'id': snippet['id'],
+        'text': snippet['text'],
+        'title': snippet['title'],
+        'shortcut': snippet['shortcut'],
+    } for snippet in snippets]
+    with open(path, 'w') as outfile:
+        json.dump(data, outfile, indent=4)
+
+
+def find_snippet(snippets, id):
+    """ID(또는 고유한 ID 앞부분)로 스니펫을 찾음."""
+    matches = [snippet for snippet in snippets if snippet['id'] == id]
+    if not matches:
+        matches = [snippet for snippet in snippets if snippet['id'].startswith(id)]
+    if len(matches) != 1:
+        return None
+    return matches[0]
+
+
+class SnippetStore:
+    """SQLite 스니펫 저장소. position 열이 목록 순서이다 (지운 행의 위치는 비워 둔다).
+
+    json_path를 주지 않으면 데이터베이스와 같은 폴더의 text_data.json을 처음 열 때
+    옮겨 온다 (JSON 파일은 지우지 않음). 한 번에 한 스레드에서만 사용해야 한다.
+    """
+
+    def __init__(self, path=DB_FILE, json_path=None):
+        self.path = path
+        # 불러오기는 GUI 스레드에서, 기록은 SnippetWriter 스레드에서 하므로 스레드 검사를 끈다
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        # WAL에서는 NORMAL이어도 전원이 나가면 마지막 트랜잭션만 잃을 수 있다
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        with self.conn:
+            self.conn.execute(_SCHEMA)
+        if json_path is None:
+            json_path = os.path.join(os.path.dirname(os.path.abspath(path)), DATA_FILE)
+        self._migrate(json_path)
+
+    def _migrate(self, json_path):
+        if self.conn.execute('PRAGMA user_version').fetchone()[0] >= _SCHEMA_VERSION:
+            return
+        try:
+            snippets = load_snippets(json_path)
+        except (OSError, ValueError, KeyError, TypeError):
+            snippets = []
+        with self.conn:
+            if not self.count():
+                self._save_many((snippet, position) for position, snippet in enumerate(snippets))
+            self.conn.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+
+    def count(self):
+        return self.conn.execute('SELECT COUNT(*) FROM snippets').fetchone()[0]
+
+    def load(self):
+        """position 순서의 스니펫 목록."""
+        rows = self.conn.execute('SELECT id, text, title, shortcut FROM snippets ORDER BY position, rowid')
+        return [new_snippet(text, title, id, shortcut) for id, text, title, shortcut in rows]
+
+    def positions(self):
+        """{id: 위치}. 지운 행의 위치는 비어 있을 수 있다."""
+        return dict(self.conn.execute('SELECT id, position FROM snippets'))
+
+    def next_position(self):
+        return self.conn.execute('SELECT COALESCE(MAX(position) + 1, 0) FROM snippets').fetchone()[0]
+
+    def save_many(self, items):
+        """``(스니펫, 위치)`` 목록을 저장 (있으면 갱신). 위치가 None이면 기존 위치를 유지한다."""
+        with self.conn:
+            self._save_many(items)
+
+    def save(self, snippet, position=None):
+        self.save_many([(snippet, position)])
+
+    def delete_many(self, ids):
+        with self.conn:
+            self._delete_many(ids)
+
+    def delete(self, id):
+        self.delete_many([id])
+
+    def set_positions(self, positions):
+        """{id: 위치} 중 주어진 행의 위치만 바꾼다 (끌어서 순서를 바꾼 구간)."""
+        with self.conn:
+            self._set_positions(positions)
+
+    def apply(self, saves, deletes, positions):
+        """SnippetWriter가 모은 변경을 한 트랜잭션으로 기록."""
+        with self.conn:
+            self._save_many(saves)
+            self._delete_many(deletes)
+            self._set_positions(positions)
+
+    # 아래 함수들은 커밋하지 않는다: 호출하는 쪽이 ``with self.conn`` 으로 묶는다
+    def _save_many(self, items):
+        for snippet, position in items:
+            if position is None:
+                position = self.conn.execute('SELECT position FROM snippets WHERE id = ?',
+                                             (snippet['id'],)).fetchone()
+                position = position[0] if position else self.next_position()
+            self.conn.execute(
+                'INSERT INTO snippets (id, text, title, shortcut, position) VALUES (?, ?, ?, ?, ?) '
+                'ON CONFLICT(id) DO UPDATE SET text = excluded.text, title = excluded.title, '
+                'shortcut = excluded.shortcut, position = excluded.position',
+                (snippet['id'], snippet['text'], snippet['title'], snippet['shortcut'], position))
+
+    def _delete_many(self, ids):
+        self.conn.executemany('DELETE FROM snippets WHERE id = ?', ((id,) for id in ids))
+
+    def _set_positions(self, positions):
+        self.conn.executemany('UPDATE snippets SET position = ? WHERE id = ?',
+                              ((position, id) for id, position in positions.items()))
+
+    def close(self):
+        self.conn.close()
+
+
+class SnippetWriter:
+    """스니펫 변경을 모아 두었다가 백그라운드 스레드에서 한 번에 기록.
+
+    같은 스니펫을 여러 번 바꾸면 마지막 내용만 기록한다. 마지막 변경 후 delay 초가
+    지나면 기록하므로 제목을 입력하는 동안에는 디스크에 쓰지 않는다. 종료할 때는
+    close()로 남은 변경을 기록해야 한다.
+
+    기록에 실패하면 변경을 버리지 않고 다시 대기열에 넣어 다음 기록(다음 변경, flush(),
+    close())에서 다시 시도하며, on_error(예외)를 기록 스레드에서 호출한다.
+    """
+
+    def __init__(self, store, delay=WRITE_DELAY, on_error=None):
+        self.store = store
+        self.delay = delay
+        self.on_error = on_error
+        self._saves = {}      # id -> (스니펫, 위치)
+        self._deletes = set()
+        self._positions = {}  # id -> 위치
+        self._changed_at = None
+        self._closed = False
+        self._condition = threading.Condition()
+        # 먼저 가져간 변경이 나중 변경을 덮어쓰지 않도록 가져가기와 기록을 함께 묶는다
+        self._write_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name='snippet-writer', daemon=True)
+        self._thread.start()
+
+    def save(self, snippet, position=None):
+        with self._condition:
+            self._deletes.discard(snippet['id'])
+            self._saves[snippet['id']] = (dict(snippet), position)
+            self._touch()
+
+    def delete(self, id):
+        with self._condition:
+            self._saves.pop(id, None)
+            self._positions.pop(id, None)
+            self._deletes.add(id)
+            self._touch()
+
+    def set_positions(self, positions):
+        with self._condition:
+            for id, position in positions.items():
+                if id in self._saves:
+                    self._saves[id] = (self._saves[id][0], position)
+                else:
+                    self._positions[id] = position
+            self._touch()
+
+    def _touch(self):
+        self._changed_at = time.monotonic()
+        self._condition.notify()
+
+    def _take(self):
+        saves = list(self._saves.values())
+        deletes = list(self._deletes)
+        positions = dict(self._positions)
+        self._saves.clear()
+        self._deletes.clear()
+        self._positions.clear()
+        self._changed_at = None
+        return saves, deletes, positions
+
+    def _put_back(self, saves, deletes, positions):
+        # 기록하지 못한 변경을 되돌려 넣는다. 그 사이에 들어온 변경이 더 새것이므로 우선한다
+        for snippet, position in saves:
+            id = snippet['id']
+            if id in self._saves or id in self._deletes:
+                continue
+            self._saves[id] = (snippet, self._positions.pop(id, position))
+        for id in deletes:
+            if id not in self._saves:
+                self._deletes.add(id)
+        for id, position in positions.items():
+            if id not in self._saves and id not in self._deletes:
+                self._positions.setdefault(id, position)
+
+    def _write(self):
+        with self._write_lock:
+            with self._condition:
+                changes = self._take()
+            if any(changes):
+                try:
+                    self.store.apply(*changes)
+                except sqlite3.Error as e:
+                    with self._condition:
+                        self._put_back(*changes)
+                    if self.on_error:
+                        self.on_error(e)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while self._changed_at is None and not self._closed:
+                    self._condition.wait()
+                # 변경이 멈출 때까지 기다린다 (디바운스). 그 사이 flush()가 가져갔으면 그만 기다린다
+                while not self._closed and self._changed_at is not None:
+                    remaining = self._changed_at + self.delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                closed = self._closed
+            self._write()
+            if closed:
+                return
+
+    def flush(self):
+        """기다리지 않고 남은 변경을 지금 기록."""
+        self._write()
+
+    def close(self):
+        """남은 변경을 기록하고 스레드를 끝낸다. 저장소는 닫지 않는다."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
@@ -0,0 +1,269 @@
+"""이름 변경 템플릿.
+
+``{parent}_{taken:%Y%m%d}_{n:03}`` 처럼 중괄호 안에 토큰을 쓰고, 콜론 뒤에 형식을
+줄 수 있다. 중괄호가 없으면 예전처럼 키워드로 보고 ``키워드{n:02}`` 로 바꾼다.
+확장자는 템플릿에 ``{ext}`` 가 없으면 원래 것을 그대로 붙인다.
+
+    n        번호 (형식: 자릿수, 기본 2 → 01, 02, ...)
+    stem     원래 이름 (확장자 제외)
+    ext      원래 확장자 (점 포함)
+    parent   파일이 있는 폴더 이름
+    mtime    수정 시각 (형식: strftime, 기본 %Y%m%d)
+    ctime    만든 시각 (지원하지 않는 OS에서는 메타데이터 변경 시각)
+    size     파일 크기 (바이트)
+    width    이미지 가로 크기 (이미지가 아니면 빈 문자열)
+    height   이미지 세로 크기
+    taken    EXIF 촬영 시각 (없으면 수정 시각)
+    hash     내용의 BLAKE2b 해시 (형식: 글자 수, 기본 8)
+
+파일마다 필요한 메타데이터는 템플릿이 쓰는 토큰에 대해서만 gather_metadata()가
+병렬로 모아 온다. 번호와 이름만 쓰는 템플릿은 파일을 열지 않는다.
+"""
+import hashlib
+import os
+import string
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+
+# 메타데이터를 읽는 스레드 수 (파일 I/O 대기가 대부분이라 CPU 수보다 많게)
+METADATA_WORKERS = 16
+HASH_CHUNK_SIZE = 1024 * 1024
+# 이미지 메타데이터를 프로세스에 나눠 줄 때 한 번에 넘기는 파일 수
+METADATA_CHUNK_SIZE = 256
+
+# 메타데이터 종류
+STAT = 'stat'
+IMAGE = 'image'
+EXIF = 'exif'
+HASH = 'hash'
+
+# 토큰 -> 필요한 메타데이터 (None이면 경로만으로 계산)
+TOKENS = {
+    'n': None,
+    'stem': None,
+    'ext': None,
+    'parent': None,
+    'mtime': STAT,
+    'ctime': STAT,
+    'size': STAT,
+    'width': IMAGE,
+    'height': IMAGE,
+    'taken': EXIF,
+    'hash': HASH,
+}
+
+DEFAULT_DATE_FORMAT = '%Y%m%d'
+DEFAULT_NUMBER_WIDTH = 2
+DEFAULT_HASH_LENGTH = 8
+
+# 템플릿을 검사할 때 날짜 토큰에 넣는 시각. Windows의 datetime.fromtimestamp()는
+# UTC보다 서쪽 시간대에서 0(현지 시각으로 1970년 이전)이면 OSError를 낸다.
+_SAMPLE_TIMESTAMP = 86400
+
+# 파일 이름에 쓸 수 없는 문자 (Windows 기준)
+_INVALID_CHARS = str.maketrans({ch: '_' for ch in '<>:"/\\|?*'})
+
+# EXIF 태그 번호
+_EXIF_IFD = 0x8769
+_DATETIME_ORIGINAL = 36867
+_DATETIME = 306
+
+
+def _number(spec):
+    width = int(spec) if spec else DEFAULT_NUMBER_WIDTH
+    return lambda number, path, info: str(number).zfill(width)
+
+
+def _date(name, spec):
+    date_format = spec or DEFAULT_DATE_FORMAT
+
+    def render(number, path, info):
+        timestamp = info.get(name)
+        if timestamp is None:
+            return ''
+        return datetime.fromtimestamp(timestamp).strftime(date_format)
+    return render
+
+
+def _stem(number, path, info):
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _ext(number, path, info):
+    return os.path.splitext(path)[1]
+
+
+def _parent(number, path, info):
+    return os.path.basename(os.path.dirname(os.path.abspath(path)))
+
+
+def _value(name, spec):
+    def render(number, path, info):
+        value = info.get(name)
+        return '' if value is None else format(value, spec)
+    return render
+
+
+def _hash(spec):
+    length = int(spec) if spec else DEFAULT_HASH_LENGTH
+    return lambda number, path, info: (info.get('hash') or '')[:length]
+
+
+def _compile_field(name, spec):
+    if name == 'n':
+        return _number(spec)
+    if name in ('mtime', 'ctime', 'taken'):
+        return _date(name, spec)
+    if name == 'hash':
+        return _hash(spec)
+    if name in ('size', 'width', 'height'):
+        return _value(name, spec)
+    if spec:
+        raise ValueError("this token takes no format")
+    return {'stem': _stem, 'ext': _ext, 'parent': _parent}[name]
+
+
+class Template:
+    """한 번 파싱해 두고 파일마다 format()으로 새 이름을 만든다.
+
+    잘못된 토큰이나 형식은 ValueError.
+    """
+
+    def __init__(self, text):
+        if '{' not in text and '}' not in text:
+            text = text + '{n}'
+        self.text = text
+        self.parts = []      # 문자열 또는 render(number, path, info) 함수
+        self.needs = set()   # 필요한 메타데이터 종류
+        self.uses_number = False
+        self.has_ext = False
+        try:
+            parsed = list(string.Formatter().parse(text))
+        except ValueError as e:
+            raise ValueError(f"invalid template: {e}")
+        for literal, name, spec, conversion in parsed:
+            if literal:
+                self.parts.append(literal)
+            if name is None:
+                continue
+            if name not in TOKENS or conversion:
+                raise ValueError(f"unknown token: {{{name}}}")
+            try:
+                render = _compile_field(name, spec)
+                # 형식 문자열 오류는 실제 파일을 처리하기 전에 알린다
+                render(0, 'x', {'size': 0, 'width': 0, 'height': 0, 'mtime': _SAMPLE_TIMESTAMP,
+                                'ctime': _SAMPLE_TIMESTAMP, 'taken': _SAMPLE_TIMESTAMP})
+            except ValueError as e:
+                raise ValueError(f"invalid format for {{{name}}}: {e}")
+            self.parts.append(render)
+            if TOKENS[name]:
+                self.needs.add(TOKENS[name])
+            self.uses_number = self.uses_number or name == 'n'
+            self.has_ext = self.has_ext or name == 'ext'
+
+    def format(self, path, number=1, info=None):
+        """path의 새 파일 이름 (폴더 제외)."""
+        info = info or {}
+        name = ''.join(part if isinstance(part, str) else part(number, path, info).translate(_INVALID_CHARS)
+                       for part in self.parts)
+        if not self.has_ext:
+            name += os.path.splitext(path)[1]
+        return name
+
+
+def _read_image(path, needs, info):
+    from PIL import Image  # 이미지 토큰을 쓸 때만 불러온다
+
+    try:
+        with Image.open(path) as img:
+            # 헤더만 읽는다 (픽셀은 디코딩하지 않음)
+            info['width'], info['height'] = img.size
+            if EXIF in needs:
+                exif = img.getexif()
+                taken = exif.get_ifd(_EXIF_IFD).get(_DATETIME_ORIGINAL) or exif.get(_DATETIME)
+                if taken:
+                    info['taken'] = datetime.strptime(str(taken).strip('\x00 '), '%Y:%m:%d %H:%M:%S').timestamp()
+    except (OSError, ValueError, SyntaxError):
+        pass
+
+
+def read_metadata(path, needs):
+    """needs에 있는 종류의 메타데이터만 읽어 dict로 반환. 읽을 수 없는 값은 빠진다."""
+    info = {}
+    if needs & {STAT, EXIF}:
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        if st is not None:
+            info['mtime'] = st.st_mtime
+            info['ctime'] = getattr(st, 'st_birthtime', st.st_ctime)
+            info['size'] = st.st_size
+    if needs & {IMAGE, EXIF}:
+        _read_image(path, needs, info)
+    if EXIF in needs and 'taken' not in info and 'mtime' in info:
+        info['taken'] = info['mtime']
+    if HASH in needs:
+        try:
+            info['hash'] = hash_file(path)
+        except OSError:
+            pass
+    return info
+
+
+def hash_file(path):
+    """파일 내용의 BLAKE2b(16바이트) 해시를 16진수 문자열로."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_chunk(paths, needs, workers):
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='metadata') as pool:
+        return list(pool.map(lambda path: read_metadata(path, needs), paths))
+
+
+def gather_metadata(paths, needs, workers=METADATA_WORKERS):
+    """paths와 같은 순서의 메타데이터 dict 목록. needs가 비어 있으면 파일을 열지 않는다.
+
+    stat과 해시는 대부분 I/O 대기라 스레드 workers 개로 읽는다. 이미지 헤더/EXIF
+    해석은 파이썬 코드가 오래 걸리므로 파일이 많으면 CPU 수만큼의 프로세스에
+    METADATA_CHUNK_SIZE 개씩 나눠 주고, 각 프로세스 안에서 다시 스레드로 읽는다.
+    """
+    paths = list(paths)
+    if not needs:
+        return [{} for _ in paths]
+    processes = os.cpu_count() or 1
+    if needs & {IMAGE, EXIF} and processes > 1 and len(paths) > METADATA_CHUNK_SIZE:
+        chunks = [paths[i:i + METADATA_CHUNK_SIZE] for i in range(0, len(paths), METADATA_CHUNK_SIZE)]
+        threads = max(1, workers // processes)
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = pool.map(_read_chunk, chunks, [needs] * len(chunks), [threads] * len(chunks))
+            return [info for chunk in results for info in chunk]
+    return _read_chunk(paths, needs, workers)
+
+
+class MetadataCache:
+    """경로별 메타데이터를 기억해 두고, 아직 읽지 않은 종류만 gather_metadata()로 읽는다.
+
+    미리 보기처럼 같은 파일 목록으로 템플릿을 여러 번 바꿔 볼 때 쓴다. 스레드 안전하지 않다.
+    """
+
+    def __init__(self, workers=METADATA_WORKERS):
+        self.workers = workers
+        self._entries = {}  # 경로 -> (읽은 종류, 메타데이터)
+
+    def get(self, paths, needs):
+        """paths와 같은 순서의 메타데이터 dict 목록."""
+        if not needs:
+            return [{} for _ in paths]
+        missing = [path for path in paths if not needs <= self._entries.get(path, (frozenset(),))[0]]
+        for path, info in zip(missing, gather_metadata(missing, needs, self.workers)):
+            kinds, cached = self._entries.get(path, (frozenset(), {}))
+            self._entries[path] = (kinds | needs, {**cached, **info})
+        return [self._entries[path][1] for path in paths]
+
+    def clear(self):
+        self._entries.clear()
@@ -0,0 +1,325 @@
+"""여러 파일을 동시에 복사/이동하는 전송 엔진.
+
+가능하면 커널 안에서 복사하는 os.copy_file_range / os.sendfile 을 쓰고, 안 되면 큰
+버퍼로 나눠 읽고 쓴다. 회전식 디스크(HDD)가 얽힌 전송은 장치별로 하나씩만 실행해
+헤드가 왔다 갔다 하지 않게 한다.
+
+다른 장치로의 이동은 임시 파일로 복사 → fsync → 원자적 이름 변경 → 원본 삭제 순으로
+진행하고, 각 단계를 MoveJournal에 먼저 기록해 중단된 작업을 이어서 하거나 되돌릴 수 있다.
+"""
+import errno
+import itertools
+import os
+import shutil
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .journal import Journal
+
+COPY_BUFFER_SIZE = 8 * 1024 * 1024
+# 한 번의 커널 복사 호출로 넘길 최대 바이트 (취소/진행률 반응성을 위해 나눠서 호출)
+KERNEL_CHUNK_SIZE = 64 * 1024 * 1024
+TRANSFER_WORKERS = 4
+
+MOVE_JOURNAL = '.file_utilities_move.journal'
+# 다른 장치로 복사 중인 임시 파일 접미사
+STAGED_SUFFIX = '.fu-part'
+
+# 커널 복사가 이 파일 시스템 조합에서 지원되지 않을 때 나는 오류들
+_FALLBACK_ERRNOS = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EBADF, errno.ENOTSUP}
+
+
+def _copy_file_range(fsrc, fdst, offset, size):
+    in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+    while offset < size:
+        copied = os.copy_file_range(in_fd, out_fd, min(KERNEL_CHUNK_SIZE, size - offset), offset, offset)
+        if copied == 0:
+            break
+        offset += copied
+    return offset
+
+
+def _sendfile(fsrc, fdst, offset, size):
+    in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+    os.lseek(out_fd, offset, os.SEEK_SET)
+    while offset < size:
+        sent = os.sendfile(out_fd, in_fd, offset, min(KERNEL_CHUNK_SIZE, size - offset))
+        if sent == 0:
+            break
+        offset += sent
+    return offset
+
+
+def _copy_chunked(fsrc, fdst, offset, buffer_size):
+    fsrc.seek(offset)
+    fdst.seek(offset)
+    buffer = bytearray(buffer_size)
+    view = memoryview(buffer)
+    while True:
+        read = fsrc.readinto(buffer)
+        if not read:
+            break
+        fdst.write(view[:read])
+        offset += read
+    return offset
+
+
+def _kernel_copies():
+    copies = []
+    if hasattr(os, 'copy_file_range'):
+        copies.append(_copy_file_range)
+    if sys.platform.startswith('linux') and hasattr(os, 'sendfile'):
+        # 리눅스만 일반 파일 사이의 sendfile을 지원
+        copies.append(_sendfile)
+    return copies
+
+
+KERNEL_COPIES = _kernel_copies()
+
+
+def copy_file(src, dst, buffer_size=COPY_BUFFER_SIZE, fsync=False):
+    """src를 dst로 복사하고 shutil.copy2처럼 메타데이터도 복사. 복사한 바이트 수를 반환.
+
+    fsync가 참이면 닫기 전에 내용을 디스크에 확실히 기록한다.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        offset = 0
+        for kernel_copy in KERNEL_COPIES:
+            try:
+                offset = kernel_copy(fsrc, fdst, offset, size)
+                break
+            except OSError as e:
+                if e.errno not in _FALLBACK_ERRNOS:
+                    raise
+        # 커널 복사가 없거나 중간에 멈춘 경우 (또는 복사 중 파일이 커진 경우) 나머지를 직접 복사
+        offset = _copy_chunked(fsrc, fdst, offset, buffer_size)
+        if fsync:
+            fdst.flush()
+            os.fsync(fdst.fileno())
+    shutil.copystat(src, dst)
+    return offset
+
+
+def device_of(path):
+    """경로가 속한 장치 번호. 아직 없는 경로면 존재하는 가장 가까운 부모 폴더 기준."""
+    path = os.path.abspath(path)
+    while True:
+        try:
+            return os.stat(path).st_dev
+        except FileNotFoundError:
+            parent = os.path.dirname(path)
+            if parent == path:
+                raise
+            path = parent
+
+
+def is_rotational(device):
+    """장치가 회전식 디스크이면 True, SSD면 False, 알 수 없으면(네트워크 드라이브 등) None."""
+    if not sys.platform.startswith('linux'):
+        return None
+    block = f"/sys/dev/block/{os.major(device)}:{os.minor(device)}"
+    # 파티션이면 상위 디스크의 queue 정보를 본다
+    for queue_dir in (os.path.join(block, 'queue'), os.path.join(block, '..', 'queue')):
+        try:
+            with open(os.path.join(queue_dir, 'rotational')) as f:
+                return f.read().strip() == '1'
+        except OSError:
+            continue
+    return None
+
+
+def same_device(src, dst):
+    return device_of(os.path.dirname(src)) == device_of(os.path.dirname(dst))
+
+
+def staged_move(src, dst, buffer_size=COPY_BUFFER_SIZE):
+    """다른 장치로 안전하게 이동: 임시 파일에 복사 → fsync → 원자적 이름 변경 → 원본 삭제.
+
+    중간에 실패하면 임시 파일을 지우고 원본은 그대로 둔다.
+    """
+    staged = dst + STAGED_SUFFIX
+    try:
+        copy_file(src, staged, buffer_size, fsync=True)
+        os.replace(staged, dst)
+    except BaseException:
+        try:
+            os.remove(staged)
+        except OSError:
+            pass
+        raise
+    os.remove(src)
+
+
+def move_file(src, dst, buffer_size=COPY_BUFFER_SIZE):
+    """같은 장치면 이름만 바꾸고, 아니면 staged_move()."""
+    if same_device(src, dst):
+        os.rename(src, dst)
+    else:
+        staged_move(src, dst, buffer_size)
+
+
+class MoveJournal:
+    """이동 작업 기록. 작업 전에 ``B`` 레코드를 fsync로 남기고, 끝나면 ``D`` 를 남긴다.
+
+    레코드: ``["B", id, kind, src, dst]`` (kind는 'rename' 또는 'copy'), ``["D", id]``
+    """
+
+    def __init__(self, folder):
+        self.journal = Journal(os.path.join(folder, MOVE_JOURNAL))
+        self._ids = itertools.count()
+
+    def begin(self, kind, moves):
+        """여러 이동을 한 번의 fsync로 기록하고 각 id를 반환.
+
+        경로는 절대 경로로 남긴다: 복구는 다른 작업 폴더에서 실행될 수 있다.
+        """
+        ids = []
+        for src, dst in moves:
+            move_id = next(self._ids)
+            self.journal.append('B', move_id, kind, os.path.abspath(src), os.path.abspath(dst))
+            ids.append(move_id)
+        self.journal.commit()
+        return ids
+
+    def done(self, ids):
+        # 완료 기록은 fsync하지 않는다: 유실돼도 복구할 때 파일 상태로 판단한다
+        for move_id in ids:
+            self.journal.append('D', move_id)
+
+    def close(self, remove=True):
+        self.journal.close(remove=remove)
+
+
+def has_pending_moves(folder):
+    return os.path.exists(os.path.join(folder, MOVE_JOURNAL))
+
+
+def recover_moves(folder, rollback=False):
+    """중단된 이동 작업을 마무리(기본)하거나 되돌리고, 처리한 파일 수를 반환.
+
+    되돌리기는 그 실행에서 옮긴 파일을 모두 원래 위치로 돌려놓는다.
+    """
+    path = os.path.join(folder, MOVE_JOURNAL)
+    begun = {}
+    finished = set()
+    for record in Journal.read(path):
+        if record[0] == 'B':
+            begun[record[1]] = record[2:]
+        elif record[0] == 'D':
+            finished.add(record[1])
+
+    count = 0
+    entries = list(begun.items())
+    if rollback:
+        entries.reverse()
+    for move_id, (kind, src, dst) in entries:
+        staged = dst + STAGED_SUFFIX
+        if os.path.exists(staged):
+            # 복사 도중 멈춘 임시 파일
+            os.remove(staged)
+        src_exists = os.path.exists(src)
+        dst_exists = os.path.exists(dst)
+        if rollback:
+            if dst_exists and not src_exists:
+                os.makedirs(os.path.dirname(src), exist_ok=True)
+                move_file(dst, src)
+                count += 1
+            elif dst_exists and kind == 'copy' and move_id not in finished:
+                # 복사는 끝났지만 원본을 지우기 전에 멈춘 경우
+                os.remove(dst)
+                count += 1
+        else:
+            if src_exists and not dst_exists:
+                move_file(src, dst)
+                count += 1
+            elif src_exists and kind == 'copy' and move_id not in finished:
+                os.remove(src)
+                count += 1
+    os.remove(path)
+    return count
+
+
+class TransferEngine:
+    """여러 파일을 스레드 풀에서 동시에 복사/이동.
+
+    submit()은 Future를 돌려주며 결과는 전송한 바이트 수이다. 원본이나 대상이
+    회전식 디스크인 전송은 그 디스크 전용의 단일 스레드 작업열로 보내 한 번에
+    하나씩 실행하고, 나머지(SSD, 네트워크 드라이브)는 공용 풀에서 동시에 실행한다.
+    journal(MoveJournal)을 주면 다른 장치로의 이동을 staged_move()로 기록하며 진행한다.
+    """
+
+    def __init__(self, workers=TRANSFER_WORKERS, buffer_size=COPY_BUFFER_SIZE, serialize_rotational=True,
+                 journal=None):
+        self.workers = max(1, workers)
+        self.buffer_size = buffer_size
+        self.serialize_rotational = serialize_rotational
+        self.journal = journal
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='transfer')
+        self._lanes = {}    # 회전식 장치 묶음 -> 단일 스레드 실행기
+        self._devices = {}  # 폴더 -> 장치 번호 (파일마다 stat 하지 않도록)
+        self._rotational = {}
+        self._lock = threading.Lock()
+
+    def _device(self, folder):
+        device = self._devices.get(folder)
+        if device is None:
+            device = self._devices[folder] = device_of(folder)
+        return device
+
+    def same_device(self, src, dst):
+        with self._lock:
+            return self._device(os.path.dirname(src)) == self._device(os.path.dirname(dst))
+
+    def _executor_for(self, src, dst):
+        if not self.serialize_rotational or self.workers == 1:
+            return self._pool
+        with self._lock:
+            devices = {self._device(os.path.dirname(src)), self._device(os.path.dirname(dst))}
+            spinning = []
+            for device in devices:
+                if device not in self._rotational:
+                    self._rotational[device] = is_rotational(device)
+                if self._rotational[device]:
+                    spinning.append(device)
+            if not spinning:
+                return self._pool
+            key = tuple(sorted(spinning))
+            lane = self._lanes.get(key)
+            if lane is None:
+                lane = self._lanes[key] = ThreadPoolExecutor(max_workers=1, thread_name_prefix='transfer-hdd')
+            return lane
+
+    def copy(self, src, dst):
+        return copy_file(src, dst, self.buffer_size)
+
+    def _transfer(self, src, dst, move):
+        size = os.path.getsize(src)
+        if not move:
+            self.copy(src, dst)
+        elif self.journal is None:
+            shutil.move(src, dst, copy_function=self.copy)
+        elif self.same_device(src, dst):
+            ids = self.journal.begin('rename', [(src, dst)])
+            os.rename(src, dst)
+            self.journal.done(ids)
+        else:
+            ids = self.journal.begin('copy', [(src, dst)])
+            staged_move(src, dst, self.buffer_size)
+            self.journal.done(ids)
+        return size
+
+    def submit(self, src, dst, move=False):
+        return self._executor_for(src, dst).submit(self._transfer, src, dst, move)
+
+    def shutdown(self, wait=True):
+        self._pool.shutdown(wait=wait)
+        for lane in list(self._lanes.values()):
+            lane.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
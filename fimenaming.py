@@ -1,126 +1,288 @@
-import sys
-import os
-import re
-import random
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, QFileDialog, QLabel, QLineEdit, QSpinBox, QListView, QHBoxLayout)
-from PyQt5.QtCore import Qt, QStringListModel
-from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QFont
-
-def natural_sort_key(s):
-    """숫자를 포함한 문자열을 올바르게 정렬."""
-    return [int(text) if text.isdigit() else text.lower() for text in re.split(r'(\d+)', s)]
-
-
-class FileUploader(QMainWindow):
-    def __init__(self):
-        super(FileUploader, self).__init__()
-        self.initUI()
-
-    def initUI(self):
-        self.setWindowTitle("File Renamer")
-        self.resize(800, 600)
-        self.setFont(QFont('Arial', 10))
-
-        font = QFont()
-        font.setPointSize(12)
-        QApplication.setFont(font)
-
-        layout = QVBoxLayout()
-
-        self.dragDropLabel = QLabel("↓ Drag and Drop Files Here ↓")
-        self.dragDropLabel.setAlignment(Qt.AlignCenter)
-        self.dragDropLabel.setFont(QFont('Arial', 12, QFont.Bold))
-        self.dragDropLabel.setStyleSheet("border: 2px dashed #ccc; color: #888; padding: 10px; margin-top: 20px; margin-bottom: 20px;")
-        layout.addWidget(self.dragDropLabel)
-
-        self.file_list = QStringListModel()
-        self.file_view = QListView()
-        self.file_view.setModel(self.file_list)
-        layout.addWidget(self.file_view)
-
-        self.keywordLabel = QLabel("Rename Keyword:")
-        self.keywordEdit = QLineEdit()
-        self.keywordEdit.setPlaceholderText("ex) img -> img01, img02, img03, ...")  # 플레이스홀더 텍스트 추가
-        self.keywordEdit.setStyleSheet("margin-top: 10px; margin-bottom: 10px;")
-        self.startNumberLabel = QLabel("Start Number:")
-        self.startNumberSpin = QSpinBox()
-        self.startNumberSpin.setRange(1, 9999)
-
-        settingsLayout = QHBoxLayout()
-        settingsLayout.addWidget(self.keywordLabel)
-        settingsLayout.addWidget(self.keywordEdit)
-        settingsLayout.addWidget(self.startNumberLabel)
-        settingsLayout.addWidget(self.startNumberSpin)
-        layout.addLayout(settingsLayout)
-
-        self.renameButton = QPushButton("Rename and Save")
-        self.renameButton.setFont(QFont('Arial', 10))
-        self.renameButton.setStyleSheet("QPushButton { background-color: #007AFF; color: white; border-radius: 5px; padding: 10px; } QPushButton:hover { background-color: #0056b3; }")
-        self.renameButton.clicked.connect(self.renameAndSave)
-        layout.addWidget(self.renameButton)
-
-        mainWidget = QWidget()
-        mainWidget.setLayout(layout)
-        self.setCentralWidget(mainWidget)
-        self.setAcceptDrops(True)
-
-
-    def addFiles(self):
-        files, _ = QFileDialog.getOpenFileNames(self, "Select files")
-        if files:
-            current_files = self.file_list.stringList()
-            new_files = sorted(set(files).union(current_files), key=natural_sort_key)
-            self.file_list.setStringList(new_files)
-
-    def dropEvent(self, event: QDropEvent):
-        files = [url.toLocalFile() for url in event.mimeData().urls()]
-        new_files = sorted(set(files), key=natural_sort_key)
-        self.file_list.setStringList(new_files)
-
-    def renameAndSave(self):
-        temp_file_list = []
-        updated_file_list = []
-        rename_keyword = self.keywordEdit.text().strip()
-        number = self.startNumberSpin.value()
-
-        for i, file_path in enumerate(self.file_list.stringList(), start=1):
-            dir_name, old_file_name = os.path.split(file_path)
-            file_extension = os.path.splitext(old_file_name)[1]
-            temp_file_name = self.generate_temp_name(i) + file_extension
-            temp_path = os.path.join(dir_name, temp_file_name)
-            os.rename(file_path, temp_path)
-            temp_file_list.append((temp_path, file_extension))
-
-        current_files = set(self.file_list.stringList())  # 현재 리스트에 있는 파일 이름을 집합으로 변환
-
-        for temp_path, file_extension in temp_file_list:
-            new_file_name = f"{rename_keyword}{str(number).zfill(2)}{file_extension}"
-            new_path = os.path.join(os.path.dirname(temp_path), new_file_name)
-            
-            # 파일 이름 충돌 방지 로직: 파일 시스템 내에 이름이 존재하고 리스트에는 없을 때
-            while os.path.exists(new_path) and new_path not in current_files:
-                number += 1
-                new_file_name = f"{rename_keyword}{str(number).zfill(2)}{file_extension}"
-                new_path = os.path.join(os.path.dirname(temp_path), new_file_name)
-            
-            os.rename(temp_path, new_path)
-            updated_file_list.append(new_path)
-            current_files.add(new_path)  # 새 경로를 현재 파일 집합에 추가
-            number += 1
-
-        self.file_list.setStringList(sorted(updated_file_list, key=natural_sort_key))
-
-
-    def generate_temp_name(self, number):
-        random_digits = random.randint(1000, 9999)
-        return f"A{random_digits}temp{str(number).zfill(2)}"
-
-    def dragEnterEvent(self, event: QDragEnterEvent):
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-
-if __name__ == '__main__':
-    app = QApplication(sys.argv)
-    win = FileUploader()
-    win.show()
-    sys.exit(app.exec_())
+import multiprocessing
+import os
+import sys
+import threading
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QVBoxLayout, QWidget, QFileDialog, QLabel, QLineEdit, QSpinBox, QTreeView, QHBoxLayout, QMessageBox, QHeaderView)
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QDragEnterEvent, QDropEvent, QFont
+
+from file_list_model import FileListModel
+from file_utilities_core.natsort import natural_sort_key
+from file_utilities_core.renamer import (RENAME_JOURNAL, has_unfinished_renames, preview_renames, read_rename_journal,
+                                         recover_renames, rename_files, rename_origins, undo_renames)
+from file_utilities_core.template import MetadataCache, Template
+
+
+class PreviewWorker(QThread):
+    """새 이름 미리 보기를 백그라운드 스레드에서 계산.
+
+    요청은 마지막 것만 남기고, 계산 중에 새 요청이 오면 하던 계산을 버린다. 메타데이터와
+    폴더 목록(폴더마다 한 번 읽음)은 요청 사이에 재사용하고, 결과는 지난번과 달라진
+    경로만 보낸다.
+    """
+    previewReady = pyqtSignal(dict)  # {경로: (새 이름, 겹침 여부) 또는 None}
+
+    def __init__(self, parent=None):
+        super(PreviewWorker, self).__init__(parent)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._request = None
+        self._stopped = False
+        self.metadata = MetadataCache()
+        self.indexes = {}   # 폴더 -> NameIndex
+        self.previews = {}  # 마지막으로 보낸 결과
+
+    def request(self, paths, template, start, rescan=False, resend=False):
+        """rescan이 참이면 폴더를 다시 읽는다 (이름을 바꾼 뒤 등). resend가 참이면
+        지난번 결과와 비교하지 않고 모두 보낸다 (모델의 미리 보기가 지워졌을 때)."""
+        with self._lock:
+            if self._request is not None:
+                # 아직 처리하지 않은 요청을 대신하므로 그 요청의 플래그도 이어받는다
+                rescan = rescan or self._request[3]
+                resend = resend or self._request[4]
+            self._request = (paths, template, start, rescan, resend)
+        self._wake.set()
+
+    def stop(self):
+        self._stopped = True
+        self._wake.set()
+        self.wait()
+
+    def _cancelled(self):
+        return self._stopped or self._request is not None
+
+    def run(self):
+        while True:
+            self._wake.wait()
+            with self._lock:
+                request, self._request = self._request, None
+                self._wake.clear()
+            if self._stopped:
+                return
+            if request is None:
+                continue
+            paths, template, start, rescan, resend = request
+            if rescan:
+                self.indexes.clear()
+                self.metadata.clear()
+            if resend:
+                self.previews = {}
+            try:
+                metadata = self.metadata.get(paths, template.needs)
+                if self._cancelled():
+                    continue
+                names = preview_renames(paths, template, start, metadata, self.indexes, self._cancelled)
+            except OSError:
+                continue
+            if names is None:
+                continue
+            previews = {path: (os.path.basename(new_path), conflicted)
+                        for path, (new_path, conflicted) in zip(paths, names)}
+            changes = {path: preview for path, preview in previews.items() if self.previews.get(path) != preview}
+            changes.update((path, None) for path in self.previews.keys() - previews.keys())
+            self.previews = previews
+            if changes:
+                self.previewReady.emit(changes)
+
+
+class FileUploader(QMainWindow):
+    def __init__(self):
+        super(FileUploader, self).__init__()
+        self.initUI()
+
+    def initUI(self):
+        self.setWindowTitle("File Renamer")
+        self.resize(800, 600)
+        self.setFont(QFont('Arial', 10))
+
+        font = QFont()
+        font.setPointSize(12)
+        QApplication.setFont(font)
+
+        layout = QVBoxLayout()
+
+        self.dragDropLabel = QLabel("↓ Drag and Drop Files Here ↓")
+        self.dragDropLabel.setAlignment(Qt.AlignCenter)
+        self.dragDropLabel.setFont(QFont('Arial', 12, QFont.Bold))
+        self.dragDropLabel.setStyleSheet("border: 2px dashed #ccc; color: #888; padding: 10px; margin-top: 20px; margin-bottom: 20px;")
+        layout.addWidget(self.dragDropLabel)
+
+        self.file_list = FileListModel(sort_key=natural_sort_key, preview=True)
+        self.file_view = QTreeView()
+        self.file_view.setRootIsDecorated(False)
+        self.file_view.setUniformRowHeights(True)
+        self.file_view.setModel(self.file_list)
+        self.file_view.header().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.file_view)
+
+        self.keywordLabel = QLabel("Rename Keyword:")
+        self.keywordEdit = QLineEdit()
+        self.keywordEdit.setPlaceholderText("ex) img -> img01, img02, img03, ...  or  {parent}_{taken:%Y%m%d}_{n:03}")  # 플레이스홀더 텍스트 추가
+        self.keywordEdit.setToolTip("A keyword, or a template with these tokens:\n"
+                                    "{n} / {n:03}  counter with padding\n"
+                                    "{stem} {ext} {parent}  original name, extension, folder\n"
+                                    "{mtime} {ctime} {taken}  dates, e.g. {taken:%Y-%m-%d}\n"
+                                    "{size} {width} {height}  file size, image size\n"
+                                    "{hash} / {hash:12}  content hash")
+        self.keywordEdit.setStyleSheet("margin-top: 10px; margin-bottom: 10px;")
+        self.startNumberLabel = QLabel("Start Number:")
+        self.startNumberSpin = QSpinBox()
+        self.startNumberSpin.setRange(1, 9999)
+
+        settingsLayout = QHBoxLayout()
+        settingsLayout.addWidget(self.keywordLabel)
+        settingsLayout.addWidget(self.keywordEdit)
+        settingsLayout.addWidget(self.startNumberLabel)
+        settingsLayout.addWidget(self.startNumberSpin)
+        layout.addLayout(settingsLayout)
+
+        self.renameButton = QPushButton("Rename and Save")
+        self.renameButton.setFont(QFont('Arial', 10))
+        self.renameButton.setStyleSheet("QPushButton { background-color: #007AFF; color: white; border-radius: 5px; padding: 10px; } QPushButton:hover { background-color: #0056b3; }")
+        self.renameButton.clicked.connect(self.renameAndSave)
+
+        self.undoButton = QPushButton("Undo")
+        self.undoButton.setFont(QFont('Arial', 10))
+        self.undoButton.setStyleSheet("QPushButton { border: 1px solid #007AFF; color: #007AFF; border-radius: 5px; padding: 10px; } QPushButton:disabled { border-color: #ccc; color: #ccc; }")
+        self.undoButton.clicked.connect(self.undoRename)
+
+        buttonLayout = QHBoxLayout()
+        buttonLayout.addWidget(self.renameButton, 1)
+        buttonLayout.addWidget(self.undoButton)
+        layout.addLayout(buttonLayout)
+
+        mainWidget = QWidget()
+        mainWidget.setLayout(layout)
+        self.setCentralWidget(mainWidget)
+        self.setAcceptDrops(True)
+
+        # 키워드나 시작 번호가 바뀌면 잠시 기다렸다가 미리 보기를 다시 계산
+        self.previewRescan = False
+        self.previewResend = False
+        self.previewWorker = PreviewWorker(self)
+        self.previewWorker.previewReady.connect(self.file_list.updatePreview)
+        self.previewTimer = QTimer(self)
+        self.previewTimer.setSingleShot(True)
+        self.previewTimer.setInterval(250)
+        self.previewTimer.timeout.connect(self.updatePreview)
+        self.keywordEdit.textChanged.connect(self.previewTimer.start)
+        self.startNumberSpin.valueChanged.connect(self.previewTimer.start)
+        self.file_list.rowsInserted.connect(self.previewTimer.start)
+        self.file_list.modelReset.connect(self.previewModelReset)
+        QApplication.instance().aboutToQuit.connect(self.stopPreview)
+
+        self.undoButton.setEnabled(os.path.exists(RENAME_JOURNAL))
+        if has_unfinished_renames(RENAME_JOURNAL):
+            # 창이 보인 다음에 물어본다
+            QTimer.singleShot(0, self.recoverRenames)
+
+
+    def addFiles(self):
+        files, _ = QFileDialog.getOpenFileNames(self, "Select files")
+        if files:
+            self.file_list.addPaths(files)
+
+    def dropEvent(self, event: QDropEvent):
+        files = [url.toLocalFile() for url in event.mimeData().urls()]
+        self.file_list.setPaths(files)
+
+    def renameAndSave(self):
+        rename_keyword = self.keywordEdit.text().strip()
+        number = self.startNumberSpin.value()
+        if has_unfinished_renames(RENAME_JOURNAL):
+            self.recoverRenames()
+            return
+        try:
+            template = Template(rename_keyword)
+        except ValueError as e:
+            QMessageBox.warning(self, "Invalid template", str(e))
+            return
+        try:
+            updated_file_list = rename_files(self.file_list.paths(), template, number,
+                                             journal_path=RENAME_JOURNAL)
+        except OSError as e:
+            # 기록이 남아 있으므로 Undo로 원래 이름으로 돌릴 수 있다
+            self.undoButton.setEnabled(True)
+            QMessageBox.critical(self, "Error", f"Renaming stopped: {e}\n\nUse Undo to restore the original names.")
+            return
+        self.previewRescan = True
+        self.file_list.setPaths(updated_file_list)
+        self.undoButton.setEnabled(True)
+
+    def undoRename(self):
+        steps = read_rename_journal(RENAME_JOURNAL)[0]
+        try:
+            count = undo_renames(RENAME_JOURNAL)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+        # 목록에 있는 파일은 원래 이름으로 바꿔 보여 준다
+        origins = rename_origins(steps)
+        self.previewRescan = True
+        self.file_list.setPaths([origins.get(path, path) for path in self.file_list.paths()])
+        self.undoButton.setEnabled(False)
+        self.statusBar().showMessage(f"Restored {count} files.", 5000)
+
+    def recoverRenames(self):
+        # 지난 이름 변경이 중간에 멈춘 경우: 마저 하거나 되돌린다
+        box = QMessageBox(self)
+        box.setWindowTitle("Interrupted rename")
+        box.setText("The last rename did not finish.\nResume it, or roll back to the original names?")
+        resume_button = box.addButton("Resume", QMessageBox.AcceptRole)
+        rollback_button = box.addButton("Roll back", QMessageBox.DestructiveRole)
+        box.addButton(QMessageBox.Cancel)
+        box.exec_()
+        if box.clickedButton() not in (resume_button, rollback_button):
+            return
+        rollback = box.clickedButton() is rollback_button
+        try:
+            count = recover_renames(RENAME_JOURNAL, rollback=rollback)
+        except OSError as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+        self.undoButton.setEnabled(os.path.exists(RENAME_JOURNAL))
+        self.statusBar().showMessage(f"{'Rolled back' if rollback else 'Resumed'} {count} renames.", 5000)
+        self.previewRescan = True
+        self.previewTimer.start()
+
+    def updatePreview(self):
+        keyword = self.keywordEdit.text().strip()
+        try:
+            template = Template(keyword)
+        except ValueError as e:
+            self.file_list.clearPreview()
+            self.previewResend = True
+            self.statusBar().showMessage(str(e))
+            return
+        self.statusBar().clearMessage()
+        if not self.previewWorker.isRunning():
+            self.previewWorker.start()
+        self.previewWorker.request(self.file_list.paths(), template, self.startNumberSpin.value(),
+                                   self.previewRescan, self.previewResend)
+        self.previewRescan = False
+        self.previewResend = False
+
+    def previewModelReset(self):
+        # 목록을 바꾸면 모델의 미리 보기가 지워지므로 같은 파일이어도 다시 받아야 한다
+        self.previewResend = True
+        self.previewTimer.start()
+
+    def stopPreview(self):
+        if self.previewWorker.isRunning():
+            self.previewWorker.stop()
+
+    def closeEvent(self, event):
+        self.stopPreview()
+        super().closeEvent(event)
+
+    def dragEnterEvent(self, event: QDragEnterEvent):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+
+if __name__ == '__main__':
+    # 이미지 메타데이터 템플릿은 프로세스 풀을 쓴다 (PyInstaller 실행 파일 대응)
+    multiprocessing.freeze_support()
+    app = QApplication(sys.argv)
+    win = FileUploader()
+    win.show()
+    sys.exit(app.exec_())
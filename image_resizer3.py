@@ -1,307 +1,395 @@
-from PyQt5 import QtWidgets, QtCore
-from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QListWidget, QFileDialog,
-                              QMessageBox, QVBoxLayout, QWidget, QProgressBar, QLabel, QComboBox,
-                                QLineEdit, QHBoxLayout, QStatusBar, QButtonGroup, QRadioButton)
-from PyQt5.QtWidgets import QCheckBox
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QIcon, QFont
-import sys
-import os
-import threading
-from PIL import Image, ImageSequence, ImageOps
-
-# Windows 작업 표시줄 지원
-try:
-    from PyQt5.QtWinExtras import QWinTaskbarButton, QWinTaskbarProgress
-except ImportError:
-    QWinTaskbarButton = None  # Windows가 아닌 경우 None으로 설정
-
-
-class DropArea(QWidget):
-    def __init__(self, parent=None):
-        super(DropArea, self).__init__(parent)
-        self.setAcceptDrops(True)
-        self.layout = QVBoxLayout(self)
-        self.label = QLabel("↓ Drag and Drop Files Here ↓", self)
-        self.label.setAlignment(QtCore.Qt.AlignCenter)
-        self.label.setFont(QFont('Arial', 14))
-        self.label.setStyleSheet("color: #aaa;")
-        self.layout.addWidget(self.label)
-        self.fileList = QListWidget(self)
-        self.fileList.setFont(QFont('Arial', 12))
-        self.layout.addWidget(self.fileList)
-        self.setStyleSheet("""
-            DropArea {
-                border: 2px dashed #ccc;
-                border-radius: 10px;
-                background-color: #fafafa;
-            }
-            QListWidget {
-                border: none;
-            }
-        """)
-
-    def dragEnterEvent(self, event):
-        if event.mimeData().hasUrls():
-            event.acceptProposedAction()
-
-    def dropEvent(self, event):
-        self.fileList.clear()  # Clear the existing list before adding new files
-        for url in event.mimeData().urls():
-            if url.isLocalFile():
-                self.fileList.addItem(url.toLocalFile())
-        self.label.hide()
-
-class ImageResizer(QMainWindow):
-    updateProgress = QtCore.pyqtSignal(int)
-    showCompleteMessage = QtCore.pyqtSignal()
-
-    def resource_path(self, relative_path):
-        try:
-            base_path = sys._MEIPASS
-        except Exception:
-            base_path = os.path.abspath(".")
-        return os.path.join(base_path, relative_path)
-    
-    def __init__(self):
-        super().__init__()
-        self.initUI()
-        self.resizeThread = None
-        self.updateProgress.connect(self.updateProgressBar)
-        self.showCompleteMessage.connect(self.showCompletionMessage)
-
-    def initUI(self):
-        self.setWindowTitle('Image Resizer')
-        self.setGeometry(100, 100, 800, 600)
-        self.center()
-        self.setWindowIcon(QIcon(self.resource_path("image_resizer_icon.png")))
-
-        font = QFont()
-        font.setPointSize(12)
-        QApplication.setFont(font)
-
-        centralWidget = QWidget(self)
-        self.setCentralWidget(centralWidget)
-        layout = QVBoxLayout(centralWidget)
-
-        self.keepExifCheckbox = QCheckBox("Keep EXIF Data")
-        layout.addWidget(self.keepExifCheckbox)
-
-        self.dropArea = DropArea()
-        layout.addWidget(self.dropArea)
-        layout.setStretchFactor(self.dropArea, 3)  # 드래그 앤 드롭 영역의 비중을 늘립니다.
-
-        self.openButton = QPushButton('Open Files')
-        self.openButton.clicked.connect(self.openImages)
-        layout.addWidget(self.openButton)
-
-        # Resolution options using radio buttons
-        self.resolutionLayout = QHBoxLayout()
-        self.resolutionGroup = QButtonGroup(self)
-        for ratio in ["1:1", "4:3", "16:9"]:
-            radioButton = QRadioButton(ratio)
-            self.resolutionGroup.addButton(radioButton)
-            self.resolutionLayout.addWidget(radioButton)
-            if ratio == "16:9":
-                radioButton.setChecked(True)  # Default selection
-
-        # Custom resolution option
-        self.customRadioButton = QRadioButton("Custom")  # self 추가
-        self.resolutionGroup.addButton(self.customRadioButton)
-        self.resolutionLayout.addWidget(self.customRadioButton)
-        layout.addLayout(self.resolutionLayout)
-
-        self.customRadioButton.toggled.connect(self.customRatioToggled)  # 여기에 연결
-
-        # Custom resolution inputs
-        self.customResolutionWidget = QWidget()  # 이 위젯을 통해 커스텀 입력 필드를 보여주거나 숨깁니다.
-        self.customResolutionLayout = QHBoxLayout(self.customResolutionWidget)
-        self.widthInput = QLineEdit()
-        self.heightInput = QLineEdit()
-        self.customResolutionLayout.addWidget(QLabel("Width:"))
-        self.customResolutionLayout.addWidget(self.widthInput)
-        self.customResolutionLayout.addWidget(QLabel("Height:"))
-        self.customResolutionLayout.addWidget(self.heightInput)
-        layout.addWidget(self.customResolutionWidget)
-        self.customResolutionWidget.setVisible(False)  # 초기 상태에서 숨김
-
-
-        self.resizeButton = QPushButton('Resize Images')
-        self.resizeButton.clicked.connect(self.resizeImages)
-        layout.addWidget(self.resizeButton)
-
-        self.progressBar = QProgressBar()
-        layout.addWidget(self.progressBar)
-
-        self.statusBar = QStatusBar()
-        self.setStatusBar(self.statusBar)
-
-        self.setStyle()
-
-    def setStyle(self):
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #007AFF; color: white; border-radius: 5px; padding: 10px;
-            }
-            QPushButton:hover {
-                background-color: #357ae8;
-            }
-            QLineEdit {
-                font-size: 14px; padding: 5px; border: 1px solid #cccccc; border-radius: 5px;
-            }
-            QProgressBar {
-                font-size: 14px; padding: 5px; border-radius: 5px; background-color: #f0f0f0; border: 1px solid #cccccc;
-            }
-            QProgressBar::chunk {
-                background-color: #4285f4; border-radius: 5px;
-            }
-        """)
-
-
-    def showEvent(self, event):
-        super().showEvent(event)
-        # Windows 작업 표시줄 진행 상태 표시
-        if QWinTaskbarButton:
-            self.taskbarButton = QWinTaskbarButton(self)
-            self.taskbarButton.setWindow(self.windowHandle())
-            self.taskbarProgress = self.taskbarButton.progress()
-            self.taskbarProgress.show()
-
-    def center(self):
-        qr = self.frameGeometry()
-        cp = QtWidgets.QDesktopWidget().availableGeometry().center()
-        qr.moveCenter(cp)
-        self.move(qr.topLeft())
-
-    def openImages(self):
-        self.dropArea.fileList.clear()
-        filePaths, _ = QFileDialog.getOpenFileNames(self, "Open Images", "", "Image files (*.jpg *.jpeg *.png)")
-        for filePath in filePaths:
-            self.dropArea.fileList.addItem(filePath)
-        if len(filePaths) > 0:
-            self.dropArea.label.hide()
-
-    def ratioChanged(self, index):
-        if self.ratioComboBox.currentText() == "Custom":
-            self.customRatioWidget.show()
-        else:
-            self.customRatioWidget.hide()
-
-    def resizeImages(self):
-        if not self.dropArea.fileList.count():
-            QMessageBox.warning(self, 'Warning', 'No images to resize.')
-            return
-
-        ratio = self.getRatio()
-        if ratio is None:
-            QMessageBox.warning(self, 'Error', 'Invalid custom ratio.')
-            return
-
-        if not self.resizeThread or not self.resizeThread.is_alive():
-            self.resizeThread = threading.Thread(target=self.performResizing, args=(ratio,))
-            self.resizeThread.start()
-
-    def customRatioToggled(self, checked):
-        self.customResolutionWidget.setVisible(checked)  # 커스텀 비율 입력 위젯의 가시성을 변경
-
-    def getRatio(self):
-        if self.customRadioButton.isChecked():  # 여기를 수정
-            try:
-                width = int(self.widthInput.text())
-                height = int(self.heightInput.text())
-                if width <= 0 or height <= 0:
-                    return None
-                return width, height
-            except ValueError:
-                return None
-        else:
-            selectedButton = self.resolutionGroup.checkedButton()
-            if selectedButton:
-                ratioText = selectedButton.text()
-                width, height = map(int, ratioText.split(':'))
-                return width, height
-
-    def performResizing(self, ratio):
-        total_files = self.dropArea.fileList.count()
-        for index in range(total_files):
-            filePath = self.dropArea.fileList.item(index).text()
-            if not self.resizeImage(filePath, ratio):
-                self.statusBar().showMessage("Image size too small for selected ratio.", 5000)
-                continue
-            progress = int((index + 1) / total_files * 100)
-            self.updateProgress.emit(progress)
-        self.showCompleteMessage.emit()
-
-    def resizeImage(self, filePath, ratio):
-            try:
-                img = Image.open(filePath)
-                if img.format == 'GIF':
-                    # Process GIF images
-                    frames = []
-                    durations = []
-                    for frame in ImageSequence.Iterator(img):
-                        frame = frame.convert("RGBA")
-                        new_frame, duration = self.resizeGIFFrame(frame, ratio)
-                        frames.append(new_frame)
-                        durations.append(duration)
-
-                    base, ext = os.path.splitext(filePath)
-                    resized_file_path = f"{base}_resized.gif" 
-                    frames[0].save(resized_file_path, save_all=True, append_images=frames[1:], duration=durations, loop=0, optimize=False)
-                else:
-                    # Process non-GIF images
-                    new_width, new_height = self.calculateNewSize(img.width, img.height, ratio)
-                    resized_img = ImageOps.fit(img, (new_width, new_height), Image.Resampling.LANCZOS)
-                    base, ext = os.path.splitext(filePath)
-                    resized_file_path = f"{base}_resized{ext}"
-                    resized_img.save(resized_file_path)
-                return True
-            except Exception as e:
-                print(f"Error resizing image: {e}")
-                return False
-
-    def resizeGIFFrame(self, frame, ratio):
-        new_width, new_height = self.calculateNewSize(frame.width, frame.height, ratio)
-        frame = ImageOps.fit(frame, (new_width, new_height), Image.Resampling.LANCZOS)
-        duration = frame.info.get('duration', 0)  # Preserve frame duration
-        return frame, duration
-
-
-    def calculateNewSize(self, width, height, ratio):
-        target_width, target_height = ratio
-        aspect_ratio = width / height
-        target_aspect_ratio = target_width / target_height
-
-        if aspect_ratio > target_aspect_ratio:
-            # 원본이 더 넓은 경우
-            new_width = int(height * target_aspect_ratio)
-            new_height = height
-        else:
-            # 원본이 더 높은 경우
-            new_width = width
-            new_height = int(width / target_aspect_ratio)
-
-        return new_width, new_height
-
-    @QtCore.pyqtSlot(int)
-    def updateProgressBar(self, value):
-        self.progressBar.setValue(value)
-        if self.taskbarProgress:
-            self.taskbarProgress.setValue(value)
-            if value == 100:
-                self.taskbarProgress.hide()
-
-    @QtCore.pyqtSlot()
-    def showCompletionMessage(self):
-        self.statusBar.showMessage('All images have been resized and saved.', 5000)
-        if QWinTaskbarButton:
-            self.taskbarProgress.hide()
-
-def main():
-    app = QApplication(sys.argv)
-    ex = ImageResizer()
-    ex.show()
-    sys.exit(app.exec_())
-
-if __name__ == "__main__":
-    main()
+from PyQt5 import QtWidgets, QtCore
+from PyQt5.QtWidgets import (QApplication, QMainWindow, QPushButton, QListView, QFileDialog,
+                              QMessageBox, QVBoxLayout, QWidget, QProgressBar, QLabel, QComboBox,
+                                QLineEdit, QHBoxLayout, QStatusBar, QButtonGroup, QRadioButton, QSpinBox)
+from PyQt5.QtWidgets import QCheckBox
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QIcon, QFont
+import sys
+import os
+import threading
+import multiprocessing
+
+from file_list_model import FileListModel
+from file_utilities_core.encode import KEEP_ICC, KEEP_METADATA, STRIP_METADATA, OutputOptions, available_formats, summarize
+from file_utilities_core.pyramid import DEFAULT_PRESET, load_preset, pyramid_batch
+from file_utilities_core.resize import resize_batch
+from file_utilities_core.resize_cache import ResizeCache
+
+# Windows 작업 표시줄 지원
+try:
+    from PyQt5.QtWinExtras import QWinTaskbarButton, QWinTaskbarProgress
+except ImportError:
+    QWinTaskbarButton = None  # Windows가 아닌 경우 None으로 설정
+
+
+class DropArea(QWidget):
+    def __init__(self, parent=None):
+        super(DropArea, self).__init__(parent)
+        self.setAcceptDrops(True)
+        self.layout = QVBoxLayout(self)
+        self.label = QLabel("↓ Drag and Drop Files Here ↓", self)
+        self.label.setAlignment(QtCore.Qt.AlignCenter)
+        self.label.setFont(QFont('Arial', 14))
+        self.label.setStyleSheet("color: #aaa;")
+        self.layout.addWidget(self.label)
+        self.fileList = FileListModel(parent=self)
+        self.fileView = QListView(self)
+        self.fileView.setUniformItemSizes(True)
+        self.fileView.setModel(self.fileList)
+        self.fileView.setFont(QFont('Arial', 12))
+        self.layout.addWidget(self.fileView)
+        self.setStyleSheet("""
+            DropArea {
+                border: 2px dashed #ccc;
+                border-radius: 10px;
+                background-color: #fafafa;
+            }
+            QListView {
+                border: none;
+            }
+        """)
+
+    def dragEnterEvent(self, event):
+        if event.mimeData().hasUrls():
+            event.acceptProposedAction()
+
+    def dropEvent(self, event):
+        # 기존 목록을 새로 놓은 파일들로 교체
+        self.fileList.setPaths([url.toLocalFile() for url in event.mimeData().urls() if url.isLocalFile()])
+        self.label.hide()
+
+class ImageResizer(QMainWindow):
+    updateProgress = QtCore.pyqtSignal(int)
+    showCompleteMessage = QtCore.pyqtSignal(str)
+
+    def resource_path(self, relative_path):
+        try:
+            base_path = sys._MEIPASS
+        except Exception:
+            base_path = os.path.abspath(".")
+        return os.path.join(base_path, relative_path)
+    
+    def __init__(self):
+        super().__init__()
+        self.taskbarProgress = None
+        self.initUI()
+        self.resizeThread = None
+        self.updateProgress.connect(self.updateProgressBar)
+        self.showCompleteMessage.connect(self.showCompletionMessage)
+
+    def initUI(self):
+        self.setWindowTitle('Image Resizer')
+        self.setGeometry(100, 100, 800, 600)
+        self.center()
+        self.setWindowIcon(QIcon(self.resource_path("image_resizer_icon.png")))
+
+        font = QFont()
+        font.setPointSize(12)
+        QApplication.setFont(font)
+
+        centralWidget = QWidget(self)
+        self.setCentralWidget(centralWidget)
+        layout = QVBoxLayout(centralWidget)
+
+        self.dropArea = DropArea()
+        layout.addWidget(self.dropArea)
+        layout.setStretchFactor(self.dropArea, 3)  # 드래그 앤 드롭 영역의 비중을 늘립니다.
+
+        self.openButton = QPushButton('Open Files')
+        self.openButton.clicked.connect(self.openImages)
+        layout.addWidget(self.openButton)
+
+        # Resolution options using radio buttons
+        self.resolutionLayout = QHBoxLayout()
+        self.resolutionGroup = QButtonGroup(self)
+        for ratio in ["1:1", "4:3", "16:9"]:
+            radioButton = QRadioButton(ratio)
+            self.resolutionGroup.addButton(radioButton)
+            self.resolutionLayout.addWidget(radioButton)
+            if ratio == "16:9":
+                radioButton.setChecked(True)  # Default selection
+
+        # Custom resolution option
+        self.customRadioButton = QRadioButton("Custom")  # self 추가
+        self.resolutionGroup.addButton(self.customRadioButton)
+        self.resolutionLayout.addWidget(self.customRadioButton)
+        layout.addLayout(self.resolutionLayout)
+
+        self.customRadioButton.toggled.connect(self.customRatioToggled)  # 여기에 연결
+
+        # Custom resolution inputs
+        self.customResolutionWidget = QWidget()  # 이 위젯을 통해 커스텀 입력 필드를 보여주거나 숨깁니다.
+        self.customResolutionLayout = QHBoxLayout(self.customResolutionWidget)
+        self.widthInput = QLineEdit()
+        self.heightInput = QLineEdit()
+        self.customResolutionLayout.addWidget(QLabel("Width:"))
+        self.customResolutionLayout.addWidget(self.widthInput)
+        self.customResolutionLayout.addWidget(QLabel("Height:"))
+        self.customResolutionLayout.addWidget(self.heightInput)
+        layout.addWidget(self.customResolutionWidget)
+        self.customResolutionWidget.setVisible(False)  # 초기 상태에서 숨김
+
+        optionsLayout = QHBoxLayout()
+
+        # 결과 이미지의 긴 변 최대 크기 (0 = 원본 크기 유지)
+        optionsLayout.addWidget(QLabel("Max size:"))
+        self.maxSizeSpin = QSpinBox()
+        self.maxSizeSpin.setRange(0, 20000)
+        self.maxSizeSpin.setSingleStep(256)
+        self.maxSizeSpin.setSpecialValueText("Original")
+        self.maxSizeSpin.setSuffix(" px")
+        optionsLayout.addWidget(self.maxSizeSpin)
+
+        # 품질/속도 선택: 체크하면 큰 JPEG을 축소 디코딩
+        self.fastDecodeCheckbox = QCheckBox("Fast decoding (speed over quality)")
+        optionsLayout.addWidget(self.fastDecodeCheckbox)
+
+        # 같은 설정으로 이미 리사이즈한 이미지는 캐시에서 가져온다
+        self.cacheCheckbox = QCheckBox("Skip unchanged images")
+        optionsLayout.addWidget(self.cacheCheckbox)
+
+        # 동시에 리사이즈할 워커 프로세스 수
+        optionsLayout.addWidget(QLabel("Workers:"))
+        self.workersSpin = QSpinBox()
+        self.workersSpin.setRange(1, max(1, os.cpu_count() or 1) * 2)
+        self.workersSpin.setValue(os.cpu_count() or 1)
+        optionsLayout.addWidget(self.workersSpin)
+        optionsLayout.addStretch(1)
+        layout.addLayout(optionsLayout)
+
+        # 한 번 디코딩해서 여러 크기로 저장하는 프리셋 (선택하면 Max size 대신 사용)
+        presetLayout = QHBoxLayout()
+        presetLayout.addWidget(QLabel("Output:"))
+        self.presetComboBox = QComboBox()
+        self.presetComboBox.addItem("Single size", None)
+        self.presetComboBox.addItem("Pyramid (2048/1024/512/256 + square thumb)", DEFAULT_PRESET)
+        self.presetComboBox.addItem("Load preset file...")
+        self.presetComboBox.activated.connect(self.presetActivated)
+        presetLayout.addWidget(self.presetComboBox)
+        presetLayout.addStretch(1)
+        layout.addLayout(presetLayout)
+        self.lastPresetIndex = 0
+
+        # 저장 형식과 인코더 설정
+        encoderLayout = QHBoxLayout()
+        encoderLayout.addWidget(QLabel("Format:"))
+        self.formatComboBox = QComboBox()
+        self.formatComboBox.addItem("Same as source", None)
+        for name in available_formats():
+            self.formatComboBox.addItem(name, name)
+        encoderLayout.addWidget(self.formatComboBox)
+
+        encoderLayout.addWidget(QLabel("Quality:"))
+        self.qualitySpin = QSpinBox()
+        self.qualitySpin.setRange(0, 100)
+        self.qualitySpin.setSpecialValueText("Default")
+        encoderLayout.addWidget(self.qualitySpin)
+
+        encoderLayout.addWidget(QLabel("Chroma:"))
+        self.subsamplingComboBox = QComboBox()
+        self.subsamplingComboBox.addItem("Default", None)
+        for subsampling in ('4:4:4', '4:2:2', '4:2:0'):
+            self.subsamplingComboBox.addItem(subsampling, subsampling)
+        encoderLayout.addWidget(self.subsamplingComboBox)
+        encoderLayout.addStretch(1)
+        layout.addLayout(encoderLayout)
+
+        metadataLayout = QHBoxLayout()
+        self.progressiveCheckbox = QCheckBox("Progressive")
+        metadataLayout.addWidget(self.progressiveCheckbox)
+        self.optimizeCheckbox = QCheckBox("Optimize (smaller, slower)")
+        metadataLayout.addWidget(self.optimizeCheckbox)
+        metadataLayout.addWidget(QLabel("Metadata:"))
+        self.metadataComboBox = QComboBox()
+        self.metadataComboBox.addItem("Keep color profile only", KEEP_ICC)
+        self.metadataComboBox.addItem("Keep all (EXIF, XMP, color profile)", KEEP_METADATA)
+        self.metadataComboBox.addItem("Strip all", STRIP_METADATA)
+        metadataLayout.addWidget(self.metadataComboBox)
+        metadataLayout.addStretch(1)
+        layout.addLayout(metadataLayout)
+
+        self.resizeButton = QPushButton('Resize Images')
+        self.resizeButton.clicked.connect(self.resizeImages)
+        layout.addWidget(self.resizeButton)
+
+        self.progressBar = QProgressBar()
+        layout.addWidget(self.progressBar)
+
+        self.statusBar = QStatusBar()
+        self.setStatusBar(self.statusBar)
+
+        self.setStyle()
+
+    def setStyle(self):
+        self.setStyleSheet("""
+            QPushButton {
+                background-color: #007AFF; color: white; border-radius: 5px; padding: 10px;
+            }
+            QPushButton:hover {
+                background-color: #357ae8;
+            }
+            QLineEdit {
+                font-size: 14px; padding: 5px; border: 1px solid #cccccc; border-radius: 5px;
+            }
+            QProgressBar {
+                font-size: 14px; padding: 5px; border-radius: 5px; background-color: #f0f0f0; border: 1px solid #cccccc;
+            }
+            QProgressBar::chunk {
+                background-color: #4285f4; border-radius: 5px;
+            }
+        """)
+
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Windows 작업 표시줄 진행 상태 표시
+        if QWinTaskbarButton:
+            self.taskbarButton = QWinTaskbarButton(self)
+            self.taskbarButton.setWindow(self.windowHandle())
+            self.taskbarProgress = self.taskbarButton.progress()
+            self.taskbarProgress.show()
+
+    def center(self):
+        qr = self.frameGeometry()
+        cp = QtWidgets.QDesktopWidget().availableGeometry().center()
+        qr.moveCenter(cp)
+        self.move(qr.topLeft())
+
+    def openImages(self):
+        filePaths, _ = QFileDialog.getOpenFileNames(self, "Open Images", "", "Image files (*.jpg *.jpeg *.png)")
+        self.dropArea.fileList.setPaths(filePaths)
+        if len(filePaths) > 0:
+            self.dropArea.label.hide()
+
+    def ratioChanged(self, index):
+        if self.ratioComboBox.currentText() == "Custom":
+            self.customRatioWidget.show()
+        else:
+            self.customRatioWidget.hide()
+
+    def resizeImages(self):
+        if not len(self.dropArea.fileList):
+            QMessageBox.warning(self, 'Warning', 'No images to resize.')
+            return
+
+        ratio = self.getRatio()
+        if ratio is None:
+            QMessageBox.warning(self, 'Error', 'Invalid custom ratio.')
+            return
+
+        if not self.resizeThread or not self.resizeThread.is_alive():
+            # 위젯은 GUI 스레드에서만 읽고 파일 목록을 스레드에 넘긴다
+            filePaths = self.dropArea.fileList.paths()
+            options = {
+                'max_size': self.maxSizeSpin.value() or None,
+                'fast': self.fastDecodeCheckbox.isChecked(),
+                'output': self.outputOptions(),
+            }
+            preset = self.presetComboBox.currentData()
+            useCache = self.cacheCheckbox.isChecked()
+            self.resizeThread = threading.Thread(target=self.performResizing, args=(filePaths, ratio, self.workersSpin.value(), options, preset, useCache), daemon=True)
+            self.resizeThread.start()
+
+    def outputOptions(self):
+        return OutputOptions(self.formatComboBox.currentData(), self.qualitySpin.value() or None,
+                             self.progressiveCheckbox.isChecked(), self.optimizeCheckbox.isChecked(),
+                             self.subsamplingComboBox.currentData(), self.metadataComboBox.currentData())
+
+    def presetActivated(self, index):
+        if index != self.presetComboBox.count() - 1:
+            self.lastPresetIndex = index
+            self.maxSizeSpin.setEnabled(self.presetComboBox.itemData(index) is None)
+            return
+        filePath, _ = QFileDialog.getOpenFileName(self, "Load Preset", "", "Preset files (*.json)")
+        if filePath:
+            try:
+                preset = load_preset(filePath)
+            except (OSError, ValueError) as e:
+                QMessageBox.warning(self, 'Error', f'Invalid preset file: {e}')
+            else:
+                # 파일에서 읽은 프리셋은 "Load preset file..." 바로 앞에 추가
+                self.presetComboBox.insertItem(index, os.path.basename(filePath), preset)
+                self.lastPresetIndex = index
+        self.presetComboBox.setCurrentIndex(self.lastPresetIndex)
+        self.maxSizeSpin.setEnabled(self.presetComboBox.currentData() is None)
+
+    def customRatioToggled(self, checked):
+        self.customResolutionWidget.setVisible(checked)  # 커스텀 비율 입력 위젯의 가시성을 변경
+
+    def getRatio(self):
+        if self.customRadioButton.isChecked():  # 여기를 수정
+            try:
+                width = int(self.widthInput.text())
+                height = int(self.heightInput.text())
+                if width <= 0 or height <= 0:
+                    return None
+                return width, height
+            except ValueError:
+                return None
+        else:
+            selectedButton = self.resolutionGroup.checkedButton()
+            if selectedButton:
+                ratioText = selectedButton.text()
+                width, height = map(int, ratioText.split(':'))
+                return width, height
+
+    def performResizing(self, filePaths, ratio, workers=None, options=None, preset=None, useCache=False):
+        total_files = len(filePaths)
+        failed = 0
+        options = options or {}
+        # 캐시는 이 스레드에서만 쓴다
+        cache = None
+        if useCache:
+            try:
+                cache = ResizeCache()
+            except Exception as e:
+                print(f"Error opening the resize cache: {e}")
+        if preset is not None:
+            results = pyramid_batch(filePaths, ratio, preset, workers, cache, fast=options.get('fast', False),
+                                    output=options.get('output'))
+        else:
+            results = resize_batch(filePaths, ratio, workers, cache, **options)
+        encodedFiles = []
+        try:
+            # 워커 프로세스가 파일 하나를 끝낼 때마다 진행률을 갱신
+            for done, (index, filePath, encoded, error) in enumerate(results, start=1):
+                if error:
+                    print(f"Error resizing image {filePath}: {error}")
+                    failed += 1
+                else:
+                    encodedFiles.extend(encoded if preset is not None else [encoded])
+                progress = int(done / total_files * 100)
+                self.updateProgress.emit(progress)
+        finally:
+            if cache is not None:
+                cache.close()
+        summary = summarize(encodedFiles)
+        if failed:
+            self.showCompleteMessage.emit(f'{total_files - failed} image(s) resized, {failed} failed ({summary}).')
+        else:
+            self.showCompleteMessage.emit(f'All images have been resized and saved ({summary}).')
+
+    @QtCore.pyqtSlot(int)
+    def updateProgressBar(self, value):
+        self.progressBar.setValue(value)
+        if self.taskbarProgress:
+            self.taskbarProgress.setValue(value)
+            if value == 100:
+                self.taskbarProgress.hide()
+
+    @QtCore.pyqtSlot(str)
+    def showCompletionMessage(self, message):
+        self.statusBar.showMessage(message, 5000)
+        if QWinTaskbarButton:
+            self.taskbarProgress.hide()
+
+def main():
+    multiprocessing.freeze_support()
+    app = QApplication(sys.argv)
+    ex = ImageResizer()
+    ex.show()
+    sys.exit(app.exec_())
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+from PIL import Image, ImageChops, ImageDraw, ImageSequence
+
+from file_utilities_core.animated import FramePlan, iter_frames
+
+
+def make_gif(path, spots):
+    # 200x100 캔버스에서 50x50으로 줄이면 가운데 100x100이 크롭 영역이다
+    frames = []
+    for x in spots:
+        frame = Image.new('RGB', (200, 100), (40, 80, 120))
+        ImageDraw.Draw(frame).rectangle((x, 40, x + 1, 60), fill=(250, 250, 250))
+        frames.append(frame)
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=50, loop=0)
+
+
+def reused_and_full(path, size):
+    plan = FramePlan((200, 100), size)
+    with Image.open(path) as img:
+        reused = [(frame.copy(), duration) for frame, duration in iter_frames(img, size)]
+    with Image.open(path) as img:
+        full = [plan.apply(frame) for frame in ImageSequence.Iterator(img)]
+    return reused, full
+
+
+def test_reused_frames_match_full_resize(tmp_path):
+    path = str(tmp_path / 'edge.gif')
+    # 크롭 영역(x 50..150) 바로 바깥: LANCZOS가 읽는 범위라 결과가 바뀐다
+    make_gif(path, [152, 153, 151, 152, 153, 151])
+    reused, full = reused_and_full(path, (50, 50))
+    assert len(reused) == len(full) == 6
+    for (frame, duration), expected in zip(reused, full):
+        assert ImageChops.difference(frame.convert('RGB'), expected.convert('RGB')).getbbox() is None
+
+
+def test_changes_far_outside_are_reused(tmp_path):
+    path = str(tmp_path / 'far.gif')
+    make_gif(path, [5, 10, 15, 20, 25, 30])
+    with Image.open(path) as img:
+        frames = [frame for frame, duration in iter_frames(img, (50, 50))]
+    assert all(frame is frames[0] for frame in frames)
@@ -0,0 +1,13 @@
+import pytest
+
+from file_utilities_core.cli import build_parser
+
+
+def test_max_size_and_preset_are_exclusive(capsys):
+    parser = build_parser()
+    assert parser.parse_args(['resize', '-m', '800', 'a.jpg']).max_size == 800
+    assert parser.parse_args(['resize', '-p', 'default', 'a.jpg']).preset == 'default'
+    with pytest.raises(SystemExit) as exc:
+        parser.parse_args(['resize', '-m', '800', '-p', 'default', 'a.jpg'])
+    assert exc.value.code == 2
+    assert 'not allowed with' in capsys.readouterr().err
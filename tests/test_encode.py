@@ -0,0 +1,32 @@
+from PIL import Image, ImageCms
+
+from file_utilities_core.encode import KEEP_METADATA, STRIP_METADATA, OutputOptions, save_image
+
+METADATA_KEYS = ('icc_profile', 'exif', 'xmp')
+
+
+def test_no_metadata_arguments_without_source_metadata():
+    source = Image.new('RGB', (8, 8))
+    for format in ('JPEG', 'PNG', 'WEBP', 'GIF'):
+        arguments = OutputOptions(metadata=KEEP_METADATA).save_arguments(format, source)
+        assert not set(arguments) & set(METADATA_KEYS)
+
+
+def test_metadata_arguments_follow_the_encoder(tmp_path):
+    icc_profile = ImageCms.ImageCmsProfile(ImageCms.createProfile('sRGB')).tobytes()
+    exif = Image.Exif()
+    exif[0x010F] = 'Camera'
+    Image.new('RGB', (32, 24)).save(tmp_path / 'source.jpg', icc_profile=icc_profile, exif=exif, xmp=b'<x:xmpmeta/>')
+    with Image.open(tmp_path / 'source.jpg') as source:
+        keep = OutputOptions(metadata=KEEP_METADATA)
+        assert set(keep.save_arguments('JPEG', source)) >= set(METADATA_KEYS)
+        # PNG 인코더는 XMP를 받지 않는다
+        assert 'xmp' not in keep.save_arguments('PNG', source)
+        assert not keep.save_arguments('GIF', source)
+
+        # 리사이즈한 이미지의 info에 따라온 ICC 프로필도 PNG에 남지 않아야 한다
+        path = str(tmp_path / 'stripped.png')
+        save_image(source.resize((16, 12)), path, source, OutputOptions(metadata=STRIP_METADATA))
+    with Image.open(path) as output:
+        assert 'icc_profile' not in output.info
+        assert not output.getexif()
@@ -0,0 +1,54 @@
+import os
+
+import pytest
+
+pytest.importorskip('PyQt5')
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from file_list_model import PREVIEW_COLUMN, FileListModel
+from file_utilities_core.natsort import natural_sort_key
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def changed_ranges(model):
+    ranges = []
+    model.dataChanged.connect(lambda top, bottom: ranges.append((top.row(), bottom.row(), top.column())))
+    return ranges
+
+
+def test_add_paths_keeps_natural_order(app):
+    model = FileListModel(sort_key=natural_sort_key)
+    model.addPaths(['img10.jpg', 'img2.jpg'])
+    assert model.addPaths(['img1.jpg', 'img2.jpg', 'img11.jpg']) == 2
+    assert model.paths() == ['img1.jpg', 'img2.jpg', 'img10.jpg', 'img11.jpg']
+
+
+def test_preview_updates_only_changed_rows(app):
+    model = FileListModel(sort_key=natural_sort_key, preview=True)
+    model.setPaths([f'img{i}.jpg' for i in range(10)])
+    ranges = changed_ranges(model)
+
+    model.updatePreview({'img2.jpg': ('a', False), 'img3.jpg': ('b', False), 'img7.jpg': ('c', True)})
+    assert ranges == [(2, 3, PREVIEW_COLUMN), (7, 7, PREVIEW_COLUMN)]
+    assert model.data(model.index(7, PREVIEW_COLUMN)) == 'c'
+
+    ranges.clear()
+    model.updatePreview({'img3.jpg': None})
+    assert ranges == [(3, 3, PREVIEW_COLUMN)]
+    assert model.data(model.index(3, PREVIEW_COLUMN)) is None
+
+    # 행이 바뀐 뒤에도 새 위치의 행만 알린다
+    model.addPaths(['img0a.jpg'])
+    ranges.clear()
+    model.updatePreview({'img7.jpg': ('d', False)})
+    assert ranges == [(8, 8, PREVIEW_COLUMN)]
+
+    ranges.clear()
+    model.clearPreview()
+    assert ranges == [(3, 3, PREVIEW_COLUMN), (8, 8, PREVIEW_COLUMN)]
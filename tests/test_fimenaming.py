@@ -0,0 +1,61 @@
+import os
+import time
+
+import pytest
+
+pytest.importorskip('PyQt5')
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from PyQt5.QtWidgets import QApplication
+
+from file_list_model import PREVIEW_COLUMN
+
+
+@pytest.fixture
+def window(tmp_path, monkeypatch):
+    app = QApplication.instance() or QApplication([])
+    # 이름 변경 기록은 현재 폴더에 생긴다
+    monkeypatch.chdir(tmp_path)
+    import fimenaming
+    window = fimenaming.FileUploader()
+    yield window
+    window.stopPreview()
+    window.deleteLater()
+    app.processEvents()
+
+
+def previews(window):
+    model = window.file_list
+    return [model.data(model.index(row, PREVIEW_COLUMN)) for row in range(model.rowCount())]
+
+
+def wait_for_previews(window, expected, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        QApplication.processEvents()
+        if previews(window) == expected:
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_dropping_the_same_files_again_shows_previews(tmp_path, window):
+    paths = []
+    for name in ('a.txt', 'b.txt', 'c.txt'):
+        (tmp_path / name).write_text(name)
+        paths.append(str(tmp_path / name))
+    expected = ['img01.txt', 'img02.txt', 'img03.txt']
+
+    window.file_list.setPaths(paths)
+    window.keywordEdit.setText('img')
+    assert wait_for_previews(window, expected)
+
+    window.file_list.setPaths(paths)
+    assert previews(window) == [None, None, None]
+    assert wait_for_previews(window, expected)
+
+    # 잘못된 템플릿으로 지운 뒤 같은 템플릿으로 돌아와도 다시 보인다
+    window.keywordEdit.setText('{bad}')
+    assert wait_for_previews(window, [None, None, None])
+    window.keywordEdit.setText('img')
+    assert wait_for_previews(window, expected)
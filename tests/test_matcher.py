@@ -0,0 +1,62 @@
+import random
+
+import pytest
+
+from file_utilities_core.matcher import GLOB, REGEX, SUBSTRING, TOKEN, AhoCorasick, compile_matcher
+
+
+def brute_force_matches(patterns, text):
+    return sorted((start, start + len(pattern)) for pattern in set(patterns)
+                  for start in range(len(text) - len(pattern) + 1) if text.startswith(pattern, start))
+
+
+def test_aho_corasick_finds_every_occurrence():
+    rng = random.Random(1)
+    for _ in range(200):
+        patterns = [''.join(rng.choice('ab') for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 6))]
+        text = ''.join(rng.choice('abc') for _ in range(rng.randint(0, 30)))
+        automaton = AhoCorasick(patterns)
+        # 같은 오토마톤을 두 번 써서 캐시된 전이(delta)도 확인한다
+        for _ in range(2):
+            assert sorted(automaton.iter_matches(text)) == brute_force_matches(patterns, text)
+            assert automaton.search(text) == bool(brute_force_matches(patterns, text))
+
+
+def test_substring_mode():
+    match = compile_matcher(['cat', 'dog'], SUBSTRING)
+    assert match('my_cat.jpg')
+    assert match('hotdog.png')
+    assert not match('Cat.jpg')
+    assert compile_matcher(['cat'], ignore_case=True)('CAT.jpg')
+
+
+def test_token_mode():
+    match = compile_matcher(['cat'], TOKEN)
+    assert match('cat.jpg')
+    assert match('my-cat_2.jpg')
+    assert match('x cat')
+    assert not match('concatenate.txt')
+    assert not match('cats.jpg')
+    # 겹치는 키워드 중 하나만 단어 경계에 맞아도 일치
+    assert compile_matcher(['ab', 'b'], TOKEN)('a-b')
+
+
+def test_glob_and_regex_modes():
+    match = compile_matcher(['*.jpg', 'IMG_00??.*'], GLOB)
+    assert match('photo.jpg')
+    assert match('IMG_0012.png')
+    assert not match('photo.jpg.bak')
+    assert compile_matcher(['*.JPG'], GLOB, ignore_case=True)('photo.jpg')
+
+    match = compile_matcher([r'\d{4}', 'draft'], REGEX)
+    assert match('report_2024.txt')
+    assert match('my draft.doc')
+    assert not match('report.txt')
+
+
+def test_empty_keywords_and_errors():
+    assert not compile_matcher(['', ''])('anything')
+    with pytest.raises(ValueError):
+        compile_matcher(['x'], 'fuzzy')
+    with pytest.raises(ValueError):
+        compile_matcher(['(unclosed'], REGEX)
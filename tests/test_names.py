@@ -0,0 +1,59 @@
+import threading
+
+from file_utilities_core.mover import COPY, process_files
+from file_utilities_core.names import NameIndex
+
+
+def test_reserve_skips_existing_names(tmp_path):
+    for name in ('photo.jpg', 'photo_1.jpg', 'photo_3.jpg'):
+        (tmp_path / name).write_text('')
+    names = NameIndex(str(tmp_path))
+    assert 'photo.jpg' in names
+    assert names.reserve('photo.jpg') == 'photo_2.jpg'
+    assert names.reserve('photo.jpg') == 'photo_4.jpg'
+    assert names.reserve('other.jpg') == 'other.jpg'
+    assert names.reserve('other.jpg') == 'other_1.jpg'
+    # 예약한 이름도 다음 예약과 겹치지 않는다
+    assert names.reserve('photo_2.jpg') == 'photo_2_1.jpg'
+
+
+def test_release_frees_the_name(tmp_path):
+    names = NameIndex(str(tmp_path / 'missing'))
+    assert names.reserve('a.txt') == 'a.txt'
+    names.release('a.txt')
+    assert 'a.txt' not in names
+    assert names.reserve('a.txt') == 'a.txt'
+
+
+def test_concurrent_reservations_are_unique(tmp_path):
+    (tmp_path / 'same.txt').write_text('')
+    names = NameIndex(str(tmp_path))
+    results = []
+    barrier = threading.Barrier(8)
+
+    def reserve_many():
+        barrier.wait()
+        reserved = [names.reserve('same.txt') for _ in range(500)]
+        results.extend(reserved)
+
+    threads = [threading.Thread(target=reserve_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == len(set(results)) == 4000
+    assert 'same.txt' not in results
+    assert set(results) == {f'same_{n}.txt' for n in range(1, 4001)}
+
+
+def test_parallel_copies_get_unique_names(tmp_path):
+    source, target = tmp_path / 'source', tmp_path / 'target'
+    for i in range(50):
+        (source / f'dir{i}').mkdir(parents=True)
+        (source / f'dir{i}' / 'same.txt').write_text(str(i))
+    target.mkdir()
+    (target / 'same.txt').write_text('existing')
+    processed = process_files(str(source), str(target), ['same'], COPY, transfer_workers=4)
+    assert len(processed) == len(set(processed)) == 50
+    contents = {path.read_text() for path in target.iterdir() if path.is_file()}
+    assert contents == {'existing'} | {str(i) for i in range(50)}
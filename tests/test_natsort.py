@@ -0,0 +1,40 @@
+import bisect
+import random
+
+from file_utilities_core.natsort import casefold_sort_key, insertion_points, merge_sorted, natural_sort_key
+
+
+def test_natural_order():
+    names = ['img10.jpg', 'IMG2.jpg', 'img1.jpg', 'img02b.jpg', 'a.txt']
+    assert sorted(names, key=natural_sort_key) == ['a.txt', 'img1.jpg', 'IMG2.jpg', 'img02b.jpg', 'img10.jpg']
+    assert casefold_sort_key('Straße') == casefold_sort_key('STRASSE')
+
+
+def random_names(rng, count):
+    return [f"{rng.choice('abc')}{rng.randint(0, 60)}{rng.choice(['', 'x', '_1'])}.jpg" for _ in range(count)]
+
+
+def test_insertion_points_match_bisect_right():
+    rng = random.Random(3)
+    for _ in range(200):
+        items = sorted(random_names(rng, rng.randint(0, 80)), key=natural_sort_key)
+        new = sorted(random_names(rng, rng.randint(0, 20)), key=natural_sort_key)
+        keys = [natural_sort_key(item) for item in items]
+        # 같은 키가 있으면 그 뒤에 넣는다
+        assert insertion_points(items, new) == [bisect.bisect_right(keys, natural_sort_key(item)) for item in new]
+
+
+def test_merge_sorted_equals_full_sort():
+    rng = random.Random(4)
+    for _ in range(200):
+        items = sorted(random_names(rng, rng.randint(0, 80)), key=natural_sort_key)
+        new = random_names(rng, rng.randint(0, 40))
+        merged = merge_sorted(items, new)
+        assert merged == sorted(items + new, key=natural_sort_key)
+
+
+def test_merge_at_both_ends():
+    items = ['b1', 'b2', 'b3']
+    assert merge_sorted(items, ['c1', 'a1', 'a2']) == ['a1', 'a2', 'b1', 'b2', 'b3', 'c1']
+    assert merge_sorted([], ['x2', 'x10', 'x1']) == ['x1', 'x2', 'x10']
+    assert merge_sorted(items, []) == items
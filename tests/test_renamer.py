@@ -0,0 +1,120 @@
+import os
+
+import pytest
+
+from file_utilities_core import renamer
+from file_utilities_core.renamer import (TEMP_SUFFIX, has_unfinished_renames, plan_renames, recover_renames,
+                                         rename_files, undo_renames)
+
+
+def make_files(folder, names):
+    # 내용에 원래 이름을 적어 두고 나중에 어느 파일이 어디로 갔는지 확인한다
+    for name in names:
+        (folder / name).write_text(name)
+    return [str(folder / name) for name in names]
+
+
+def contents(folder):
+    return {path.name: path.read_text() for path in folder.iterdir() if path.suffix != '.jsonl'}
+
+
+def test_swap_uses_one_temporary_name(tmp_path):
+    paths = make_files(tmp_path, ['x02.txt', 'x01.txt'])
+    new_paths, steps = plan_renames(paths, 'x')
+    assert [os.path.basename(path) for path in new_paths] == ['x01.txt', 'x02.txt']
+    assert len(steps) == 3
+    assert TEMP_SUFFIX in steps[0][1]
+    rename_files(paths, 'x')
+    assert contents(tmp_path) == {'x01.txt': 'x02.txt', 'x02.txt': 'x01.txt'}
+
+
+def test_longer_cycle(tmp_path):
+    paths = make_files(tmp_path, ['x02.txt', 'x03.txt', 'x04.txt', 'x01.txt'])
+    new_paths, steps = plan_renames(paths, 'x')
+    assert len(steps) == 5  # 바뀌는 파일 4개 + 순환 1개
+    rename_files(paths, 'x')
+    assert contents(tmp_path) == {'x01.txt': 'x02.txt', 'x02.txt': 'x03.txt',
+                                  'x03.txt': 'x04.txt', 'x04.txt': 'x01.txt'}
+
+
+def test_chain_into_existing_names_needs_no_temporary_name(tmp_path):
+    paths = make_files(tmp_path, ['y.txt', 'x01.txt', 'x02.txt'])
+    new_paths, steps = plan_renames(paths, 'x')
+    assert len(steps) == 3
+    assert not any(TEMP_SUFFIX in dst for src, dst in steps)
+    rename_files(paths, 'x')
+    assert contents(tmp_path) == {'x01.txt': 'y.txt', 'x02.txt': 'x01.txt', 'x03.txt': 'x02.txt'}
+
+
+def test_names_outside_the_list_are_skipped(tmp_path):
+    make_files(tmp_path, ['x02.txt'])
+    paths = make_files(tmp_path, ['a.txt', 'b.txt', 'x01.txt'])
+    rename_files(paths, 'x')
+    assert contents(tmp_path) == {'x01.txt': 'a.txt', 'x02.txt': 'x02.txt',
+                                  'x03.txt': 'b.txt', 'x04.txt': 'x01.txt'}
+
+
+def test_unchanged_files_are_not_touched(tmp_path):
+    paths = make_files(tmp_path, ['x01.txt', 'x02.txt'])
+    assert plan_renames(paths, 'x')[1] == []
+
+
+def test_undo_after_completion(tmp_path):
+    original = ['x02.txt', 'x03.txt', 'x01.txt', 'y.txt']
+    paths = make_files(tmp_path, original)
+    journal = str(tmp_path / 'journal.jsonl')
+    rename_files(paths, 'x', journal_path=journal)
+    assert not has_unfinished_renames(journal)
+    assert contents(tmp_path) != {name: name for name in original}
+    undo_renames(journal)
+    assert contents(tmp_path) == {name: name for name in original}
+    assert not os.path.exists(journal)
+
+
+def interrupt_after(monkeypatch, count):
+    # os.rename을 count번 실행한 뒤 멈춘다
+    real_rename = os.rename
+    calls = []
+
+    def rename(src, dst):
+        if len(calls) >= count:
+            raise KeyboardInterrupt
+        calls.append((src, dst))
+        real_rename(src, dst)
+    monkeypatch.setattr(renamer.os, 'rename', rename)
+
+
+@pytest.mark.parametrize('drop_progress', [False, True])
+@pytest.mark.parametrize('count', [1, 2, 3])
+def test_interrupted_apply_resume_and_rollback(tmp_path, monkeypatch, count, drop_progress):
+    original = ['x02.txt', 'x03.txt', 'x01.txt', 'y.txt']
+    expected = {'x01.txt': 'x02.txt', 'x02.txt': 'x03.txt', 'x03.txt': 'x01.txt', 'x04.txt': 'y.txt'}
+    for rollback in (False, True):
+        folder = tmp_path / f'rollback-{rollback}'
+        folder.mkdir()
+        paths = make_files(folder, original)
+        journal = str(folder / 'journal.jsonl')
+        with monkeypatch.context() as patch:
+            interrupt_after(patch, count)
+            with pytest.raises(KeyboardInterrupt):
+                rename_files(paths, 'x', journal_path=journal)
+        assert has_unfinished_renames(journal)
+        with pytest.raises(RuntimeError):
+            rename_files(paths, 'x', journal_path=journal)
+        if drop_progress:
+            # 진행 기록이 유실돼도 파일 상태로 판단해야 한다
+            with open(journal) as f:
+                lines = [line for line in f if not line.startswith('["D"')]
+            with open(journal, 'w') as f:
+                f.writelines(lines)
+
+        recover_renames(journal, rollback=rollback)
+        if rollback:
+            assert contents(folder) == {name: name for name in original}
+            assert not os.path.exists(journal)
+        else:
+            assert contents(folder) == expected
+            assert not has_unfinished_renames(journal)
+            # 마저 끝낸 작업도 되돌릴 수 있다
+            undo_renames(journal)
+            assert contents(folder) == {name: name for name in original}
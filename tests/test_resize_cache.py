@@ -0,0 +1,71 @@
+import hashlib
+import os
+
+import pytest
+from PIL import Image
+
+from file_utilities_core.encode import OutputOptions
+from file_utilities_core.resize import resize_batch
+from file_utilities_core.resize_cache import ResizeCache
+
+
+def make_image(path, color):
+    frames = [Image.new('RGB', (120, 80), color), Image.new('RGB', (120, 80), color[::-1])]
+    if path.endswith('.gif'):
+        frames[0].save(path, save_all=True, append_images=frames[1:], duration=100)
+    else:
+        frames[0].save(path)
+
+
+def resize(path, cache_dir):
+    cache = ResizeCache(cache_dir)
+    try:
+        [(index, file_path, encoded, error)] = resize_batch([path], (1, 1), 1, cache)
+    finally:
+        cache.close()
+    assert error is None
+    return encoded
+
+
+def digest(path):
+    with open(path, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()
+
+
+@pytest.mark.parametrize('name', ['photo.jpg', 'photo.gif'])
+def test_overwritten_output_does_not_change_the_cache(tmp_path, name):
+    path = str(tmp_path / name)
+    cache_dir = str(tmp_path / 'cache')
+    make_image(path, (200, 30, 30))
+    first = resize(path, cache_dir)
+    expected = digest(first.path)
+
+    # 다른 원본을 같은 결과 이름으로 다시 리사이즈하면 결과 파일을 덮어쓴다
+    make_image(path, (30, 30, 200))
+    second = resize(path, cache_dir)
+    assert not second.cached and digest(second.path) != expected
+
+    make_image(path, (200, 30, 30))
+    again = resize(path, cache_dir)
+    assert again.cached
+    assert digest(again.path) == expected
+    assert not [name for name in os.listdir(tmp_path) if name.endswith('.fu-writing')]
+
+
+@pytest.mark.parametrize('fmt, expected', [(None, ['a_resized.jpg', 'b_resized.jpeg']),
+                                           ('PNG', ['a_resized.png', 'b_resized.png'])])
+def test_duplicate_with_another_extension(tmp_path, fmt, expected):
+    make_image(str(tmp_path / 'a.jpg'), (200, 30, 30))
+    os.link(tmp_path / 'a.jpg', tmp_path / 'b.jpeg')
+    paths = [str(tmp_path / 'a.jpg'), str(tmp_path / 'b.jpeg')]
+    output = OutputOptions(fmt)
+    for run in range(2):
+        # 한 번에 처리할 때와 다음 실행에서 캐시로 되살릴 때 모두 확인한다
+        cache = ResizeCache(str(tmp_path / 'cache'))
+        try:
+            results = sorted(resize_batch(paths, (1, 1), 1, cache, output=output))
+        finally:
+            cache.close()
+        assert [os.path.basename(encoded.path) for index, file_path, encoded, error in results] == expected
+        assert [encoded.cached for index, file_path, encoded, error in results] == [bool(run), True]
+        assert all(os.path.exists(encoded.path) for index, file_path, encoded, error in results)
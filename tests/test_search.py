@@ -0,0 +1,55 @@
+from file_utilities_core.search import SearchIndex
+
+
+def snippet(id, title, text=''):
+    return {'id': id, 'title': title, 'text': text}
+
+
+def test_ranking():
+    index = SearchIndex([
+        snippet(1, '', 'weekly meeting notes'),
+        snippet(2, 'meeting', 'agenda'),
+        snippet(3, 'meetings', ''),
+        snippet(4, '', 'meetings'),
+        snippet(5, 'meting', ''),
+        snippet(6, 'lunch', ''),
+    ])
+    # 제목 일치 > 본문 일치 = 제목 앞부분 > 본문 앞부분 > 오타, 점수가 같으면 추가한 순서
+    assert index.search('meeting') == [2, 1, 3, 4, 5]
+    assert index.search('MEETING', limit=2) == [2, 1]
+    # 모든 단어가 맞아야 한다
+    assert index.search('meeting agenda') == [2]
+    assert index.search('meeting lunch') == []
+    assert index.search('  ') == []
+
+
+def test_typos():
+    index = SearchIndex([snippet(1, 'meeting'), snippet(2, 'address'), snippet(3, 'cat')])
+    assert index.search('meetng') == [1]    # 한 글자 빠짐
+    assert index.search('meeeting') == [1]  # 한 글자 더 있음
+    assert index.search('meating') == [1]   # 한 글자 바뀜
+    assert index.search('meetnig') == [1]   # 두 글자 순서 바뀜
+    assert index.search('adress') == [2]
+    assert index.search('moating') == []    # 두 글자 바뀜
+    # 앞부분을 치다가 낸 오타도 찾는다
+    assert index.search('adddre') == [2]
+    # 짧은 검색어는 오타를 찾지 않는다
+    assert index.search('ca') == [3]
+    assert index.search('cu') == []
+
+
+def test_update_remove_and_order():
+    index = SearchIndex([snippet(1, 'alpha'), snippet(2, 'alpha'), snippet(3, 'beta')])
+    assert index.search('alpha') == [1, 2]
+    index.set_order([2, 1, 3])
+    assert index.search('alpha') == [2, 1]
+
+    index.update(snippet(2, 'gamma'))
+    assert index.search('alpha') == [1]
+    assert index.search('gamma') == [2]
+    index.remove(1)
+    assert index.search('alpha') == [] and index.search('alpa') == []
+    assert 1 not in index and len(index) == 2
+    index.add(snippet(4, 'alphabet'))
+    assert index.search('alpha') == [4]
+    assert index.search('alphabte') == [4]
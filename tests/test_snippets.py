@@ -0,0 +1,52 @@
+import sqlite3
+
+import pytest
+
+from file_utilities_core.snippets import SnippetStore, SnippetWriter, new_snippet
+
+
+def test_apply_is_one_transaction(tmp_path):
+    store = SnippetStore(str(tmp_path / 'snippets.db'))
+    first, second = new_snippet('first'), new_snippet('second')
+    store.save_many([(first, 0), (second, 1)])
+
+    # 마지막 단계(위치 변경)가 실패하면 앞의 저장과 삭제도 남지 않아야 한다
+    with pytest.raises(sqlite3.IntegrityError):
+        store.apply([(new_snippet('third'), 2)], [first['id']], {second['id']: None})
+    assert [snippet['text'] for snippet in store.load()] == ['first', 'second']
+    store.close()
+
+
+def test_deleted_positions_stay_empty(tmp_path):
+    store = SnippetStore(str(tmp_path / 'snippets.db'))
+    snippets = [new_snippet(text) for text in 'abcd']
+    store.save_many((snippet, position) for position, snippet in enumerate(snippets))
+    store.delete(snippets[1]['id'])
+    assert [snippet['text'] for snippet in store.load()] == ['a', 'c', 'd']
+    assert store.positions() == {snippets[0]['id']: 0, snippets[2]['id']: 2, snippets[3]['id']: 3}
+    store.close()
+
+
+def test_failed_write_is_kept_for_the_next_flush(tmp_path):
+    store = SnippetStore(str(tmp_path / 'snippets.db'))
+    errors = []
+    writer = SnippetWriter(store, delay=60, on_error=errors.append)
+    first, second = new_snippet('first'), new_snippet('second')
+    apply = store.apply
+
+    def failing_apply(*changes):
+        raise sqlite3.OperationalError('database is locked')
+    store.apply = failing_apply
+    writer.save(first, 0)
+    writer.save(second, 1)
+    writer.flush()
+    assert len(errors) == 1
+    assert store.load() == []
+
+    # 실패한 뒤에 바꾼 내용이 되돌려 넣은 예전 내용보다 우선한다
+    store.apply = apply
+    writer.save(dict(second, title='renamed'), 1)
+    writer.flush()
+    assert [(snippet['text'], snippet['title']) for snippet in store.load()] == [('first', ''), ('second', 'renamed')]
+    writer.close()
+    store.close()
@@ -0,0 +1,36 @@
+import datetime
+
+import pytest
+
+from file_utilities_core import template
+from file_utilities_core.template import EXIF, STAT, Template
+
+
+def test_keyword_and_tokens():
+    assert Template('photo').format('dir/a.JPG', 3) == 'photo03.JPG'
+    t = Template('{parent}_{stem}_{n:03}{ext}')
+    assert t.format('/x/trip/a.b.png', 7) == 'trip_a.b_007.png'
+    assert not t.needs
+    t = Template('{mtime:%Y}_{taken}')
+    assert t.needs == {STAT, EXIF}
+    assert t.format('a.jpg', 1, {'mtime': 86400 * 400, 'taken': None}) == '1971_.jpg'
+
+
+def test_invalid_templates():
+    for text in ('{unknown}', '{n:x}', '{stem:5}', '{n!r}', '{n'):
+        with pytest.raises(ValueError):
+            Template(text)
+
+
+def test_date_tokens_validate_on_platforms_without_negative_timestamps(monkeypatch):
+    # Windows에서 UTC보다 서쪽 시간대이면 1970년 이전 현지 시각에서 OSError가 난다
+    class WindowsDatetime(datetime.datetime):
+        @classmethod
+        def fromtimestamp(cls, timestamp, tz=None):
+            if timestamp < 12 * 3600:
+                raise OSError(22, 'Invalid argument')
+            return super().fromtimestamp(timestamp, tz)
+
+    monkeypatch.setattr(template, 'datetime', WindowsDatetime)
+    for token in ('mtime', 'ctime', 'taken'):
+        assert Template(f'{{{token}:%Y-%m-%d}}_{{n}}').format('a.jpg', 1, {token: 86400 * 400}).startswith('1971-')
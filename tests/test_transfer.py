@@ -0,0 +1,45 @@
+import os
+
+import pytest
+
+from file_utilities_core.mover import process_files
+from file_utilities_core.transfer import has_pending_moves, recover_moves
+
+
+def interrupted_move(tmp_path, monkeypatch):
+    # 상대 경로로 이동을 시작하고 첫 파일을 옮긴 뒤 멈춘다
+    work = tmp_path / 'work'
+    (work / 'source' / 'sub').mkdir(parents=True)
+    (work / 'target').mkdir()
+    for name in ('a.txt', 'b.txt'):
+        (work / 'source' / 'sub' / name).write_text(name)
+    monkeypatch.chdir(work)
+
+    def stop(stats, file_name):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        process_files('source', 'target', ['.txt'], progress=stop)
+    assert has_pending_moves('target')
+    # 다른 작업 폴더에서 복구한다
+    elsewhere = tmp_path / 'elsewhere'
+    elsewhere.mkdir()
+    monkeypatch.chdir(elsewhere)
+    return work
+
+
+def test_rollback_from_another_directory(tmp_path, monkeypatch):
+    work = interrupted_move(tmp_path, monkeypatch)
+    assert recover_moves(str(work / 'target'), rollback=True) == 1
+    assert sorted(os.listdir(work / 'source' / 'sub')) == ['a.txt', 'b.txt']
+    assert os.listdir(work / 'target') == ['sub']
+    assert not has_pending_moves(str(work / 'target'))
+    assert not os.listdir(tmp_path / 'elsewhere')
+
+
+def test_resume_from_another_directory(tmp_path, monkeypatch):
+    work = interrupted_move(tmp_path, monkeypatch)
+    assert recover_moves(str(work / 'target'), rollback=False) == 1
+    assert os.listdir(work / 'source' / 'sub') == []
+    assert sorted(name for name in os.listdir(work / 'target') if name.endswith('.txt')) == ['a.txt', 'b.txt']
+    assert not os.listdir(tmp_path / 'elsewhere')